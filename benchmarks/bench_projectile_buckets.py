@@ -0,0 +1,104 @@
+"""
+Benchmark: per-bucket cost of the FastProjectileSystem update.
+
+Fills one behaviour bucket at a time with projectiles over the open floor
+of a level and times ``update`` per frame, once through the bucket's own
+kernel and once with the same projectiles forced into the 'mixed' bucket,
+which runs the full modifier chain every projectile used to go through.
+The projectile store is switched off so plain projectiles stay objects.
+
+Usage:
+    python benchmarks/bench_projectile_buckets.py [level_path] [projectiles]
+"""
+
+import json
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+
+from scripts.components.combat import HurtBoxComponent
+from scripts.components.physics import Position
+from scripts.systems.combat.fast_projectile_system import FastProjectileSystem
+from scripts.systems.core.collision_grid import TileGrid, WALL_TILE
+from scripts.systems.core.event_manager import EventManager
+
+FRAMES = 30
+REPEATS = 3  # best of, the frame times are noisy
+SIZE = 10
+TARGET = 1  # hurtbox entity the homing projectiles chase
+MODIFIERS = {
+    'plain': {},
+    'homing': {'homing_strength': 0.05, 'homing_target_id': TARGET},
+    'wave': {'wave_amplitude': 30.0, 'wave_frequency': 6.0},
+    'split': {'split_on_death': True, 'split_count': 3, 'split_speed': 4.0},
+    'orbit': {'orbit_radius': 80.0, 'orbit_speed': 2.0},
+    'delayed': {'delay': 60.0},
+}
+
+
+def run(grid, bucket, count, forced_mixed):
+    rng = random.Random(count)
+    ts = grid.tile_size
+    min_x, min_y = grid.origin_x * ts, grid.origin_y * ts
+    max_x, max_y = min_x + grid.width * ts, min_y + grid.height * ts
+    event_manager = EventManager()
+    system = FastProjectileSystem(event_manager, capacity=count * 4)
+    system.store = None
+    hurtboxes, positions = {}, {}
+    for eid in range(20):
+        hurtboxes[eid] = HurtBoxComponent(eid, (0, 0), (24, 24), None, 2)
+        positions[eid] = Position(eid, rng.uniform(min_x, max_x), rng.uniform(min_y, max_y))
+    center = pygame.Vector2((min_x + max_x) / 2, (min_y + max_y) / 2)
+
+    def fill():
+        while system.active_count < count:
+            x, y = rng.uniform(min_x, max_x), rng.uniform(min_y, max_y)
+            if grid.overlap_flags(x - SIZE / 2, y - SIZE / 2, SIZE, SIZE) & WALL_TILE: continue
+            angle, speed = rng.uniform(0, math.tau), rng.uniform(2, 8)
+            modifiers = dict(MODIFIERS[bucket], orbit_center_x=x, orbit_center_y=y)
+            system.spawn(-1, x, y, math.cos(angle) * speed, math.sin(angle) * speed, speed, 5, [], 0, 0,
+                         rng.uniform(2.0, 6.0), SIZE, 1, 2, None, SIZE * 0.7, 10.0, (0, 153, 219), 0,
+                         modifiers=modifiers)
+        if forced_mixed:
+            mixed = system.buckets['mixed']
+            for name, indices in system.buckets.items():
+                if name != 'mixed':
+                    mixed.extend(indices)
+                    indices.clear()
+
+    spent = 0.0
+    for _ in range(FRAMES):
+        fill()
+        start = time.perf_counter()
+        system.update(1 / 60, 60, grid, None, hurtboxes, positions, {}, None, False, -1, center)
+        spent += time.perf_counter() - start
+        event_manager.dispatch_queued()
+    return spent * 1000.0 / FRAMES
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(ROOT, "data", "levels", "5.json")
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    with open(path) as f:
+        layers = json.load(f)["layers"]
+    grid = TileGrid.from_layers(layers, ("wall", "water"))
+
+    print(f"[BENCH] {os.path.basename(path)}: {count} projectiles per bucket, update ms per frame")
+    print(f"{'bucket':>8} {'full chain ms':>14} {'kernel ms':>10} {'speedup':>8} {'us/proj':>8}")
+    for bucket in MODIFIERS:
+        chain_ms = min(run(grid, bucket, count, True) for _ in range(REPEATS))
+        kernel_ms = min(run(grid, bucket, count, False) for _ in range(REPEATS))
+        print(f"{bucket:>8} {chain_ms:>14.2f} {kernel_ms:>10.2f} {chain_ms / kernel_ms:>7.1f}x"
+              f" {kernel_ms * 1000.0 / count:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
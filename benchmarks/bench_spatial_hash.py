@@ -0,0 +1,143 @@
+"""
+Benchmark: per-frame dynamic Quadtree rebuild vs persistent SpatialHash.
+
+Simulates what GameScene / PhysicsEngine do each frame with N moving
+colliders: build the broadphase, then query once per collider and drop
+duplicate candidates. The quadtree is cleared and refilled with new Rects
+(old ``_build_dynamic_quadtree``); the hash moves its entries in place.
+
+The second table filters for solid colliders only: once by looking each
+candidate up in a component dict (old consumers), once with a
+``CollisionClass`` mask inside the hash.
+
+Usage:
+    python benchmarks/bench_spatial_hash.py [frames]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from scripts.utils import Quadtree, VIRTUAL_WINDOW_SIZE, CollisionClass
+from scripts.utils.spatial_hash import SpatialHash
+
+WORLD_W, WORLD_H = 2000, 2000
+COUNTS = (50, 200, 1000)
+
+
+def make_bodies(count, rng):
+    bodies = []
+    for i in range(count):
+        size = rng.choice((12, 16, 24, 32))
+        bodies.append([i, rng.uniform(0, WORLD_W), rng.uniform(0, WORLD_H),
+                       rng.uniform(-2, 2), rng.uniform(-2, 2), size])
+    return bodies
+
+
+def step(bodies):
+    for body in bodies:
+        body[1] = (body[1] + body[3]) % WORLD_W
+        body[2] = (body[2] + body[4]) % WORLD_H
+
+
+def run_quadtree(bodies, frames):
+    tree = Quadtree(0, (0, 0, *VIRTUAL_WINDOW_SIZE))
+    query = pygame.FRect(0, 0, 0, 0)
+    candidates = []
+    found = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        step(bodies)
+        tree.clear()
+        for key, x, y, _, _, size in bodies:
+            tree.insert(key, pygame.Rect(x, y, size, size))
+        for key, x, y, _, _, size in bodies:
+            query.update(x - 4, y - 4, size + 8, size + 8)
+            candidates.clear()
+            tree.retrieve(candidates, query)
+            seen = set()
+            for other, rect in candidates:
+                if other in seen: continue
+                seen.add(other)
+                if query.colliderect(rect): found += 1
+    return (time.perf_counter() - start) * 1000.0 / frames, found
+
+
+def run_hash(bodies, frames):
+    grid = SpatialHash()
+    query = pygame.FRect(0, 0, 0, 0)
+    candidates = []
+    found = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        step(bodies)
+        update = grid.update
+        for key, x, y, _, _, size in bodies:
+            update(key, x, y, size, size)
+        for key, x, y, _, _, size in bodies:
+            query.update(x - 4, y - 4, size + 8, size + 8)
+            candidates.clear()
+            grid.retrieve(candidates, query)
+            for other, rect in candidates:
+                if query.colliderect(rect): found += 1
+    return (time.perf_counter() - start) * 1000.0 / frames, found
+
+
+class _Collider:
+    __slots__ = ('solid',)
+
+    def __init__(self, solid):
+        self.solid = solid
+
+
+def run_filtered(bodies, frames, masked):
+    solid_mask = int(CollisionClass.SOLID)
+    grid = SpatialHash()
+    components = {key: _Collider(key % 4 == 0) for key, *_ in bodies}  # a quarter are solid
+    for key, x, y, _, _, size in bodies:
+        grid.update(key, x, y, size, size, solid_mask if components[key].solid else int(CollisionClass.BODY))
+    query = pygame.FRect(0, 0, 0, 0)
+    candidates = []
+    found = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        for key, x, y, _, _, size in bodies:
+            query.update(x - 4, y - 4, size + 8, size + 8)
+            candidates.clear()
+            if masked:
+                grid.retrieve(candidates, query, solid_mask)
+                for other, rect in candidates:
+                    if query.colliderect(rect): found += 1
+            else:
+                grid.retrieve(candidates, query)
+                for other, rect in candidates:
+                    comp = components.get(other)
+                    if comp and comp.solid and query.colliderect(rect): found += 1
+    return (time.perf_counter() - start) * 1000.0 / frames, found
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    print(f"[BENCH] {frames} frames, world {WORLD_W}x{WORLD_H}, query per collider")
+    print(f"{'colliders':>10} {'quadtree ms':>12} {'hash ms':>10} {'speedup':>8} {'overlaps':>10}")
+    for count in COUNTS:
+        tree_ms, tree_found = run_quadtree(make_bodies(count, random.Random(count)), frames)
+        hash_ms, hash_found = run_hash(make_bodies(count, random.Random(count)), frames)
+        same = 'ok' if tree_found == hash_found else f'{tree_found} != {hash_found}'
+        print(f"{count:>10} {tree_ms:>12.3f} {hash_ms:>10.3f} {tree_ms / hash_ms:>7.1f}x {same:>10}")
+
+    print(f"\n{'colliders':>10} {'dict ms':>12} {'mask ms':>10} {'speedup':>8} {'solid hits':>10}")
+    for count in COUNTS:
+        dict_ms, dict_found = run_filtered(make_bodies(count, random.Random(count)), frames, False)
+        mask_ms, mask_found = run_filtered(make_bodies(count, random.Random(count)), frames, True)
+        same = 'ok' if dict_found == mask_found else f'{dict_found} != {mask_found}'
+        print(f"{count:>10} {dict_ms:>12.3f} {mask_ms:>10.3f} {dict_ms / mask_ms:>7.1f}x {same:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,8 @@
 from ..utils import EnemyState
 
 class AIComponent:
+    __slots__ = ('entity_id', 'behavior', 'state', 'timer', 'data', 'sees_player')
+
     def __init__(self, entity_id, behavior, data={
         "speed": 2,
         "attack_dist": 150
@@ -9,5 +11,6 @@ class AIComponent:
         self.behavior = behavior
         self.state = EnemyState.IDLE
         self.timer = 0
+        self.sees_player = True  # line of sight to the player, refreshed by AISystem
 
         self.data = data
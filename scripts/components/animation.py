@@ -2,6 +2,8 @@ import pygame
 from ..utils import normalize_scale
 
 class RenderComponent:
+    __slots__ = ('entity_id', 'original_surface', 'surface', 'offset', 'image_file')
+
     def __init__(self, entity_id, surface=None, offset=(0,0), center=False, image_file=None):
         self.entity_id = entity_id
         self.original_surface = self.surface = surface
@@ -30,6 +32,9 @@ class RenderComponent:
         self.surface = pygame.transform.scale(self.original_surface, new_size)
 
 class AnimationComponent:
+    __slots__ = ('animation_handler', 'event_manager', 'entity_id', 'entity_name', 'entity_type',
+                 'offset', 'center', 'animation_id', 'animation')
+
     def __init__(self, entity_id, entity, animation_id, animation_handler, event_manager, offset=(0,0), center=False, entity_type=None):
         self.animation_handler = animation_handler
         self.event_manager = event_manager
@@ -3,9 +3,12 @@ import pygame
 from scripts.ecs.component_manager import ComponentManager
 from scripts.systems.core.event_manager import EventManager
 from ..utils import GameSceneEvents
+from ..utils.events import DamageEvent
 from ..systems.animation.animation_state_machine import AnimationStateMachine
 
 class WeaponComponent:
+    __slots__ = ('cooldown', 'shoot_fn', 'projectile_data', 'time', 'shot', 'disabled')
+
     def __init__(self, cooldown, shoot_fn, projectile_data):
         self.cooldown = cooldown
         self.shoot_fn = shoot_fn
@@ -20,6 +23,8 @@ class WeaponComponent:
         return not self.shot
 
 class HitBoxComponent:
+    __slots__ = ('entity_id', 'offset', 'size', 'shape', 'layer', 'mask', 'disabled')
+
     def __init__(self, entity_id, offset, size, shape, layer: int, mask: int, center=True):
         self.entity_id = entity_id
         self.offset = pygame.Vector2(offset)
@@ -33,6 +38,8 @@ class HitBoxComponent:
             self.offset -= pygame.Vector2(size) / 2
 
 class HurtBoxComponent:
+    __slots__ = ('entity_id', 'offset', 'size', 'shape', 'layer', 'disabled')
+
     def __init__(self, entity_id, offset, size, shape, layer: int, center=True):
         self.entity_id = entity_id
         self.offset = pygame.Vector2(offset)
@@ -45,7 +52,9 @@ class HurtBoxComponent:
             self.offset -= pygame.Vector2(size) / 2
 
 class HealthComponent:
+    __slots__ = ('entity_id', 'health', 'max_health', 'invincibility_timer', 'event_manager', 'component_manager', 'effects')
     iframetimer = 1/6
+
     def __init__(self, entity_id, max_health, event_manager: EventManager, component_manager: ComponentManager):
         self.entity_id = entity_id
         self.health = self.max_health = max_health
@@ -55,18 +64,18 @@ class HealthComponent:
 
         self.effects = []
 
-        event_manager.subscribe(GameSceneEvents.DAMAGE, self.take_damage, source=self.entity_id)
+        event_manager.subscribe_for(self.entity_id, DamageEvent, self.take_damage)
 
-    def take_damage(self, entity_id, proj_id, damage, effects, **kwargs):
-        if entity_id != self.entity_id:
+    def take_damage(self, event: DamageEvent):
+        if event.entity_id != self.entity_id:
             return
         
         if self.invincibility_timer > 0:
             # Still invincible, ignore damage
             return
         
-        self.health -= damage
-        self.effects = effects
+        self.health -= event.damage
+        self.effects = event.effects
 
         # if self.entity_id == 0: # TEMP: Assuming entity_id 0 is the player
         #     print(f"[HEALTH COMPONENT] Player took {damage} damage, health now: {self.health}")
@@ -79,9 +88,31 @@ class HealthComponent:
         if self.health <= 0:
             self.health = 0
             # Trigger death logic here, e.g., event_manager.publish("entity_died", self.entity_id)
-            self.event_manager.emit(GameSceneEvents.DEATH, entity_id=self.entity_id, proj_vel=kwargs.get('proj_vel'), proj_pos=kwargs.get('proj_pos'), death=True)
-        
+            # The damage event is pooled; DEATH listeners get their own vectors
+            self.event_manager.emit(GameSceneEvents.DEATH, entity_id=self.entity_id, proj_vel=event.proj_vel.copy(), proj_pos=event.proj_pos.copy(), death=True)
+
+def merge_damage(component_manager, queued, new):
+    """Fold a queued ``DamageEvent`` into the one already queued for its target.
+
+    A target with an invincibility window only takes the first hit of a
+    dispatch (``take_damage`` ignores the rest), so its first damage and
+    effects are kept; other targets get the damage summed. The latest hit's
+    projectile data is kept for knockback/VFX.
+    """
+    health = component_manager.get(queued.entity_id, HealthComponent)
+    if health is None or health.iframetimer <= 0:
+        queued.damage += new.damage
+        queued.effects = new.effects
+    # Vectors are copied in place: ``new`` goes back to the pool after this
+    queued.proj_id = new.proj_id
+    queued.proj_vel.update(new.proj_vel)
+    queued.proj_pos.update(new.proj_pos)
+    queued.death = queued.death or new.death
+
 class AttackPattern:
+    __slots__ = ('shoot_fn', 'projectile_data', 'cooldown', 'duration', 'warmup', 'tier', 'tier_cooldown',
+                 'shoot_timer', 'phase_timer', 'warmed', '_last_used', 'shot_data')
+
     def __init__(self, shoot_fn, projectile_data, cooldown, duration, warmup=0.0, tier="light", tier_cooldown=0.0):
         self.shoot_fn = shoot_fn
         self.projectile_data = projectile_data
@@ -94,8 +125,11 @@ class AttackPattern:
         self.phase_timer = 0
         self.warmed = False           # becomes True after warmup elapses
         self._last_used = -999.0      # time when this pattern was last used
+        self.shot_data = None         # projectile_data plus compiled template, built on first shot
 
 class AttackPatternComponent:
+    __slots__ = ('patterns', 'current_index', 'loop', 'active', 'disabled', '_last_attack_tier', '_consecutive_light')
+
     def __init__(self, patterns: list[AttackPattern], loop=True):
         self.patterns = patterns
         self.current_index = 0
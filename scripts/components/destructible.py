@@ -20,6 +20,8 @@ class Shard:
         self.h = h
 
 class DestructibleComponent:
+    __slots__ = ('shattered', 'shards', 'texture', 'shatter_timer', 'total_duration')
+
     def __init__(self, texture):
         self.shattered = False
         self.shards = []
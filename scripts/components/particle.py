@@ -2,7 +2,7 @@ import pygame, random, math
 from dataclasses import dataclass, field
 from ..utils import EmitterShape, EmitterShapeType, rotate_vector
 
-@dataclass
+@dataclass(slots=True)
 class ParticleConfig:
     vel: float = 4.0
     lifetime: float = 2.0
@@ -23,7 +23,7 @@ class ParticleConfig:
     gravity: float = 0.0             # Constant downward force
     wind_factor: float = 0.0         # How much the global wind affects horizontal speed
 
-@dataclass
+@dataclass(slots=True)
 class ParticleEmitter:
     rate: float
     duration: float
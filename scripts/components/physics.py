@@ -1,18 +1,51 @@
 import pygame
 
 class Vector2Component:
+    __slots__ = ('entity_id', '_vec', '_store', '_row', '_col')
+
     def __init__(self, entity_id, x=0, y=0):
         self.entity_id = entity_id
         self._vec = pygame.Vector2(x, y)
+
+        # Set while bound to a TransformStore row: x/y then live in store.data[row, col:col+2]
+        self._store = None
+        self._row = -1
+        self._col = 0
+
+    def _bind(self, store, row, col):
+        self._store = store
+        self._row = row
+        self._col = col
+
+    def _unbind(self):
+        store = self._store
+        if store is not None:
+            self._vec.update(store.data.item(self._row, self._col), store.data.item(self._row, self._col + 1))
+            self._store = None
+            self._row = -1
+
+    def _write(self, x, y):
+        if self._store is None:
+            self._vec.update(x, y)
+        else:
+            data = self._store.data
+            data[self._row, self._col] = x
+            data[self._row, self._col + 1] = y
     
     def __iadd__(self, other) -> "Vector2Component": # for vec += other
         # handling pygame.Vector2, tuple, list, and Vector2Component
-        if isinstance(other, pygame.Vector2):
+        if self._store is not None:
+            if isinstance(other, Vector2Component):
+                ox, oy = other.x, other.y
+            else:
+                ox, oy = other[0], other[1]
+            self._write(self.x + ox, self.y + oy)
+        elif isinstance(other, pygame.Vector2):
             self._vec += other
         elif isinstance(other, (tuple, list)):
             self._vec += pygame.Vector2(*other)
         elif isinstance(other, Vector2Component):
-            self._vec += other._vec 
+            self._vec += other.vec
         
         self._clamp()
 
@@ -20,53 +53,75 @@ class Vector2Component:
 
     def __sub__(self, other):
         if isinstance(other, pygame.Vector2):
-            return self._vec - other
+            return self.vec - other
         elif isinstance(other, (tuple, list)):
-            return self._vec - pygame.Vector2(*other)
+            return self.vec - pygame.Vector2(*other)
         elif isinstance(other, Vector2Component):
-            return self._vec - other._vec
+            return self.vec - other.vec
         
         raise TypeError(f"[{self.__class__.__name__}] Unsupported type for subtraction: '{type(other)}' (DEBUG)")
 
     def __mul__(self, scalar): # for vec * scalar
-        return self._vec * scalar
+        return self.vec * scalar
     
     def __rmul__(self, scalar): # for scalar * vec
-        return self._vec * scalar
+        return self.vec * scalar
     
     def __repr__(self):
-        return f"{self.__class__.__name__}: (x={self._vec.x}, y={self._vec.y})"
+        return f"{self.__class__.__name__}: (x={self.x}, y={self.y})"
     
     @property
     def x(self):
-        return self._vec.x
+        if self._store is None:
+            return self._vec.x
+        return self._store.data.item(self._row, self._col)
 
     @property
     def y(self):
-        return self._vec.y
+        if self._store is None:
+            return self._vec.y
+        return self._store.data.item(self._row, self._col + 1)
     
     @x.setter
     def x(self, value):
-        self._vec.x = value
+        if self._store is None:
+            self._vec.x = value
+        else:
+            self._store.data[self._row, self._col] = value
         self._clamp()
 
     @y.setter
     def y(self, value):
-        self._vec.y = value
+        if self._store is None:
+            self._vec.y = value
+        else:
+            self._store.data[self._row, self._col + 1] = value
         self._clamp()
     
     @property
     def vec(self):
-        return self._vec
+        # While bound to a TransformStore this is a snapshot; write through the setters
+        if self._store is None:
+            return self._vec
+        return pygame.Vector2(self._store.data[self._row, self._col:self._col + 2])
 
     @vec.setter
     def vec(self, value):
         if isinstance(value, pygame.Vector2):
-            self._vec = value
+            if self._store is None:
+                self._vec = value
+            else:
+                self._write(value.x, value.y)
         elif isinstance(value, (tuple, list)):
-            self._vec = pygame.Vector2(*value)
+            if self._store is None:
+                self._vec = pygame.Vector2(*value)
+            else:
+                self._write(value[0], value[1])
         elif isinstance(value, Vector2Component):
-            self._vec = value._vec
+            if self._store is None:
+                self._vec = value._vec if value._store is None else value.vec
+            else:
+                self._write(value.x, value.y)
         
         self._clamp()
     
@@ -76,16 +131,22 @@ class Vector2Component:
 
 
 class Position(Vector2Component):
+    __slots__ = ()
+
     def __init__(self, entity_id, x=0, y=0):
         super().__init__(entity_id, x, y)
 
 class Velocity(Vector2Component):
+    __slots__ = ('speed', 'realistic_vel')
+
     def __init__(self, entity_id, x=0, y=0, speed=5):
         super().__init__(entity_id, x, y)
         self.speed = speed
         self.realistic_vel = self.vec.copy()
 
 class CollisionComponent:
+    __slots__ = ('entity_id', 'offset', 'size', 'solid', 'blocks_projectiles')
+
     def __init__(self, entity_id, offset, size, solid=False, center=False, blocks_projectiles=True):
         self.entity_id = entity_id
         self.offset = pygame.Vector2(offset)
@@ -97,6 +158,8 @@ class CollisionComponent:
             self.offset -= self.size / 2
 
 class KnockbackComponent:
+    __slots__ = ('vx', 'vy', 'vz', 'duration', 'gravity', 'z')
+
     def __init__(self, vec: pygame.Vector2, force: int, duration: int=0.3, up_force: float=0.0, gravity: float=0.0):
         self.vx = vec.x * force
         self.vy = vec.y * force
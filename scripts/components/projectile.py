@@ -1,4 +1,6 @@
 class ProjectileComponent:
+    __slots__ = ('source_entity', 'damage', 'effects', 'lifetime', 'hits', 'data')
+
     def __init__(self, source_entity, damage=10, effects=[], lifetime=2.0, bounce=2, penetration=0):
         # self.entity_id = entity_id
         self.source_entity = source_entity
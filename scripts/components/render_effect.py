@@ -4,6 +4,8 @@ from typing import Tuple
 from ..components.tags import PlayerTagComponent, EnemyTagComponent
 
 class RenderEffectComponent:
+    __slots__ = ('scale', 'alpha', 'tint', 'blink', 'rotation', 'z_offset', 'effect_timers', 'effect_data', 'disabled')
+
     def __init__(self):
         self.scale = pygame.Vector2(1, 1) # for squash/stretch
         self.alpha = None                 # for transparency
@@ -15,12 +17,14 @@ class RenderEffectComponent:
         self.effect_data = {}             # active data {'squash': {'start_scale': [x, y], 'target_scale': [x2, y2], 'duration': ,return_back: bool}}
         self.disabled = False
     
-@dataclass
+@dataclass(slots=True)
 class YSortRender:
     entity_id: int
     offset: Tuple[int, int] = (0, 0)  # Y-sorting pivot offset (usually toward character's feet)
 
 class ShadowComponent:
+    __slots__ = ('entity_id', 'surface', 'offset', 'alpha', 'center')
+
     def __init__(self, entity_id, surface, offset=(0, 0), alpha=128, center=False):
         self.entity_id: int = entity_id
         self.surface: pygame.Surface = surface  # Shadow surface
@@ -33,6 +37,8 @@ class ShadowComponent:
                            self.offset[1] - (surface.get_height() // 2))
     
 class ProximityFadeComponent:
+    __slots__ = ('targets', 'min_dist_squared', 'max_dist_squared', 'alpha_range', 'current_alpha')
+
     def __init__(self, targets, min_dist_squared, max_dist_squared, alpha_range=(0, 255)):
         self.targets = targets
         self.min_dist_squared = min_dist_squared
@@ -45,6 +51,8 @@ class ProximityFadeComponent:
 
 
 class PulseComponent:
+    __slots__ = ('radius', 'speed', 'color', 'alpha', 'time')
+
     def __init__(self, radius, speed, color, alpha=150):
         self.radius = radius
         self.speed = speed
@@ -54,4 +62,4 @@ class PulseComponent:
 
 class WindAffectedComponent:
     """Tag component. Add to any entity that should sway with wind (foliage, grass, etc.)"""
-    pass
+    __slots__ = ()
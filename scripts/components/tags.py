@@ -1,5 +1,9 @@
 class PlayerTagComponent:
-    pass
+    __slots__ = ()
 
 class EnemyTagComponent:
-    pass
\ No newline at end of file
+    __slots__ = ()
+
+class SuspendedTagComponent:
+    # Entity is in a map region far from the camera; simulation systems skip its archetype
+    __slots__ = ()
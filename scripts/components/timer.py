@@ -1,4 +1,6 @@
 class TimerComponent:
+    __slots__ = ('duration', 'callbacks', 'destroy')
+
     def __init__(self, duration, *callbacks, destroy=True):
         self.duration = duration
         self.callbacks = [callback for callback in callbacks]
@@ -0,0 +1,36 @@
+class CommandBuffer:
+    """Records structural ECS changes (add / remove / destroy) for later playback.
+
+    Systems record changes while iterating queries or archetype tables and the
+    scene applies them in one batch at its sync points, so iteration never
+    sees entities move between tables underneath it.
+    """
+    ADD = 0
+    REMOVE = 1
+    DESTROY = 2
+
+    __slots__ = ('_commands',)
+
+    def __init__(self):
+        self._commands = [] # [(op, entity_id, payload)]
+
+    def __len__(self):
+        return len(self._commands)
+
+    def add(self, entity_id, *components):
+        self._commands.append((self.ADD, entity_id, components))
+
+    def remove(self, entity_id, component_type):
+        self._commands.append((self.REMOVE, entity_id, component_type))
+
+    def destroy(self, entity_id):
+        self._commands.append((self.DESTROY, entity_id, None))
+
+    def drain(self):
+        """Return the recorded commands in order and start a fresh list."""
+        commands = self._commands
+        self._commands = []
+        return commands
+
+    def clear(self):
+        self._commands.clear()
@@ -1,15 +1,268 @@
+import sys
 from collections import defaultdict
 
+import pygame
+
+from .command_buffer import CommandBuffer
+from .sparse_set import SparseSet
+from .transform_store import TransformStore
+from ..components.physics import Position, Velocity
+
+class Archetype:
+    """Table of every entity that owns exactly the same set of component types.
+
+    Rows are packed: ``entities[row]`` owns ``columns[T][row]`` for every type
+    ``T`` in the archetype. Removing a row swaps the last row into the hole so
+    a column never contains gaps and can be iterated directly.
+    """
+    __slots__ = ('types', 'mask', 'entities', 'columns', 'rows', 'add_edges', 'remove_edges')
+
+    def __init__(self, types, mask):
+        self.types = types              # frozenset of component types
+        self.mask = mask                # OR of the component type bits
+        self.entities = []              # [entity_id] indexed by row
+        self.columns = {ct: [] for ct in types} # {component_type: [component_instance]}
+        self.rows = {}                  # {entity_id: row}
+
+        # Cached archetype graph edges: {component_type: Archetype}
+        self.add_edges = {}
+        self.remove_edges = {}
+
+    def __len__(self):
+        return len(self.entities)
+
+    def append(self, entity_id, components):
+        self.rows[entity_id] = len(self.entities)
+        self.entities.append(entity_id)
+        for ct, column in self.columns.items():
+            column.append(components[ct][entity_id])
+
+    def remove(self, entity_id):
+        row = self.rows.pop(entity_id)
+        last = len(self.entities) - 1
+        if row != last:
+            moved = self.entities[last]
+            self.entities[row] = moved
+            self.rows[moved] = row
+            for column in self.columns.values():
+                column[row] = column[last]
+                column.pop()
+        else:
+            for column in self.columns.values():
+                column.pop()
+        self.entities.pop()
+
+_OWNED_CONTAINERS = (dict, list, set, tuple, pygame.Vector2)
+
+def _approx_size(component):
+    """Shallow size of a component plus the containers it owns directly.
+
+    Shared references (surfaces, managers, callbacks) are not counted.
+    """
+    size = sys.getsizeof(component)
+    instance_dict = getattr(component, '__dict__', None)
+    if instance_dict is not None:
+        size += sys.getsizeof(instance_dict)
+        values = instance_dict.values()
+    else:
+        values = [getattr(component, name, None)
+                  for cls in type(component).__mro__
+                  for name in getattr(cls, '__slots__', ())]
+    for value in values:
+        if isinstance(value, _OWNED_CONTAINERS):
+            size += sys.getsizeof(value)
+    return size
+
 class ComponentManager:
     def __init__(self):
-        self._components = defaultdict(dict) # {component_type: {entity_id: component_instance}}
-        self._query_cache = {}
-        self._cache_version = 0
+        self._components = defaultdict(SparseSet) # {component_type: SparseSet(entity_id -> component_instance)}
+        self._archetypes = {}                # {type_mask: Archetype}
+        self._entity_archetypes = {}         # {entity_id: Archetype} -- the entity's component-type index
+        self._type_bits = {}                 # {component_type: 1 << n}
+        self._query_cache = {}               # {component_types: set(entity_ids)}
+        self._archetype_query_cache = {}     # {component_types: (archetype_count, [Archetype])}
+        self._tuple_query_cache = {}         # {component_types: (type_versions, [(eid, *components)])}
+
+        # Fine-grained invalidation: a change to one component type only drops
+        # the cached queries that mention that type.
+        self._type_versions = defaultdict(int)  # {component_type: version}
+        self._queries_by_type = defaultdict(set) # {component_type: {component_types}}
+        self._built_queries = set()
+        self._query_hits = 0
+        self._query_misses = 0
+        self._query_rebuilds = 0
+        self._query_invalidations = 0
+        self._pending_invalidations = None    # set of types while a batch is being applied
+
+        self.commands = CommandBuffer()
+
+        # Optional columnar x/y/vx/vy store for free movers (needs numpy)
+        self.transforms = TransformStore() if TransformStore.available() else None
+        self._remove_hooks = {} # {component_type: callback(entity_id, component)}
+        if self.transforms is not None:
+            self._remove_hooks[Position] = self.transforms.on_component_removed
+            self._remove_hooks[Velocity] = self.transforms.on_component_removed
+
+    def type_bit(self, component_type):
+        bit = self._type_bits.get(component_type)
+        if bit is None:
+            bit = 1 << len(self._type_bits)
+            self._type_bits[component_type] = bit
+        return bit
+
+    def type_mask(self, *component_types):
+        mask = 0
+        for ct in component_types:
+            mask |= self.type_bit(ct)
+        return mask
+
+    def _get_archetype(self, types, mask):
+        archetype = self._archetypes.get(mask)
+        if archetype is None:
+            archetype = Archetype(types, mask)
+            self._archetypes[mask] = archetype
+        return archetype
+
+    def _archetype_with(self, archetype, component_type):
+        if archetype is None:
+            return self._get_archetype(frozenset((component_type,)), self.type_bit(component_type))
+        target = archetype.add_edges.get(component_type)
+        if target is None:
+            target = self._get_archetype(archetype.types | {component_type}, archetype.mask | self.type_bit(component_type))
+            archetype.add_edges[component_type] = target
+        return target
+
+    def _archetype_without(self, archetype, component_type):
+        target = archetype.remove_edges.get(component_type)
+        if target is None:
+            target = self._get_archetype(archetype.types - {component_type}, archetype.mask & ~self.type_bit(component_type))
+            archetype.remove_edges[component_type] = target
+        return target
+
+    def get_mask(self, entity_id):
+        """Bitmask of the component types the entity owns (0 if none)."""
+        archetype = self._entity_archetypes.get(entity_id)
+        return archetype.mask if archetype is not None else 0
+
+    def get_component_types(self, entity_id):
+        archetype = self._entity_archetypes.get(entity_id)
+        return archetype.types if archetype is not None else frozenset()
+
+    def has(self, entity_id, *component_types):
+        """True if the entity owns every given component type (one mask test)."""
+        archetype = self._entity_archetypes.get(entity_id)
+        if archetype is None:
+            return False
+        required = self.type_mask(*component_types)
+        return archetype.mask & required == required
+
+    def get_archetypes_with(self, *component_types):
+        """Return every archetype table that owns all of the given component types.
+
+        Iterate ``archetype.entities`` together with ``archetype.columns[T]`` to
+        walk matching rows without any per-entity lookups. Do not add or remove
+        components while walking a table; record them with ``add_deferred`` /
+        ``remove_deferred`` instead.
+        """
+        key = component_types
+        cached = self._archetype_query_cache.get(key)
+        if cached is not None and cached[0] == len(self._archetypes):
+            return cached[1]
+
+        required = self.type_mask(*component_types)
+        matches = [a for a in self._archetypes.values() if a.mask & required == required]
+        self._archetype_query_cache[key] = (len(self._archetypes), matches)
+        return matches
+
+    def _invalidate(self, component_type):
+        self._type_versions[component_type] += 1
+        if self._pending_invalidations is not None:
+            self._pending_invalidations.add(component_type)
+            return
+        self._drop_queries(component_type)
+
+    def _drop_queries(self, component_type):
+        keys = self._queries_by_type.get(component_type)
+        if keys:
+            query_cache = self._query_cache
+            for key in keys:
+                if query_cache.pop(key, None) is not None:
+                    self._query_invalidations += 1
+            keys.clear()
+
+    def get_type_version(self, component_type):
+        """Monotonic counter bumped whenever a component of this type is added, replaced or removed."""
+        return self._type_versions.get(component_type, 0)
+
+    def query_stats(self):
+        return {
+            "hits": self._query_hits,
+            "misses": self._query_misses,
+            "rebuilds": self._query_rebuilds,
+            "invalidations": self._query_invalidations,
+            "cached_queries": len(self._query_cache) + len(self._tuple_query_cache),
+            "archetypes": len(self._archetypes),
+        }
+
+    def reset_query_stats(self):
+        self._query_hits = self._query_misses = self._query_rebuilds = self._query_invalidations = 0
+
+    def memory_report(self, sample=64):
+        """Instance count and approximate bytes per component type.
+
+        Sizes are averaged over up to ``sample`` instances of each type and
+        scaled by the instance count. ``storage_bytes`` is the SparseSet
+        bookkeeping for that type. Sorted by total bytes, largest first.
+        """
+        report = {}
+        for component_type, comps in self._components.items():
+            count = len(comps)
+            if not count:
+                continue
+            values = comps.dense_values
+            picked = values[::max(1, count // sample)][:sample]
+            per_instance = sum(_approx_size(c) for c in picked) / len(picked)
+            report[component_type.__name__] = {
+                'count': count,
+                'bytes': int(per_instance * count),
+                'bytes_per_instance': int(per_instance),
+                'storage_bytes': sys.getsizeof(comps.sparse) + sys.getsizeof(comps.dense_ids) + sys.getsizeof(comps.dense_values),
+                'slotted': not hasattr(picked[0], '__dict__'),
+            }
+        return dict(sorted(report.items(), key=lambda item: item[1]['bytes'], reverse=True))
 
     def add(self, entity_id, *components):
-        self._cache_version += 1
+        if not components:
+            return
+        archetype = self._entity_archetypes.get(entity_id)
+        target = archetype
         for component in components:
-            self._components[type(component)][entity_id] = component
+            ct = type(component)
+            comps = self._components[ct]
+            if entity_id in comps:
+                self._type_versions[ct] += 1 # replaced in place, query membership is unchanged
+            else:
+                stale = comps.stale(entity_id)
+                if stale is not None:
+                    # A destroyed entity that kept components would leak them; evict it whole
+                    print(f"[COMPONENT MANAGER] evicting stale entity {stale} from the slot of {entity_id} (DEBUG)")
+                    self.remove_all(stale)
+                self._invalidate(ct)
+            comps[entity_id] = component
+            if target is None or ct not in target.types:
+                target = self._archetype_with(target, ct)
+
+        if target is archetype:
+            # Only replaced existing components; patch the row in place
+            row = archetype.rows[entity_id]
+            for component in components:
+                archetype.columns[type(component)][row] = component
+            return
+
+        if archetype is not None:
+            archetype.remove(entity_id)
+        target.append(entity_id, self._components)
+        self._entity_archetypes[entity_id] = target
 
     def get(self, entity_id, component_type):
         comps = self._components.get(component_type)
@@ -32,31 +285,54 @@ class ComponentManager:
             return set()
 
         key = component_types
-        if key in self._query_cache:
-            cached_version, result = self._query_cache[key]
-            if cached_version == self._cache_version:
-                return result
-
-        smallest_ct = min(component_types, key=lambda ct: len(self._components.get(ct, ())))
-        smallest_dict = self._components.get(smallest_ct)
-        if smallest_dict is None:
-            self._query_cache[key] = (self._cache_version, set())
-            return set()
+        result = self._query_cache.get(key)
+        if result is not None:
+            self._query_hits += 1
+            return result
 
-        other_dicts = []
-        for ct in component_types:
-            if ct != smallest_ct:
-                d = self._components.get(ct)
-                other_dicts.append(d if d is not None else {})
+        self._query_misses += 1
+        if key in self._built_queries:
+            self._query_rebuilds += 1
+        else:
+            self._built_queries.add(key)
 
         entities = set()
-        for entity_id in smallest_dict:
-            if all(entity_id in d for d in other_dicts):
-                entities.add(entity_id)
+        for archetype in self.get_archetypes_with(*component_types):
+            entities.update(archetype.entities)
 
-        self._query_cache[key] = (self._cache_version, entities)
+        self._query_cache[key] = entities
+        for ct in component_types:
+            self._queries_by_type[ct].add(key)
         return entities
 
+    def query(self, *component_types):
+        """``[(entity_id, a, b, ...)]`` for every entity owning all ``component_types``.
+
+        Components come straight from the archetype columns, in the order the
+        types were given. The list is cached and rebuilt only when one of the
+        types was added, replaced or removed since (tracked by type version).
+        Treat it as read-only; structural changes made while iterating it
+        don't affect the current pass.
+        """
+        if not component_types:
+            return []
+
+        versions = tuple([self._type_versions.get(ct, 0) for ct in component_types])
+        cached = self._tuple_query_cache.get(component_types)
+        if cached is not None and cached[0] == versions:
+            self._query_hits += 1
+            return cached[1]
+
+        self._query_misses += 1
+        if cached is not None:
+            self._query_rebuilds += 1
+        rows = []
+        for archetype in self.get_archetypes_with(*component_types):
+            columns = archetype.columns
+            rows.extend(zip(archetype.entities, *[columns[ct] for ct in component_types]))
+        self._tuple_query_cache[component_types] = (versions, rows)
+        return rows
+
     def get_entities_with_either(self, *component_types):
         entities = set()
         for ct in component_types:
@@ -66,19 +342,97 @@ class ComponentManager:
         return entities
 
     def remove(self, entity_id, component_type):
-        self._cache_version += 1
         comps = self._components.get(component_type)
         if comps and entity_id in comps:
-            del comps[entity_id]
+            component = comps.pop(entity_id)
+            self._invalidate(component_type)
+            hook = self._remove_hooks.get(component_type)
+            if hook is not None:
+                hook(entity_id, component)
+
+            archetype = self._entity_archetypes[entity_id]
+            archetype.remove(entity_id)
+            target = self._archetype_without(archetype, component_type)
+            if target.types:
+                target.append(entity_id, self._components)
+                self._entity_archetypes[entity_id] = target
+            else:
+                del self._entity_archetypes[entity_id]
 
     def remove_all(self, entity_id):
-        self._cache_version += 1
-        for component_type in list(self._components.keys()):
-            comps = self._components[component_type]
-            if entity_id in comps:
-                del comps[entity_id]
+        archetype = self._entity_archetypes.pop(entity_id, None)
+        if archetype is None:
+            return
+        hooks = self._remove_hooks
+        for component_type in archetype.types:
+            component = self._components[component_type].pop(entity_id)
+            self._invalidate(component_type)
+            hook = hooks.get(component_type)
+            if hook is not None:
+                hook(entity_id, component)
+        archetype.remove(entity_id)
+
+    def add_deferred(self, entity_id, *components):
+        """Record an add to be applied at the next ``flush_commands()``."""
+        self.commands.add(entity_id, *components)
+
+    def remove_deferred(self, entity_id, component_type):
+        """Record a component removal to be applied at the next ``flush_commands()``."""
+        self.commands.remove(entity_id, component_type)
+
+    def remove_all_deferred(self, entity_id):
+        self.commands.destroy(entity_id)
+
+    def flush_commands(self, on_destroy=None, is_alive=None):
+        """Apply every recorded command in order.
+
+        Query invalidation is batched: each touched component type is
+        invalidated once after the whole buffer has been applied. Destroy
+        commands are routed through ``on_destroy(entity_id)`` when given
+        (EntityManager uses this for its lifecycle bookkeeping). Adds and
+        removes for an entity destroyed earlier in the buffer, or for which
+        ``is_alive(entity_id)`` is False, are dropped.
+        """
+        if not self.commands:
+            return 0
+
+        applied = 0
+        destroyed = set()
+        self._pending_invalidations = pending = set()
+        try:
+            # Commands recorded while applying (e.g. from on_destroy) are
+            # picked up by the next drain.
+            while self.commands:
+                for op, entity_id, payload in self.commands.drain():
+                    if op == CommandBuffer.DESTROY:
+                        destroyed.add(entity_id)
+                        if on_destroy is not None:
+                            on_destroy(entity_id)
+                        else:
+                            self.remove_all(entity_id)
+                    elif entity_id in destroyed or (is_alive is not None and not is_alive(entity_id)):
+                        continue
+                    elif op == CommandBuffer.ADD:
+                        self.add(entity_id, *payload)
+                    else:
+                        self.remove(entity_id, payload)
+                    applied += 1
+        finally:
+            self._pending_invalidations = None
+            for component_type in pending:
+                self._drop_queries(component_type)
+        return applied
 
     def clear_all(self):
-        self._cache_version += 1
+        if self.transforms is not None:
+            self.transforms.clear()
+        for component_type in list(self._components):
+            self._type_versions[component_type] += 1
         self._components.clear()
+        self._archetypes.clear()
+        self._entity_archetypes.clear()
         self._query_cache.clear()
+        self._archetype_query_cache.clear()
+        self._tuple_query_cache.clear()
+        self._queries_by_type.clear()
+        self.commands.clear()
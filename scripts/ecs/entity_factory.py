@@ -15,7 +15,7 @@ from ..utils.json_schemas import ENTITY_SCHEMA, ENTITY_NAMES
 
 from ..utils import CollisionShape, CollisionLayer, get_blob_shadow_surface, SCALE
 
-import json, copy, pygame, random
+import json, pygame, random
 
 # function factory for getting cond for transitions
 def make_vel_zero_check(entity_id, component_manager, input_system):
@@ -30,22 +30,90 @@ def make_check_invincibility_timer(entity_id, component_manager, input_system):
 def make_left_held_release(entity_id, component_manager, input_system):
     return (lambda: input_system.mouse_states["left_held"] == False)
 
-def build_animation_state_machine(eid, data, ctx):
-    transitions = copy.deepcopy(data.get("transitions", {}))
+def compile_transitions(transitions):
+    """Resolve each transition's condition factory once: [(animation, tdata, make_cond)]."""
+    compiled = []
     for anim, tdata in transitions.items():
         cond_str = tdata.get("cond")
+        make_cond = None
         if cond_str:
-            tdata["cond"] = globals().get("make_" + cond_str, lambda *_: lambda: False)(
-                eid, ctx["component_manager"], ctx["input_system"]
-            )
+            make_cond = globals().get("make_" + cond_str, lambda *_: lambda: False)
+        compiled.append((anim, tdata, make_cond))
+    return compiled
+
+def build_compiled_state_machine(eid, data, ctx):
+    # Each entity needs its own transitions dict (self-destructing transitions
+    # are deleted from it), but a shallow copy per transition is enough.
+    cm = ctx["component_manager"]
+    input_system = ctx["input_system"]
+    transitions = {}
+    for anim, tdata, make_cond in data["compiled_transitions"]:
+        tdata = dict(tdata)
+        if make_cond is not None:
+            tdata["cond"] = make_cond(eid, cm, input_system)
+        transitions[anim] = tdata
     return AnimationStateMachine(
         entity_id=eid,
-        component_manager=ctx["component_manager"],
+        component_manager=cm,
         event_manager=ctx["event_manager"],
         animation_priority_list=data.get("animation_priority_list", []),
         transitions=transitions
     )
 
+def build_animation_state_machine(eid, data, ctx):
+    return build_compiled_state_machine(eid, {
+        "compiled_transitions": compile_transitions(data.get("transitions", {})),
+        "animation_priority_list": data.get("animation_priority_list", [])
+    }, ctx)
+
+class Prefab:
+    """A compiled entry of ``entities.json``.
+
+    Builders, images, the blob shadow surface and animation transition specs
+    are resolved once in ``EntityFactory.compile_prefab``; ``instantiate`` only
+    constructs the per-entity component objects and adds them to the entity
+    in a single archetype move.
+    """
+    def __init__(self, name, steps, ctx, player=False, image=None, image_file=None):
+        self.name = name
+        self.steps = steps      # [(component_name, builder, data)]
+        self.ctx = ctx          # shared build context; pos/image are swapped per instance
+        self.player = player
+        self.image = image
+        self.image_file = image_file
+
+        names = [component_name for component_name, _, _ in steps]
+        self._pos_index = names.index("Position") if "Position" in names else None
+        self._sprite_index = None
+        for sprite_name in ("RenderComponent", "AnimationComponent"):
+            if sprite_name in names:
+                self._sprite_index = names.index(sprite_name)
+                break
+
+    def instantiate(self, pos, image=None, image_file=None):
+        ctx = self.ctx
+        ctx["pos"] = pos
+        ctx["image"] = image if image is not None else self.image
+        ctx["image_file"] = image_file or self.image_file
+
+        entity_id = ctx["entity_manager"].create_entity(player=self.player)
+        components = [builder(entity_id, data, ctx) for _, builder, data in self.steps]
+        ctx["component_manager"].add(entity_id, *components)
+
+        if self._pos_index is not None and self._sprite_index is not None:
+            position = components[self._pos_index]
+            img = components[self._sprite_index].surface
+            position.x += img.get_width() / 2
+            position.y += img.get_height() / 2
+        return entity_id
+
+    def instantiate_many(self, positions, images=None):
+        """Spawn one entity per position (e.g. a wave); ``images`` optionally pairs an image with each."""
+        instantiate = self.instantiate
+        if images is None:
+            return [instantiate(pos) for pos in positions]
+        return [instantiate(pos, image) for pos, image in zip(positions, images)]
+
 class EntityFactory:
     COMPONENT_BUILDERS = {
         "PlayerTagComponent": lambda eid, data, ctx: PlayerTagComponent(),
@@ -72,6 +140,7 @@ class EntityFactory:
             entity_type=data.get("entity_type", "chess_piece")
         ),
         "AnimationStateMachine": build_animation_state_machine,
+        "CompiledAnimationStateMachine": build_compiled_state_machine,
         "AIComponent": lambda eid, data, ctx: AIComponent(
             entity_id=eid,
             behavior=data["behavior"]
@@ -154,51 +223,79 @@ class EntityFactory:
 
     def __init__(self):
         self.data = load_and_validate("data/config/entities.json", ENTITY_SCHEMA)
+        self._prefabs = {}
 
-    def create_player(self, pos, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager):
-        player = entity_manager.create_entity(player=True)
+    def compile_prefab(self, name, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager, player=False, image=None, image_file=None, shadow=None):
+        """Compile ``entities.json[name]`` into a Prefab bound to the given managers.
 
-        # Add components to the player entity
-        player_component_data = self.data["player"]
+        :param shadow: optional ``(alpha, offset)``; the blob shadow surface is built once and shared.
+        """
+        entity_data = dict(self.data.get(name, {}))
+        if shadow is not None:
+            alpha, offset = shadow
+            entity_data["ShadowComponent"] = {
+                "surface": get_blob_shadow_surface(alpha=alpha),
+                "offset": offset,
+                "alpha": alpha,
+                "center": True
+            }
+
+        steps = []
+        for component_name, component_data in entity_data.items():
+            if component_data is None:
+                continue  # Schema may fill missing keys as None
+            builder = self.COMPONENT_BUILDERS.get(component_name)
+            if builder is None:
+                print(f"[ENTITY FACTORY] No builder found for component '{component_name}' in prefab '{name}' with data: {component_data}")
+                continue
+
+            if component_name == "AnimationStateMachine":
+                builder = self.COMPONENT_BUILDERS["CompiledAnimationStateMachine"]
+                component_data = {
+                    "compiled_transitions": compile_transitions(component_data.get("transitions", {})),
+                    "animation_priority_list": component_data.get("animation_priority_list", [])
+                }
+            elif component_name == "RenderComponent" and image is None and "image_file" in component_data:
+                image = resource_manager.get_image(component_data["image_file"], scale=component_data.get("image_scale", 1))
+            steps.append((component_name, builder, component_data))
 
-        alpha = 200
-        player_component_data["ShadowComponent"] = {
-            "surface": get_blob_shadow_surface(alpha=alpha),
-            "offset": (0, 18),
-            "alpha": alpha,
-            "center": True
+        ctx = {
+            "pos": (0, 0),
+            "component_manager": component_manager,
+            "entity_manager": entity_manager,
+            "event_manager": event_manager,
+            "animation_handler": animation_handler,
+            "input_system": input_system,
+            "resource_manager": resource_manager,
+            "player": player,
+            "image": image,
+            "image_file": image_file
         }
+        return Prefab(name, steps, ctx, player=player, image=image, image_file=image_file)
+
+    def get_prefab(self, name, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager, **kwargs):
+        """Cached ``compile_prefab``; recompiled if the managers it was bound to changed."""
+        prefab = self._prefabs.get(name)
+        if prefab is not None:
+            ctx = prefab.ctx
+            if (ctx["component_manager"] is component_manager and ctx["entity_manager"] is entity_manager
+                    and ctx["event_manager"] is event_manager and ctx["input_system"] is input_system):
+                return prefab
+        prefab = self.compile_prefab(name, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager, **kwargs)
+        self._prefabs[name] = prefab
+        return prefab
 
-        self.add_components_to_entity(player, pos, player_component_data, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager, player=True)
-
-        return player
+    def create_player(self, pos, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager):
+        prefab = self.get_prefab("player", component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager, player=True, shadow=(200, (0, 18)))
+        return prefab.instantiate(pos)
 
     def create_enemy(self, pos, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager, chess_piece_type="pawn"):
-        enemy = entity_manager.create_entity()
-
-        # Add components to the enemy entity
-        enemy_component_data = self.data["enemy_" + chess_piece_type]
-
-        alpha = 200
-
-        enemy_component_data["ShadowComponent"] = {
-            "surface": get_blob_shadow_surface(alpha=alpha),
-            "offset": (0, 18),
-            "alpha": alpha,
-            "center": True
-        }
-
-        self.add_components_to_entity(enemy, pos, enemy_component_data, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager)
-
-        return enemy
+        prefab = self.get_prefab("enemy_" + chess_piece_type, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager, shadow=(200, (0, 18)))
+        return prefab.instantiate(pos)
 
     def create_foliage(self, pos, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager, render_effect_system, image):
-        foliage = entity_manager.create_entity()
-
-        # Add components to the foliage entity
-        foliage_component_data = self.data["foliage"]
-
-        self.add_components_to_entity(foliage, pos, foliage_component_data, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager, image=image, image_file="data/graphics/spritesheets/foliage.png")
+        prefab = self.get_prefab("foliage", component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager, image_file="data/graphics/spritesheets/foliage.png")
+        foliage = prefab.instantiate(pos, image=image)
 
         # Add leaf particle emitter
         from ..components.particle import ParticleEmitter, ParticleConfig, EmitterShape, EmitterShapeType
@@ -229,35 +326,20 @@ class EntityFactory:
 
         return foliage
 
-    def create_destructible(self, pos, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager):
-        entity_id = entity_manager.create_entity()
-        entity_data = self.data.get("destructible", {})
+    def destructible_prefab(self, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager):
         surface = resource_manager.get_image("data/graphics/images/crate.png")
+        return self.get_prefab("destructible", component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager, image=surface, shadow=(150, (0, 16)))
 
-        # Inject shadow surface (can't be serialized to JSON)
-        alpha = 150
-        entity_data["ShadowComponent"] = {
-            "surface": get_blob_shadow_surface(alpha=alpha),
-            "offset": (0, 16),
-            "alpha": alpha,
-            "center": True
-        }
-
-        self.add_components_to_entity(entity_id, pos, entity_data, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager, image=surface)
-        return entity_id
+    def create_destructible(self, pos, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager):
+        prefab = self.destructible_prefab(component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager)
+        return prefab.instantiate(pos)
 
     def create_entity(self, pos, entity, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager):
         """
         Create a generic entity with the given data.
         """
-        entity_id = entity_manager.create_entity()
-
-        entity_component_data = self.data.get(entity, {})
-
-        # Add components to the entity
-        self.add_components_to_entity(entity_id, pos, entity_component_data, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager)
-
-        return entity_id
+        prefab = self.get_prefab(entity, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager)
+        return prefab.instantiate(pos)
 
     def add_components_to_entity(self, entity_id, pos, entity_data, component_manager, entity_manager, event_manager, animation_handler, input_system, resource_manager, player=False, image=None, image_file=None):
         ctx = {
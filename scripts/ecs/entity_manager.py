@@ -1,4 +1,4 @@
-import itertools
+from collections import deque
 import math
 import random
 import pygame
@@ -7,14 +7,15 @@ from ..components.physics import Velocity, Position
 from ..components.combat import HurtBoxComponent, HitBoxComponent
 from ..components.render_effect import RenderEffectComponent
 from ..systems.animation.animation_state_machine import AnimationStateMachine
-
-import itertools
+from .sparse_set import ENTITY_INDEX_MASK, make_entity_id
 
 class EntityManager:
     def __init__(self, event_manager, component_manager):
-        self._next_id = itertools.count()
+        # Generational IDs: destroyed slots are recycled through a FIFO free
+        # list and their generation is bumped so stale IDs never match again.
+        self._generations = []  # [generation] indexed by entity index
+        self._free_indices = deque()
         self.entities = set()
-        self.to_remove = set()
         self.dead_entities = set()
         self.player_id = None
 
@@ -26,7 +27,14 @@ class EntityManager:
         self.em.subscribe(GameSceneEvents.ANIMATION_FINISHED, self.check_dead_entity)
 
     def create_entity(self, player=False):
-        eid = next(self._next_id)
+        if self._free_indices:
+            index = self._free_indices.popleft()
+        else:
+            index = len(self._generations)
+            if index > ENTITY_INDEX_MASK:
+                raise RuntimeError(f"[ENTITY MANAGER] Entity limit reached ({ENTITY_INDEX_MASK + 1} live entities) (DEBUG)")
+            self._generations.append(0)
+        eid = make_entity_id(index, self._generations[index])
         self.entities.add(eid)
         if player:
             self.player_id = eid
@@ -52,7 +60,7 @@ class EntityManager:
                 asm.set_animation("death")
                 self.dead_entities.add(entity_id)
             else:
-                self.to_remove.add(entity_id)
+                self.destroy_deferred(entity_id)
         else:
             # "Tossed" death effect for enemies
             # Calculate knockback direction: Away from the player
@@ -71,7 +79,7 @@ class EntityManager:
             # Apply true top-down projectile motion:
             # 1. Ground plane (X, Y) linear movement
             # 2. Vertical plane (Z) parabolic arc
-            self.cm.add(entity_id, KnockbackComponent(
+            self.cm.add_deferred(entity_id, KnockbackComponent(
                 toss_dir, 
                 force=25,       # Reduced from 40 for shorter distance
                 duration=0.6, 
@@ -91,16 +99,49 @@ class EntityManager:
     def check_dead_entity(self, entity_id, animation_id):
         if animation_id.endswith("_death") and entity_id in self.dead_entities:
             self.dead_entities.discard(entity_id)
-            self.to_remove.add(entity_id)
+            self.destroy_deferred(entity_id)
             return True
         return False
 
     def delete_entity(self, entity_id):
         if entity_id in self.entities:
-            self.to_remove.add(entity_id)
+            self.destroy_deferred(entity_id)
             return True
         return False
 
+    def destroy_deferred(self, entity_id):
+        """Queue an entity for destruction at the next sync point."""
+        self.cm.commands.destroy(entity_id)
+
+    def is_alive(self, entity_id):
+        return entity_id in self.entities
+
+    def _recycle(self, entity_id):
+        index = entity_id & ENTITY_INDEX_MASK
+        self._generations[index] += 1
+        self._free_indices.append(index)
+
+    def _destroy(self, entity_id):
+        if entity_id in self.entities:
+            self.entities.discard(entity_id)
+            self.em.unsubscribe_all_for(entity_id)
+            self.cm.remove_all(entity_id)
+            self._recycle(entity_id)
+
+    def release_all(self):
+        """Forget every live entity (after ``cm.clear_all()``) and recycle their IDs."""
+        for entity_id in self.entities:
+            self._recycle(entity_id)
+        self.entities.clear()
+        self.dead_entities.clear()
+        if hasattr(self, 'dying_timers'):
+            self.dying_timers.clear()
+        self.player_id = None
+
+    def flush_commands(self):
+        """Sync point: apply all deferred component adds/removes and entity destroys."""
+        return self.cm.flush_commands(on_destroy=self._destroy, is_alive=self.is_alive)
+
     def refresh_entities(self, dt=0):
         # 1. Update dying timers for "tossed" enemies
         if hasattr(self, 'dying_timers'):
@@ -136,19 +177,11 @@ class EntityManager:
                         shape=EmitterShape(EmitterShapeType.CIRCLE, radius=20)
                     ))
 
-                self.to_remove.add(eid)
+                self.destroy_deferred(eid)
 
-        for eid in self.to_remove:
-            if eid in self.entities:
-                self.entities.discard(eid)
-                self.em.unsubscribe_all_for(eid)
-                self.cm.remove_all(eid)
-        self.to_remove.clear()
+        self.flush_commands()
 
     def clear_entities(self):
-        self.entities.clear()
-        self.to_remove.clear()
-        self.dead_entities.clear()
-        self.player_id = None
+        self.release_all()
         self.cm.clear_all()
         self.em.unsubscribe_all_for(None)
\ No newline at end of file
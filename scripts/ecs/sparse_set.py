@@ -0,0 +1,131 @@
+# Entity IDs are generational handles: the low bits index a slot that gets
+# recycled, the high bits count how many times that slot has been reused so a
+# stale ID never aliases the entity that took its slot.
+ENTITY_INDEX_BITS = 20
+ENTITY_INDEX_MASK = (1 << ENTITY_INDEX_BITS) - 1
+
+def entity_index(entity_id):
+    return entity_id & ENTITY_INDEX_MASK
+
+def entity_generation(entity_id):
+    return entity_id >> ENTITY_INDEX_BITS
+
+def make_entity_id(index, generation):
+    return (generation << ENTITY_INDEX_BITS) | index
+
+
+class SparseSet:
+    """Component storage for one component type, keyed by generational entity ID.
+
+    ``sparse[entity_index]`` holds the position of the entity in the packed
+    ``dense_ids`` / ``dense_values`` arrays (or -1). Add, remove and membership
+    are O(1) without hashing, and iteration walks the packed arrays.
+
+    Behaves like a ``dict`` for the operations the engine uses (``get``, ``in``,
+    ``[]``, ``del``, ``pop``, ``keys/values/items``, ``len``, iteration).
+    Removal swaps the last element into the hole, so don't remove from a set
+    while iterating it — use the command buffer instead.
+    """
+    __slots__ = ('sparse', 'dense_ids', 'dense_values')
+
+    def __init__(self):
+        self.sparse = []
+        self.dense_ids = []
+        self.dense_values = []
+
+    def __len__(self):
+        return len(self.dense_ids)
+
+    def __bool__(self):
+        return bool(self.dense_ids)
+
+    def __iter__(self):
+        return iter(self.dense_ids)
+
+    def _position(self, entity_id):
+        index = entity_id & ENTITY_INDEX_MASK
+        if index < len(self.sparse):
+            pos = self.sparse[index]
+            if pos >= 0 and self.dense_ids[pos] == entity_id:
+                return pos
+        return -1
+
+    def stale(self, entity_id):
+        """The ID of another generation that still holds ``entity_id``'s slot, or None."""
+        index = entity_id & ENTITY_INDEX_MASK
+        if index < len(self.sparse):
+            pos = self.sparse[index]
+            if pos >= 0 and self.dense_ids[pos] != entity_id:
+                return self.dense_ids[pos]
+        return None
+
+    def __contains__(self, entity_id):
+        return self._position(entity_id) >= 0
+
+    def get(self, entity_id, default=None):
+        index = entity_id & ENTITY_INDEX_MASK
+        if index < len(self.sparse):
+            pos = self.sparse[index]
+            if pos >= 0 and self.dense_ids[pos] == entity_id:
+                return self.dense_values[pos]
+        return default
+
+    def __getitem__(self, entity_id):
+        pos = self._position(entity_id)
+        if pos < 0:
+            raise KeyError(entity_id)
+        return self.dense_values[pos]
+
+    def __setitem__(self, entity_id, value):
+        index = entity_id & ENTITY_INDEX_MASK
+        sparse = self.sparse
+        if index >= len(sparse):
+            sparse.extend([-1] * (index + 1 - len(sparse)))
+        pos = sparse[index]
+        if pos >= 0:
+            if self.dense_ids[pos] == entity_id:
+                self.dense_values[pos] = value
+                return
+            # Overwriting would leak the old entry in the dense arrays
+            raise ValueError(f"[SPARSE SET] slot {index} still holds stale entity {self.dense_ids[pos]}, "
+                             f"remove it before adding {entity_id} (DEBUG)")
+        sparse[index] = len(self.dense_ids)
+        self.dense_ids.append(entity_id)
+        self.dense_values.append(value)
+
+    def pop(self, entity_id, *default):
+        pos = self._position(entity_id)
+        if pos < 0:
+            if default:
+                return default[0]
+            raise KeyError(entity_id)
+
+        value = self.dense_values[pos]
+        last_id = self.dense_ids.pop()
+        last_value = self.dense_values.pop()
+        if last_id != entity_id:
+            self.dense_ids[pos] = last_id
+            self.dense_values[pos] = last_value
+            self.sparse[last_id & ENTITY_INDEX_MASK] = pos
+        self.sparse[entity_id & ENTITY_INDEX_MASK] = -1
+        return value
+
+    def __delitem__(self, entity_id):
+        self.pop(entity_id)
+
+    def keys(self):
+        return self.dense_ids
+
+    def values(self):
+        return self.dense_values
+
+    def items(self):
+        return zip(self.dense_ids, self.dense_values)
+
+    def clear(self):
+        self.sparse.clear()
+        self.dense_ids.clear()
+        self.dense_values.clear()
+
+    def __repr__(self):
+        return f"SparseSet({dict(self.items())})"
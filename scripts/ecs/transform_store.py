@@ -0,0 +1,163 @@
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; without it every transform keeps its own Vector2
+    np = None
+
+from ..components.physics import Position, Velocity, CollisionComponent
+
+
+class TransformStore:
+    """Columnar x / y / vx / vy storage for free-moving entities.
+
+    Entities that own ``Position`` + ``Velocity`` but no ``CollisionComponent``
+    (bombs, debris, any future swarm of movers) are bound to one row of a
+    contiguous ``(capacity, 4)`` float array. Their components become views
+    into that row, so integration, camera culling and distance queries run as
+    single vectorized array operations instead of one Python iteration per
+    entity.
+
+    Bound views read and write the store through ``x`` / ``y`` / ``vec = ...``
+    / ``+=``. ``component.vec`` returns a *copy* while bound — mutating it in
+    place (``pos.vec.x = 5``) does not write back.
+
+    Requires numpy; ``TransformStore.available()`` is False without it and the
+    physics engine keeps its per-entity integration loop.
+    """
+    X, Y, VX, VY = 0, 1, 2, 3
+
+    def __init__(self, capacity=256, dtype=None):
+        if np is None:
+            raise RuntimeError("[TRANSFORM STORE] numpy is required for the columnar transform store (DEBUG)")
+        self.data = np.zeros((capacity, 4), dtype=dtype or np.float64)
+        self.count = 0
+        self.entities = []      # [entity_id] indexed by row
+        self.positions = []     # [Position] indexed by row
+        self.velocities = []    # [Velocity] indexed by row
+        self.rows = {}          # {entity_id: row}
+        self.releases = 0       # bumped by every release; rows only stay put while it is unchanged
+        self._synced_versions = None
+
+    @staticmethod
+    def available():
+        return np is not None
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, entity_id):
+        return entity_id in self.rows
+
+    def _grow(self):
+        data = np.zeros((len(self.data) * 2, 4), dtype=self.data.dtype)
+        data[:self.count] = self.data[:self.count]
+        self.data = data
+
+    def bind(self, entity_id, position, velocity):
+        if entity_id in self.rows:
+            return self.rows[entity_id]
+        if self.count == len(self.data):
+            self._grow()
+
+        row = self.count
+        self.data[row] = (position.x, position.y, velocity.x, velocity.y)
+        self.count += 1
+        self.rows[entity_id] = row
+        self.entities.append(entity_id)
+        self.positions.append(position)
+        self.velocities.append(velocity)
+        position._bind(self, row, self.X)
+        velocity._bind(self, row, self.VX)
+        velocity.realistic_vel.update(velocity.x, velocity.y)
+        return row
+
+    def release(self, entity_id):
+        row = self.rows.pop(entity_id, None)
+        if row is None:
+            return
+        self.releases += 1
+        # Hand the current values back to the components before unbinding
+        self.positions[row]._unbind()
+        self.velocities[row]._unbind()
+
+        last = self.count - 1
+        if row != last:
+            self.data[row] = self.data[last]
+            moved = self.entities[last]
+            self.entities[row] = moved
+            self.positions[row] = self.positions[last]
+            self.velocities[row] = self.velocities[last]
+            self.positions[row]._row = row
+            self.velocities[row]._row = row
+            self.rows[moved] = row
+        self.entities.pop()
+        self.positions.pop()
+        self.velocities.pop()
+        self.count = last
+
+    def clear(self):
+        for entity_id in list(self.rows):
+            self.release(entity_id)
+        self._synced_versions = None
+
+    def sync(self, component_manager):
+        """Bind new free movers and release entities that stopped being one.
+
+        Only walks the archetype tables when Position, Velocity or
+        CollisionComponent membership changed since the last call.
+        """
+        cm = component_manager
+        versions = (cm.get_type_version(Position), cm.get_type_version(Velocity), cm.get_type_version(CollisionComponent))
+        if versions == self._synced_versions:
+            return
+        self._synced_versions = versions
+
+        for arch in cm.get_archetypes_with(Position, Velocity):
+            if CollisionComponent in arch.types:
+                for eid in arch.entities:
+                    if eid in self.rows:
+                        self.release(eid)
+                continue
+            for eid, pos, vel in zip(arch.entities, arch.columns[Position], arch.columns[Velocity]):
+                row = self.rows.get(eid)
+                if row is not None and self.positions[row] is pos and self.velocities[row] is vel:
+                    continue
+                if row is not None:
+                    self.release(eid) # component instance was replaced
+                self.bind(eid, pos, vel)
+
+    def on_component_removed(self, entity_id, component):
+        if component._store is self:
+            self.release(entity_id)
+
+    def integrate(self, scale):
+        """pos += vel * scale for every bound entity."""
+        n = self.count
+        if n:
+            data = self.data
+            data[:n, 0:2] += data[:n, 2:4] * scale
+
+    def entities_in_rect(self, rect):
+        """Entity IDs of bound transforms whose position lies inside ``rect``."""
+        n = self.count
+        if not n:
+            return []
+        xs = self.data[:n, 0]
+        ys = self.data[:n, 1]
+        mask = (xs >= rect.left) & (xs < rect.right) & (ys >= rect.top) & (ys < rect.bottom)
+        entities = self.entities
+        return [entities[i] for i in np.flatnonzero(mask)]
+
+    def distances_sq_to(self, x, y):
+        """Squared distance from (x, y) to every bound transform, aligned with ``self.entities``."""
+        n = self.count
+        dx = self.data[:n, 0] - x
+        dy = self.data[:n, 1] - y
+        return dx * dx + dy * dy
+
+    def entities_within(self, x, y, radius):
+        n = self.count
+        if not n:
+            return []
+        d2 = self.distances_sq_to(x, y)
+        entities = self.entities
+        return [entities[i] for i in np.flatnonzero(d2 <= radius * radius)]
@@ -4,7 +4,7 @@ from .scenes.game_scene import GameScene
 from .systems.input.input_system import Input
 from .systems.core.event_manager import EventManager
 from .systems.core.game_context import GameContext
-from .utils import INITIAL_WINDOW_SIZE
+from .utils import INITIAL_WINDOW_SIZE, SIM_HZ, MAX_SIM_STEPS, MAX_FRAME_TIME, MAX_FPS
 import pygame
 
 class Game():
@@ -25,7 +25,18 @@ class Game():
         self._screen_size = INITIAL_WINDOW_SIZE
 
         self.clock = pygame.time.Clock()
-        self.target_fps = 60
+        self.target_fps = 60  # reference rate velocities are expressed in
+
+        # Fixed-step simulation: real time is consumed in sim_dt steps and
+        # rendering interpolates between the last two (alpha)
+        self.sim_hz = SIM_HZ
+        self.sim_dt = 1.0 / SIM_HZ
+        self.max_sim_steps = MAX_SIM_STEPS
+        self.max_fps = MAX_FPS
+        self.accumulator = 0.0
+        self.alpha = 1.0
+        self.sim_steps = 0
+        self.dropped_steps = 0
 
         self.ctx = GameContext()
 
@@ -45,13 +56,35 @@ class Game():
 
         while True:
             self.calculate_dt()
-            self.update()
+            self.step_simulation()
             self.render()
             self.ctx.audio_manager.flush()
+
+    def step_simulation(self):
+        # Never feed more than MAX_FRAME_TIME of real time per frame (debugger
+        # pauses, window drags), then run as many fixed steps as it pays for
+        self.accumulator += min(self.dt, MAX_FRAME_TIME)
+        steps = 0
+        while self.accumulator >= self.sim_dt:
+            if steps == self.max_sim_steps:
+                # Spiral-of-death guard: the simulation cannot keep up, drop the
+                # backlog instead of running ever more steps per frame
+                dropped = int(self.accumulator / self.sim_dt)
+                self.dropped_steps += dropped
+                self.accumulator -= dropped * self.sim_dt
+                break
+            self.update()
+            self.accumulator -= self.sim_dt
+            steps += 1
+        self.sim_steps = steps
+        self.alpha = self.accumulator / self.sim_dt
     
     def render(self):
         self.ctx.fps = getattr(self, 'fps', 0)
         self.ctx.dt = getattr(self, 'dt', 0)
+        self.ctx.alpha = self.alpha
+        self.ctx.sim_steps = self.sim_steps
+        self.ctx.sim_hz = self.sim_hz
 
         self.ctx.scene_manager.render_scene(self.virtual_surface)
 
@@ -75,13 +108,13 @@ class Game():
     def update(self):
         self.ctx.input_system.update(self.ctx.event_manager)
 
-        # TEMP
-        self.ctx.scene_manager.update_scene(fps=self.target_fps, dt=self.dt)
+        # One fixed simulation step
+        self.ctx.scene_manager.update_scene(fps=self.target_fps, dt=self.sim_dt)
 
     def calculate_dt(self):
-        # tick() returns milliseconds passed since last call; convert to seconds
-        # ms = self.clock.tick(self.target_fps)
-        ms = self.clock.tick()
+        # tick() returns milliseconds passed since last call; convert to seconds.
+        # max_fps 0 leaves the frame rate uncapped
+        ms = self.clock.tick(self.max_fps)
         self.dt = ms / 1000.0
         # current smoothed FPS (may be 0 briefly on startup)
         self.fps = self.clock.get_fps()
\ No newline at end of file
@@ -1,7 +1,7 @@
 import pygame
 import random
 from ..components.combat import HealthComponent
-from ..utils import GameSceneEvents
+from ..utils.events import DamageEvent
 
 
 class GameHUD:
@@ -28,12 +28,12 @@ class GameHUD:
         self._ui_text_cache = None
 
         # Health bar juice trigger
-        def trigger_hb_juice(entity_id, **kwargs):
-            if entity_id == self.player:
+        def trigger_hb_juice(event):
+            if event.entity_id == self.player:
                 self.hb_scale_juice = 1.1
                 self.hb_rot_juice = random.uniform(-3, 3)
 
-        event_manager.subscribe(GameSceneEvents.DAMAGE, trigger_hb_juice)
+        event_manager.subscribe_typed(DamageEvent, trigger_hb_juice)
 
     def set_player(self, player, player_input_system, render_system):
         self.player = player
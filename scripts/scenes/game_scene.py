@@ -1,17 +1,20 @@
 import pygame, math
 
-from scripts.components.combat import HealthComponent
+from scripts.components.combat import HealthComponent, merge_damage
 from ..systems.scene.scene_manager import Scene
 from ..components.physics import Position, Velocity, CollisionComponent
 from ..ecs.component_manager import ComponentManager
 
 from ..systems.core.timer_system import TimerSystem
+from ..systems.core.system_scheduler import SystemScheduler
+from ..systems.core.region_activation import RegionActivation
 from ..ecs.entity_manager import EntityManager
 from ..ecs.entity_factory import EntityFactory
 from ..systems.input.player_input_system import PlayerInputSystem
 from ..systems.core.physics_engine import PhysicsEngine
 from ..systems.rendering.render_system import AnimationSystem, RenderSystem
 from ..systems.rendering.camera import Camera
+from ..systems.rendering.render_interpolation import RenderInterpolation
 from ..systems.combat.combat_system import CombatSystem
 from ..systems.combat.destructible_system import DestructibleSystem
 from ..systems.combat.ai_system import AISystem
@@ -23,13 +26,14 @@ from ..weapons.bullet_patterns import *
 
 from ..utils import LEVEL, Inputs, GameSceneEvents, screen_to_virtual
 from ..utils.tween import TweenSystem
-from ..utils.events import ScreenShakeEvent
+from ..utils.events import ScreenShakeEvent, DamageEvent, CollisionEvent, WalkEvent, ProjectileCollisionEvent, WaterSplashEvent
 from ..systems.gamefeel import GameFeelManager
 from ..systems.vfx import VFXManager
 
 import random
 
-from ..utils import Quadtree, VIRTUAL_WINDOW_SIZE
+from ..utils.spatial_hash import SpatialHash
+from ..systems.core.collision_grid import SOLID_COLLIDER, BODY_COLLIDER
 from ..utils.events import AnimationEvent
 from ..systems.animation.animation_event_handler import AnimationEventHandler
 
@@ -47,7 +51,13 @@ class GameScene(Scene):
         super().__init__(id="game", ctx=ctx)
         self.component_manager = ComponentManager()
         self.camera = Camera()
-        self._dynamic_quadtree = None
+        # Draws moving entities between the last two fixed simulation steps
+        self.interpolation = RenderInterpolation()
+        # Suspends entities in map regions far from the camera
+        self.region_activation = RegionActivation()
+        # Persistent broadphase for dynamic colliders, synced once per frame
+        self.dynamic_hash = SpatialHash()
+        self._collider_rows = None
 
         self.tween_system = TweenSystem()
         self.timer_system = TimerSystem(self.component_manager)
@@ -90,6 +100,16 @@ class GameScene(Scene):
         self.profiler = Profiler()
         self.debug_overlay = None
 
+        # Systems that don't need to run every frame. AI and proximity fade
+        # are sharded so their entities tick on staggered frames. Destructible
+        # stays at frame rate (it would miss fast projectiles otherwise) and is
+        # only registered for its budget report.
+        self.scheduler = SystemScheduler(self.profiler)
+        self.scheduler.add('ai', lambda dt, **kw: self.ai_system.update(dt, **kw), rate=10, shards=6, budget_ms=1.0)
+        self.scheduler.add('proximity_fade', self.render_system.proximity_fade_system.update, rate=15, shards=4, budget_ms=0.5)
+        self.scheduler.add('grass', self.render_system.update_grass, rate=30, budget_ms=3.0)
+        self.scheduler.add('destructible', self.destructible_system.update, budget_ms=0.5)
+
         self._game_time = 0.0
         self._ripple_timer = 0.0
 
@@ -114,7 +134,8 @@ class GameScene(Scene):
         self.ai_system = AISystem(
             player_entity_id=self.player,
             component_manager=self.component_manager,
-            event_manager=self.ctx.event_manager
+            event_manager=self.ctx.event_manager,
+            tile_grid=self.level.tile_grid
         )
         self.camera.set_target(self.player)
 
@@ -206,6 +227,14 @@ class GameScene(Scene):
     def _subscribe_events(self):
         em = self.ctx.event_manager
 
+        # Hot events are pooled typed events; the bridge still delivers them
+        # to (and accepts them from) kwargs-style subscribers and emitters
+        em.bridge_legacy(DamageEvent, CollisionEvent, WalkEvent, ProjectileCollisionEvent, WaterSplashEvent)
+
+        # Hot-loop events are queued and dispatched at the sync points;
+        # several hits on one target within a frame become one DamageEvent
+        em.set_coalesce(DamageEvent, key='entity_id', merge=lambda queued, new: merge_damage(self.component_manager, queued, new))
+
         # Player input — use self.player_input_system so closures stay valid after respawn
         em.subscribe(Inputs.UP, lambda: self.player_input_system.on_move("up"), source=self.player)
         em.subscribe(Inputs.DOWN, lambda: self.player_input_system.on_move("down"), source=self.player)
@@ -252,10 +281,10 @@ class GameScene(Scene):
         # --- VFX event wiring ---
         em.subscribe(GameSceneEvents.DASH_START, self._on_dash_vfx)
         em.subscribe('bomb_burst', self._on_bomb_vfx)
-        em.subscribe(GameSceneEvents.DAMAGE, self._on_damage_vfx)
+        em.subscribe_typed(DamageEvent, self._on_damage_vfx)
         em.subscribe(GameSceneEvents.DEATH, self._on_death_vfx)
-        em.subscribe(GameSceneEvents.PROJECTILE_COLLISION, self._on_projectile_vfx)
-        em.subscribe(GameSceneEvents.WATER_SPLASH, lambda **kw: self.ctx.audio_manager.play('water_splash', priority=90))
+        em.subscribe_batch(ProjectileCollisionEvent, self._on_projectile_vfx)
+        em.subscribe_batch(WaterSplashEvent, lambda batch: self.ctx.audio_manager.play('water_splash', priority=90))
 
     # ------------------------------------------------------------------
     # Callbacks
@@ -326,11 +355,12 @@ class GameScene(Scene):
                         sway=True, gravity=50,
                     )
 
-    def _on_damage_vfx(self, entity_id, **kw):
-        if self.vfx_manager and not kw.get('death'):
-            self.vfx_manager.play('player_damage', entity_id=entity_id, **kw)
-        if not kw.get('death'):
-            self.ctx.audio_manager.play('player_hit', group='player', priority=200)
+    def _on_damage_vfx(self, event):
+        if event.death:
+            return
+        if self.vfx_manager:
+            self.vfx_manager.play('player_damage', entity_id=event.entity_id)
+        self.ctx.audio_manager.play('player_hit', group='player', priority=200)
 
     def _on_death_vfx(self, entity_id, **kw):
         # Player death is handled by the respawn system
@@ -339,9 +369,12 @@ class GameScene(Scene):
         if entity_id != self.player:
             self.ctx.audio_manager.play('explosion', priority=200)
 
-    def _on_projectile_vfx(self, **kw):
+    def _on_projectile_vfx(self, batch):
         if self.vfx_manager:
-            self.vfx_manager.play('projectile_impact', **kw)
+            for event in batch:
+                self.vfx_manager.play('projectile_impact', pos=event.pos, vel=event.vel,
+                                      target_type=event.target_type, size=event.size)
+        # One impact sound per batch, however many projectiles hit
         self.ctx.audio_manager.play('enemy_hit', priority=150)
 
     # ------------------------------------------------------------------
@@ -349,9 +382,14 @@ class GameScene(Scene):
     # ------------------------------------------------------------------
 
     def update(self, fps, dt):
+        # Positions before this step, for interpolated rendering
+        self.interpolation.capture(self.component_manager)
+        self.camera.store_previous()
+
         # Debug overlay toggle
         self._handle_debug_toggles()
         self.profiler.begin_frame()
+        self.scheduler.begin_frame()
 
         # Death gate — skip all updates while dead
         if self.respawn_manager.update_death_gate(dt, self._respawn):
@@ -370,22 +408,25 @@ class GameScene(Scene):
         self._update_tree_shakes(raw_dt)
 
         if dt > 0:
-            self.profiler.begin('ai')
-            self.ai_system.update(dt)
-            self.profiler.end('ai')
+            # Suspend / resume by region; applied at the sync point after AI
+            self.region_activation.update(self.component_manager, self.camera.rect, (self.player,))
+            self.scheduler.run('ai', dt)
+            self.entity_manager.flush_commands()
 
             self.profiler.begin('physics')
             self.timer_system.update(dt)
             self._update_water_status()
-            dynamic_quadtree = self._build_dynamic_quadtree()
+            dynamic_hash = self._sync_dynamic_hash()
             self.player_input_system.update(self.component_manager, dt)
             self.physics_engine.update(
                 self.camera.scroll, fps, dt,
                 is_dashing=self.player_input_system.is_dashing,
                 player_id=self.player,
-                static_quadtree=self.level.static_quadtree,
-                dynamic_quadtree=dynamic_quadtree
+                tile_grid=self.level.tile_grid,
+                dynamic_hash=dynamic_hash
             )
+            self.ctx.event_manager.dispatch_queued()
+            self.entity_manager.flush_commands()
             self.profiler.end('physics')
 
             self.profiler.begin('combat')
@@ -393,8 +434,8 @@ class GameScene(Scene):
                 event_manager=self.ctx.event_manager,
                 component_manager=self.component_manager,
                 scroll=self.camera.scroll, dt=dt, fps=fps,
-                static_quadtree=self.level.static_quadtree,
-                dynamic_quadtree=dynamic_quadtree,
+                tile_grid=self.level.tile_grid,
+                dynamic_hash=dynamic_hash,
                 particle_system=self.render_system.particle_effect_system,
                 is_dashing=self.player_input_system.is_dashing,
                 player_id=self.player,
@@ -402,7 +443,9 @@ class GameScene(Scene):
                 game_time=self._game_time
             )
             self._game_time += dt
-            self.destructible_system.update(dt, self.player)
+            self.scheduler.run('destructible', dt, player_id=self.player)
+            self.ctx.event_manager.dispatch_queued()
+            self.entity_manager.flush_commands()
             self.profiler.end('combat')
 
             self.profiler.begin('particles')
@@ -416,6 +459,8 @@ class GameScene(Scene):
             self.profiler.begin('rendering')
             scaled_mouse = screen_to_virtual(pygame.mouse.get_pos())
             self.render_system.update(dt, tilemap=self.level.tilemap, camera=self.camera, mouse_pos=scaled_mouse)
+            self.scheduler.run('proximity_fade', dt)
+            self.scheduler.run('grass', dt, camera=self.camera)
             self.entity_manager.refresh_entities(dt=dt)
             if self.level and self.level.tilemap:
                 try:
@@ -431,6 +476,9 @@ class GameScene(Scene):
         if self.gamefeel:
             self.gamefeel.update(raw_dt)
         self.profiler.end('gamefeel')
+        self.scheduler.end_frame()
+        if self.ctx.event_manager.instrumentation is not None:
+            self.ctx.event_manager.instrumentation.end_frame()
 
     # ------------------------------------------------------------------
     # Sub-updates
@@ -442,6 +490,11 @@ class GameScene(Scene):
                 self.debug_overlay.toggle()
             if pygame.K_F4 in self.ctx.input_system.keys_pressed:
                 self.debug_overlay.toggle_profiler()
+            if pygame.K_F5 in self.ctx.input_system.keys_pressed:
+                em = self.ctx.event_manager
+                em.enable_instrumentation(em.instrumentation is None)
+            if pygame.K_F6 in self.ctx.input_system.keys_pressed and self.ctx.event_manager.instrumentation:
+                self.ctx.event_manager.instrumentation.export('event_stats.json')
 
     def _update_water_status(self):
         if not hasattr(self, 'player_input_system'):
@@ -465,20 +518,18 @@ class GameScene(Scene):
         self.player_input_system.on_water_completely = (water_count == len(points))
         self.player_input_system.on_land_completely = (water_count == 0)
 
-    def _build_dynamic_quadtree(self):
-        qtree_bounds = (*self.camera.scroll, *VIRTUAL_WINDOW_SIZE)
-        if self._dynamic_quadtree is None:
-            self._dynamic_quadtree = Quadtree(0, qtree_bounds)
-        else:
-            self._dynamic_quadtree.clear()
-            self._dynamic_quadtree.bounds = qtree_bounds
-        for entity in self.component_manager.get_entities_with(CollisionComponent, Position):
-            comp = self.component_manager.get(entity, CollisionComponent)
-            pos = self.component_manager.get(entity, Position)
-            rect = pygame.Rect(pos.x + comp.offset.x, pos.y + comp.offset.y,
-                               comp.size.x, comp.size.y)
-            self._dynamic_quadtree.insert(entity, rect)
-        return self._dynamic_quadtree
+    def _sync_dynamic_hash(self):
+        grid = self.dynamic_hash
+        rows = self.component_manager.query(CollisionComponent, Position)
+        if rows is not self._collider_rows:
+            # The cached query was rebuilt: colliders were added or removed
+            self._collider_rows = rows
+            grid.retain({row[0] for row in rows})
+        update = grid.update
+        for entity, comp, pos in rows:
+            offset, size = comp.offset, comp.size
+            update(entity, pos.x + offset.x, pos.y + offset.y, size.x, size.y, SOLID_COLLIDER if comp.solid else BODY_COLLIDER)
+        return grid
 
     def _update_water_ripples(self, dt):
         if not self.level or not self.level.tilemap:
@@ -489,11 +540,10 @@ class GameScene(Scene):
             return
         self._ripple_timer = 0.0
         p_sys = self.combat_system.projectile_system
-        if hasattr(p_sys, 'active_indices'):
-            for idx in p_sys.active_indices:
-                p = p_sys.pool[idx]
-                if self.respawn_manager.is_pos_in_water((p.x, p.y)):
-                    tilemap.add_ripple(p.x, p.y, vx=p.vx, vy=p.vy)
+        if hasattr(p_sys, 'bodies'):
+            for x, y, vx, vy, _ in p_sys.bodies():
+                if self.respawn_manager.is_pos_in_water((x, y)):
+                    tilemap.add_ripple(x, y, vx=vx, vy=vy)
         if self.player_input_system.is_dashing:
             p_pos = self.component_manager.get(self.player, Position)
             if p_pos and self.respawn_manager.is_pos_in_water(p_pos.vec):
@@ -538,28 +588,23 @@ class GameScene(Scene):
 
     def _respawn(self):
         self.component_manager.clear_all()
-        self.entity_manager.entities.clear()
-        self.entity_manager.to_remove.clear()
-        self.entity_manager.dead_entities.clear()
-        self.entity_manager.player_id = None
+        self.entity_manager.release_all()
 
         ps = self.render_system.particle_effect_system
         ps.active_indices.clear()
         ps.pool.reset()
         ps._particle_cache.clear()
 
-        fpps = self.combat_system.projectile_system
-        fpps.active_indices.clear()
-        fpps.pool.reset()
-        fpps._pulse_cache.clear()
-        fpps._shared_hits.clear()
-        fpps._shared_seen.clear()
+        self.combat_system.projectile_system.clear()
 
         self.render_system._pulse_cache.clear()
         self.render_system._sprite_transform_cache.clear()
         self.render_system.grass_system.blades.clear()
         self.render_system.grass_system._render_cache.clear()
         self._tree_shakes.clear()
+        self.scheduler.reset()
+        self.interpolation.clear()
+        self.region_activation.reset()
 
         self.camera = Camera()
 
@@ -574,7 +619,8 @@ class GameScene(Scene):
         self.ai_system = AISystem(
             player_entity_id=self.player,
             component_manager=self.component_manager,
-            event_manager=self.ctx.event_manager
+            event_manager=self.ctx.event_manager,
+            tile_grid=self.level.tile_grid
         )
         self.camera.set_target(self.player)
 
@@ -595,10 +641,19 @@ class GameScene(Scene):
     # ------------------------------------------------------------------
 
     def render(self, surface):
+        # Draw between the last two simulation steps, then restore the simulated state
+        alpha = self.ctx.alpha
+        self.interpolation.apply(alpha)
+        self.camera.set_render_alpha(alpha, self.interpolation.snap_distance)
+        self.combat_system.projectile_system.render_alpha = alpha
+
         self.render_system.render(surface, self.level.tilemap, self.camera)
         if hasattr(self, 'combat_system') and self.combat_system.attack_pattern_system:
             self.combat_system.attack_pattern_system.render_telegraphs(surface, self.camera)
 
+        self.interpolation.restore()
+        self.camera.set_render_alpha(1.0)
+
     def render_ui(self, screen):
         if self.hud:
             self.hud.render_ui(screen, self.ctx)
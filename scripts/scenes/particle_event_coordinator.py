@@ -1,11 +1,11 @@
 import math
 import random
-import pygame
 from ..components.physics import Position
 from ..components.render_effect import RenderEffectComponent, YSortRender
 from ..components.animation import RenderComponent
 from ..components.timer import TimerComponent
 from ..utils import GameSceneEvents
+from ..utils.events import DamageEvent, ProjectileCollisionEvent, WalkEvent, WaterSplashEvent
 
 
 class ParticleEventCoordinator:
@@ -13,6 +13,9 @@ class ParticleEventCoordinator:
 
     Keeps particle response logic out of GameScene so it can be reused
     across scenes and tested independently.
+
+    Hot events arrive as pooled typed events: handlers read them and never
+    keep a reference past the call.
     """
 
     def __init__(self, render_system, component_manager, entity_manager):
@@ -21,11 +24,11 @@ class ParticleEventCoordinator:
         self.entity_manager = entity_manager
 
     def subscribe_all(self, event_manager):
-        event_manager.subscribe(GameSceneEvents.PROJECTILE_COLLISION, self._on_projectile_collision)
-        event_manager.subscribe(GameSceneEvents.WALK, self._on_walk)
-        event_manager.subscribe(GameSceneEvents.WATER_SPLASH, self._on_water_splash)
+        event_manager.subscribe_typed(ProjectileCollisionEvent, self._on_projectile_collision)
+        event_manager.subscribe_typed(WalkEvent, self._on_walk)
+        event_manager.subscribe_typed(WaterSplashEvent, self._on_water_splash)
         event_manager.subscribe(GameSceneEvents.SPAWN_GHOST, self._on_spawn_ghost)
-        event_manager.subscribe(GameSceneEvents.DAMAGE, self._on_damage_particles)
+        event_manager.subscribe_typed(DamageEvent, self._on_damage_particles)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -56,15 +59,7 @@ class ParticleEventCoordinator:
                 fade=False, shrink=shrink, friction=friction
             )
 
-    # ------------------------------------------------------------------
-    # Event handlers
-    # ------------------------------------------------------------------
-
-    def _on_projectile_collision(self, **kwargs):
-        pos = kwargs.get('pos')
-        vel = kwargs.get('vel')
-        target_type = kwargs.get('target_type')
-        size = kwargs.get('size', 10.0)
+    def _emit_impact(self, pos, vel, target_type, size):
         if not pos or not vel:
             return
 
@@ -86,10 +81,16 @@ class ParticleEventCoordinator:
             spread_deg=60.0, lifetime=0.6, friction=0.8, shrink=True
         )
 
-    def _on_walk(self, **kwargs):
-        pos = kwargs.get('pos')
-        vel = kwargs.get('vel')
-        if not pos or not vel:
+    # ------------------------------------------------------------------
+    # Event handlers
+    # ------------------------------------------------------------------
+
+    def _on_projectile_collision(self, event: ProjectileCollisionEvent):
+        self._emit_impact(event.pos, event.vel, event.target_type, event.size)
+
+    def _on_walk(self, event: WalkEvent):
+        pos = event.pos
+        if not pos or not event.vel:
             return
 
         if self.render_system.particle_effect_system:
@@ -103,10 +104,8 @@ class ParticleEventCoordinator:
                     fade=False, shrink=True, friction=0.85
                 )
 
-    def _on_water_splash(self, **kwargs):
-        pos = kwargs.get('pos')
-        vel = kwargs.get('vel')
-        size = kwargs.get('size', 10.0)
+    def _on_water_splash(self, event: WaterSplashEvent):
+        pos, vel, size = event.pos, event.vel, event.size
         if not pos or not vel:
             return
 
@@ -137,13 +136,8 @@ class ParticleEventCoordinator:
         self.component_manager.add(ghost_id, YSortRender(ghost_id, offset=(0, 0)))
         self.component_manager.add(ghost_id, TimerComponent(0.4, lambda: self.entity_manager.delete_entity(ghost_id)))
 
-    def _on_damage_particles(self, entity_id, proj_id, **args):
-        pos_comp = self.component_manager.get(entity_id, Position)
+    def _on_damage_particles(self, event: DamageEvent):
+        pos_comp = self.component_manager.get(event.entity_id, Position)
         if not pos_comp:
             return
-        self._on_projectile_collision(
-            pos=pos_comp.vec.copy(),
-            vel=args.get('proj_vel', pygame.Vector2(0, 0)),
-            target_type="enemy",
-            size=10.0
-        )
+        self._emit_impact(pos_comp.vec, event.proj_vel, "enemy", 10.0)
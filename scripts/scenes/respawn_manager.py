@@ -1,6 +1,7 @@
 import pygame
 from ..utils import TILE_SIZE
 from ..components.physics import Position, Velocity, CollisionComponent
+from ..systems.core.collision_grid import WATER_TILE
 
 
 class RespawnManager:
@@ -50,64 +51,24 @@ class RespawnManager:
     # Water helpers
     # ------------------------------------------------------------------
 
+    def _tile_grid(self):
+        return getattr(self.level, 'tile_grid', None) if self.level else None
+
     def is_pos_in_water(self, pos):
-        if not self.level or not self.level.tilemap:
-            return False
-        water_layer = self.level.tilemap.layers.get("water")
-        if not water_layer:
-            return False
-        chunk_pos = (
-            int(pos[0] // (self.level.tilemap.CHUNK_SIZE * TILE_SIZE)) * (self.level.tilemap.CHUNK_SIZE * TILE_SIZE),
-            int(pos[1] // (self.level.tilemap.CHUNK_SIZE * TILE_SIZE)) * (self.level.tilemap.CHUNK_SIZE * TILE_SIZE)
-        )
-        chunk = water_layer.get(chunk_pos)
-        if chunk:
-            for tdata in chunk.values():
-                if tdata["rect"].collidepoint(pos[0], pos[1]):
-                    return True
-        return False
+        grid = self._tile_grid()
+        return bool(grid and grid.flags_at(pos[0], pos[1]) & WATER_TILE)
 
     def any_pos_in_water(self, points):
-        if not self.level or not self.level.tilemap:
-            return False
-        water_layer = self.level.tilemap.layers.get("water")
-        if not water_layer:
+        grid = self._tile_grid()
+        if not grid:
             return False
-        seen_chunks = {}
-        for pos in points:
-            cx = int(pos[0] // (self.level.tilemap.CHUNK_SIZE * TILE_SIZE)) * (self.level.tilemap.CHUNK_SIZE * TILE_SIZE)
-            cy = int(pos[1] // (self.level.tilemap.CHUNK_SIZE * TILE_SIZE)) * (self.level.tilemap.CHUNK_SIZE * TILE_SIZE)
-            ck = (cx, cy)
-            if ck not in seen_chunks:
-                seen_chunks[ck] = water_layer.get(ck)
-            chunk = seen_chunks[ck]
-            if chunk:
-                for tdata in chunk.values():
-                    if tdata["rect"].collidepoint(pos[0], pos[1]):
-                        return True
-        return False
+        return any(grid.flags_at(pos[0], pos[1]) & WATER_TILE for pos in points)
 
     def count_pos_in_water(self, points):
-        if not self.level or not self.level.tilemap:
-            return 0
-        water_layer = self.level.tilemap.layers.get("water")
-        if not water_layer:
+        grid = self._tile_grid()
+        if not grid:
             return 0
-        count = 0
-        seen_chunks = {}
-        for pos in points:
-            cx = int(pos[0] // (self.level.tilemap.CHUNK_SIZE * TILE_SIZE)) * (self.level.tilemap.CHUNK_SIZE * TILE_SIZE)
-            cy = int(pos[1] // (self.level.tilemap.CHUNK_SIZE * TILE_SIZE)) * (self.level.tilemap.CHUNK_SIZE * TILE_SIZE)
-            ck = (cx, cy)
-            if ck not in seen_chunks:
-                seen_chunks[ck] = water_layer.get(ck)
-            chunk = seen_chunks[ck]
-            if chunk:
-                for tdata in chunk.values():
-                    if tdata["rect"].collidepoint(pos[0], pos[1]):
-                        count += 1
-                        break
-        return count
+        return sum(1 for pos in points if grid.flags_at(pos[0], pos[1]) & WATER_TILE)
 
     def is_tile_walkable(self, x, y):
         if self.is_pos_in_water((x, y)):
@@ -172,37 +133,26 @@ class RespawnManager:
         start_vec = pygame.Vector2(respawn_pos)
         curr_vec = pygame.Vector2(pos.x, pos.y)
         direction = start_vec - curr_vec
-
-        if direction.length_squared() > 0:
-            direction_norm = direction.normalize()
-            dist = direction.length()
-            step = 2.0
-            safe_found = False
-            test_vec = curr_vec.copy()
-            for _ in range(int(dist / step) + 1):
-                left = test_vec.x + p_col.offset.x
-                top = test_vec.y + p_col.offset.y
-                right = left + p_col.size.x
-                bottom = top + p_col.size.y
-                cx = left + p_col.size.x / 2.0
-                cy = top + p_col.size.y / 2.0
-                pts = [(cx, cy), (left + 2, top + 2), (right - 2, top + 2),
-                       (left + 2, bottom - 2), (right - 2, bottom - 2)]
-                if not self.any_pos_in_water(pts):
-                    safe_found = True
-                    break
-                test_vec += direction_norm * step
-            if safe_found:
-                p_pos.vec.update(test_vec + direction_norm * 2.0)
+        grid = self._tile_grid()
+
+        if grid is not None and direction.length_squared() > 0:
+            # Cast the collider (inset like the water probe points) toward the
+            # respawn point and stop at the first spot where it leaves the water
+            inset = 2
+            t = grid.exit_time(pos.x + p_col.offset.x + inset, pos.y + p_col.offset.y + inset,
+                               p_col.size.x - inset * 2, p_col.size.y - inset * 2,
+                               direction.x, direction.y, WATER_TILE)
+            if t is not None:
+                p_pos.vec = curr_vec + direction * t + direction.normalize() * 2.0
             else:
-                p_pos.vec.update(respawn_pos)
+                p_pos.vec = pygame.Vector2(respawn_pos)
         else:
-            p_pos.vec.update(respawn_pos)
+            p_pos.vec = pygame.Vector2(respawn_pos)
 
         self.render_system.render_effect_system.trigger_flash(eid)
         p_vel = self.component_manager.get(eid, Velocity)
         if p_vel:
-            p_vel.vec.update(0, 0)
+            p_vel.vec = (0, 0)
 
     def _spiral_rescue(self, eid, pos):
         safe_pos = None
@@ -234,10 +184,10 @@ class RespawnManager:
             if p_pos:
                 dist = pos.distance_to(safe_pos)
                 if dist < 16:
-                    p_pos.vec.update(safe_pos)
+                    p_pos.vec = pygame.Vector2(safe_pos)
                 else:
-                    p_pos.vec.update(safe_pos)
+                    p_pos.vec = pygame.Vector2(safe_pos)
                     self.render_system.render_effect_system.trigger_flash(eid)
                     p_vel = self.component_manager.get(eid, Velocity)
                     if p_vel:
-                        p_vel.vec.update(0, 0)
+                        p_vel.vec = (0, 0)
@@ -9,7 +9,7 @@ the ``event`` string so that animation authors do not need to know about
 the engine's internal event types.
 
 Registered event names (extensible):
-    - footstep        →  emit GameSceneEvents.WALK (dust particles)
+    - footstep        →  emit WalkEvent (dust particles)
     - shoot           →  emit SHOOT event (legacy path)
     - spawn_particle  →  spawn a simple particle burst
     - play_sound      →  play a named sound
@@ -17,7 +17,7 @@ Registered event names (extensible):
 
 from ...components.physics import Position, Velocity
 from ...utils import GameSceneEvents
-from ...utils.events import AnimationEvent
+from ...utils.events import AnimationEvent, WalkEvent
 
 
 class AnimationEventHandler:
@@ -61,12 +61,9 @@ class AnimationEventHandler:
         pos = self.component_manager.get(event.entity_id, Position)
         vel = self.component_manager.get(event.entity_id, Velocity)
         if pos:
-            self.event_manager.emit(
-                GameSceneEvents.WALK,
-                pos=pos.vec,
-                vel=vel.vec if vel else (0, 0),
-                entity_id=event.entity_id,
-            )
+            vx, vy = (vel.vec.x, vel.vec.y) if vel else (0.0, 0.0)
+            walk = self.event_manager.acquire(WalkEvent).fill(event.entity_id, pos.vec.x, pos.vec.y, vx, vy)
+            self.event_manager.emit_pooled(walk)
 
     def _on_shoot(self, event: AnimationEvent):
         self.event_manager.emit(
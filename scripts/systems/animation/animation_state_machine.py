@@ -2,13 +2,15 @@ from ...components.animation import AnimationComponent
 from ...utils import GameSceneEvents
 
 class AnimationStateMachine:
+    __slots__ = ('entity_id', 'component_manager', 'animation_priority_list', 'transitions')
+
     def __init__(self, entity_id, component_manager, event_manager, animation_priority_list, transitions={}):
         self.entity_id = entity_id
         self.component_manager = component_manager
         self.animation_priority_list = animation_priority_list
         self.transitions = transitions
         
-        event_manager.subscribe(GameSceneEvents.ANIMATION_FINISHED, self.on_animation_finished, source=self.entity_id)
+        event_manager.subscribe_for(self.entity_id, GameSceneEvents.ANIMATION_FINISHED, self.on_animation_finished)
 
     def on_animation_finished(self, entity_id, animation_id):
         if entity_id != self.entity_id:
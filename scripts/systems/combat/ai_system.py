@@ -2,6 +2,9 @@ from scripts.components.combat import AttackPatternComponent
 from ...components.ai import AIComponent
 from ...components.physics import Position, Velocity, CollisionComponent
 from ...components.timer import TimerComponent
+from ...components.tags import SuspendedTagComponent
+from ...ecs.sparse_set import ENTITY_INDEX_MASK
+from ..core.collision_grid import WALL_TILE
 
 from ...utils import EnemyState, GameSceneEvents
 
@@ -10,10 +13,12 @@ import pygame, random, math
 # TEMP : GET RID OF THE MAGIC NUMBRES IN THE AI FUNCS
 
 class AISystem:
-    def __init__(self, player_entity_id, component_manager, event_manager):
+    def __init__(self, player_entity_id, component_manager, event_manager, tile_grid=None):
         self.player_entity_id = player_entity_id
         self.component_manager = component_manager
         self.event_manager = event_manager
+        self.tile_grid = tile_grid  # walls block perception when set
+        self._ticked = []           # [(eid, ai_comp, pos)] of the current tick
         self.AI_FUNCS = {
             "default": self._default_behavior,
             "chase": self._chase_behavior,
@@ -69,7 +74,7 @@ class AISystem:
                 dir = (target_pos - pos.vec).normalize()
                 vel.vec = dir * ai_comp.data["speed"]
 
-                if pos.vec.distance_to(player_pos.vec) <= ai_comp.data["attack_dist"]:
+                if pos.vec.distance_to(player_pos.vec) <= ai_comp.data["attack_dist"] and ai_comp.sees_player:
                     vel.vec = (0, 0)
                     ai_comp.state = EnemyState.ATTACK
                     ai_comp.timer = 0
@@ -277,7 +282,7 @@ class AISystem:
                 dir = (pos.vec - target_pos).normalize()
                 vel.vec = dir * ai_comp.data["speed"]
 
-                if pos.vec.distance_to(player_pos.vec) > 500:
+                if pos.vec.distance_to(player_pos.vec) > 500 and ai_comp.sees_player:
                     vel.vec = (0, 0)
                     ai_comp.state = EnemyState.ATTACK
                     ai_comp.timer = 0
@@ -294,17 +299,45 @@ class AISystem:
     def _patrol_behavior(self, eid, ai_comp, dt):
         print('patrolling', ai_comp.state)
 
-    def update(self, dt):
-        for eid in self.component_manager.get_entities_with(AIComponent):
-            ai_comp = self.component_manager.get(eid, AIComponent)
-            if ai_comp is None:
+    def update(self, dt, shard=0, shard_count=1):
+        # When sharded by the scheduler only entities of this shard are ticked;
+        # dt is then the time since this shard's last tick
+        ticked = self._ticked
+        ticked.clear()
+        for arch in self.component_manager.get_archetypes_with(AIComponent, Position):
+            if SuspendedTagComponent in arch.types:
                 continue
+            for eid, ai_comp, pos in zip(arch.entities, arch.columns[AIComponent], arch.columns[Position]):
+                if shard_count > 1 and (eid & ENTITY_INDEX_MASK) % shard_count != shard:
+                    continue
+                if ai_comp.state == EnemyState.DEAD:
+                    continue
+                ticked.append((eid, ai_comp, pos))
 
-            if ai_comp.state == EnemyState.DEAD:
-                continue
-            
+        self._update_perception(ticked)
+
+        for eid, ai_comp, pos in ticked:
             ai_comp.timer += dt
 
             self.AI_FUNCS.get(ai_comp.behavior, self._default_behavior)(eid, ai_comp, dt)
 
-            
+            # No shooting at a player behind a wall
+            if not ai_comp.sees_player:
+                apc = self.component_manager.get(eid, AttackPatternComponent)
+                if apc: apc.active = False
+
+    def _update_perception(self, ticked):
+        """Refresh ``sees_player`` for the ticked entities with one batched raycast."""
+        player_pos = self.component_manager.get(self.player_entity_id, Position)
+        if self.tile_grid is None or player_pos is None or not ticked:
+            for _, ai_comp, _ in ticked:
+                ai_comp.sees_player = True
+            return
+        px, py = player_pos.x, player_pos.y
+        count = len(ticked)
+        visible = self.tile_grid.visible_many(
+            [pos.x for _, _, pos in ticked], [pos.y for _, _, pos in ticked],
+            [px] * count, [py] * count, WALL_TILE
+        )
+        for (_, ai_comp, _), sees in zip(ticked, visible):
+            ai_comp.sees_player = bool(sees)
@@ -2,7 +2,9 @@ import pygame, math
 from ...components.combat import AttackPatternComponent
 from ...components.physics import Position, Velocity
 from ...components.ai import AIComponent
+from ...components.tags import SuspendedTagComponent
 from ...utils import CollisionLayer
+from ...weapons.bullet_patterns import compile_projectile_template
 
 class AttackPatternSystem:
     def __init__(self, component_manager, entity_manager, resource_manager):
@@ -16,65 +18,68 @@ class AttackPatternSystem:
     def update(self, dt, projectile_system=None, game_time=0.0):
         self.projectile_system = projectile_system
         self._telegraph_items.clear()
-        for eid in self.component_manager.get_entities_with(AttackPatternComponent):
-            apc = self.component_manager.get(eid, AttackPatternComponent)
-            if apc.disabled or not apc.active:
+        for arch in self.component_manager.get_archetypes_with(AttackPatternComponent):
+            # Suspended archetypes (far from the camera) hold their patterns
+            if SuspendedTagComponent in arch.types:
                 continue
+            for eid, apc in zip(arch.entities, arch.columns[AttackPatternComponent]):
+                if apc.disabled or not apc.active:
+                    continue
 
-            pattern = apc.current
-
-            # ---- Pattern selection on transition ----
-            if pattern.shoot_timer == 0 and not pattern.warmed:
-                pos = self.component_manager.get(eid, Position)
-                player_pos = None
-                if pos:
-                    player_pos = self.component_manager.get(self.entity_manager.player_id, Position)
-                dist = pos.vec.distance_to(player_pos.vec) if (pos and player_pos) else 0
-                apc.select_pattern(dist, game_time)
                 pattern = apc.current
 
-            # Warmup phase — telegraph + optional dash
-            if pattern.warmup > 0 and not pattern.warmed:
-                pattern.shoot_timer += dt
-                pos = self.component_manager.get(eid, Position)
-                if pos:
-                    progress = pattern.shoot_timer / pattern.warmup
-                    player_pos = self.component_manager.get(self.entity_manager.player_id, Position)
-                    if player_pos and pattern.projectile_data.get("towards_player"):
-                        target = player_pos.vec
-                        # Dash toward player during warmup if dash_speed is set
+                # ---- Pattern selection on transition ----
+                if pattern.shoot_timer == 0 and not pattern.warmed:
+                    pos = self.component_manager.get(eid, Position)
+                    player_pos = None
+                    if pos:
+                        player_pos = self.component_manager.get(self.entity_manager.player_id, Position)
+                    dist = pos.vec.distance_to(player_pos.vec) if (pos and player_pos) else 0
+                    apc.select_pattern(dist, game_time)
+                    pattern = apc.current
+
+                # Warmup phase — telegraph + optional dash
+                if pattern.warmup > 0 and not pattern.warmed:
+                    pattern.shoot_timer += dt
+                    pos = self.component_manager.get(eid, Position)
+                    if pos:
+                        progress = pattern.shoot_timer / pattern.warmup
+                        player_pos = self.component_manager.get(self.entity_manager.player_id, Position)
+                        if player_pos and pattern.projectile_data.get("towards_player"):
+                            target = player_pos.vec
+                            # Dash toward player during warmup if dash_speed is set
+                            dash_speed = pattern.projectile_data.get("dash_speed") or 0
+                            if dash_speed > 0:
+                                vel = self.component_manager.get(eid, Velocity)
+                                if vel:
+                                    dir_vec = (target - pos.vec).normalize()
+                                    vel.vec = dir_vec * dash_speed
+                        else:
+                            target = pos.vec + pygame.Vector2(1, 0)
+                        self._telegraph_items.append((target.x, target.y, progress, pattern.tier, eid))
+                    if pattern.shoot_timer >= pattern.warmup:
+                        # Stop dash after warmup ends
                         dash_speed = pattern.projectile_data.get("dash_speed") or 0
                         if dash_speed > 0:
                             vel = self.component_manager.get(eid, Velocity)
                             if vel:
-                                dir_vec = (target - pos.vec).normalize()
-                                vel.vec = dir_vec * dash_speed
-                    else:
-                        target = pos.vec + pygame.Vector2(1, 0)
-                    self._telegraph_items.append((target.x, target.y, progress, pattern.tier, eid))
-                if pattern.shoot_timer >= pattern.warmup:
-                    # Stop dash after warmup ends
-                    dash_speed = pattern.projectile_data.get("dash_speed") or 0
-                    if dash_speed > 0:
-                        vel = self.component_manager.get(eid, Velocity)
-                        if vel:
-                            vel.vec = (0, 0)
-                    pattern.warmed = True
-                    pattern.shoot_timer = 0
-                continue
+                                vel.vec = (0, 0)
+                        pattern.warmed = True
+                        pattern.shoot_timer = 0
+                    continue
 
-            pattern.shoot_timer += dt
-            if pattern.duration is not None:
-                pattern.phase_timer += dt
+                pattern.shoot_timer += dt
+                if pattern.duration is not None:
+                    pattern.phase_timer += dt
 
-            if pattern.shoot_timer >= pattern.cooldown:
-                pattern.shoot_timer = 0
-                self._fire(eid, pattern)
+                if pattern.shoot_timer >= pattern.cooldown:
+                    pattern.shoot_timer = 0
+                    self._fire(eid, pattern)
 
-            if pattern.duration is not None and pattern.phase_timer >= pattern.duration:
-                pattern.phase_timer = 0
-                pattern.shoot_timer = 0
-                pattern.warmed = False
+                if pattern.duration is not None and pattern.phase_timer >= pattern.duration:
+                    pattern.phase_timer = 0
+                    pattern.shoot_timer = 0
+                    pattern.warmed = False
 
     def render_telegraphs(self, surface, camera):
         if not self._telegraph_items:
@@ -106,20 +111,33 @@ class AttackPatternSystem:
         if not pos:
             return
 
-        data = pattern.projectile_data.copy()
+        # The shot dict and its compiled template are built once per pattern
+        # (and again for a new player, the homing target); shots only move
+        # start_pos and target_pos
+        player_id = self.entity_manager.player_id
+        data = pattern.shot_data
+        if data is None or data["player_id"] != player_id:
+            data = pattern.shot_data = self._shot_data(pattern.projectile_data, player_id)
         data["start_pos"] = pos.vec.copy()
-        data["layer"] = CollisionLayer.ENEMY
-        data["mask"] = CollisionLayer.create_mask(CollisionLayer.PLAYER)
 
         if data.get("towards_player"):
-            player_pos = self.component_manager.get(self.entity_manager.player_id, Position)
+            player_pos = self.component_manager.get(player_id, Position)
             data["target_pos"] = player_pos.vec.copy() if player_pos else pos.vec + pygame.Vector2(1, 0)
         else:
             data["target_pos"] = pos.vec + pygame.Vector2(1, 0)
 
+        pattern.shoot_fn(eid, self.component_manager, self.entity_manager, self.resource_manager, data, getattr(self, "projectile_system", None))
+
+    def _shot_data(self, projectile_data, player_id):
+        data = projectile_data.copy()
+        data["player_id"] = player_id
+        data["layer"] = CollisionLayer.ENEMY
+        data["mask"] = CollisionLayer.create_mask(CollisionLayer.PLAYER)
+
         # Inject player entity ID for homing modifiers
         mods = data.get("modifiers")
         if mods and mods.get("homing_strength", 0) > 0:
-            mods["homing_target_id"] = self.entity_manager.player_id
+            data["modifiers"] = {**mods, "homing_target_id": player_id}
 
-        pattern.shoot_fn(eid, self.component_manager, self.entity_manager, self.resource_manager, data, getattr(self, "projectile_system", None))
\ No newline at end of file
+        data["template"] = compile_projectile_template(self.resource_manager, data)
+        return data
@@ -29,15 +29,11 @@ class DestructibleSystem:
 
         projectiles = []
         if self.projectile_system:
-            for pool_idx in self.projectile_system.active_indices:
-                p = self.projectile_system.pool[pool_idx]
-                if p.active:
-                    pr = p.size / 2
-                    projectiles.append((p, pool_idx, pygame.Rect(p.x - pr, p.y - pr, p.size, p.size)))
+            for x, y, _, _, size in self.projectile_system.bodies():
+                pr = size / 2
+                projectiles.append(pygame.Rect(x - pr, y - pr, size, size))
 
-        for eid in list(self.component_manager.get_entities_with(DestructibleComponent)):
-            if eid not in self.component_manager._components.get(DestructibleComponent, {}):
-                continue
+        for eid in self.component_manager.get_entities_with(DestructibleComponent):
             dc = self.component_manager.get(eid, DestructibleComponent)
             pos = pos_dict.get(eid)
             col = col_dict.get(eid)
@@ -55,7 +51,7 @@ class DestructibleSystem:
 
                 if not destroyed and col:
                     d_rect = pygame.Rect(*(pos.vec + col.offset), *col.size)
-                    for p, pool_idx, pr in projectiles:
+                    for pr in projectiles:
                         if pr.colliderect(d_rect):
                             dc.shatter(pos.x, pos.y, 60.0)
                             if self.particle_system:
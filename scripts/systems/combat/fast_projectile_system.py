@@ -1,7 +1,32 @@
 import pygame
 import math
-from ...utils import GameSceneEvents
+from itertools import chain, repeat
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; without it every projectile runs the per-object update
+    np = None
+from ...utils.events import DamageEvent, ProjectileCollisionEvent, WaterSplashEvent
+from ...utils import swept_aabb, TILE_SIZE
 from ...utils.object_pool import ObjectPool
+from ..core.collision_grid import TileGrid, WALL_TILE, WATER_TILE, SOLID_COLLIDER
+from .projectile_store import ProjectileStore, CellOccupancy
+from ..rendering.projectile_visuals import get_projectile_sprite
+
+# Bounces resolved within one frame's step before the rest is dropped
+MAX_CONTACTS_PER_FRAME = 4
+# Projectiles further than this from the camera center are dropped (1500 px)
+CULL_DISTANCE_SQ = 2250000
+# Cell size of the per-frame hurtbox buckets
+HURTBOX_CELL_SIZE = TILE_SIZE * 2
+# Modifiers that need the per-object update; projectiles without any of them
+# live in the ProjectileStore
+BEHAVIOR_MODIFIERS = ('delay', 'orbit_radius', 'homing_strength', 'curvature', 'accel',
+                      'wave_amplitude', 'trail_interval', 'split_on_death')
+# Per-object projectiles are kept in one index list per behaviour, updated in
+# this order; 'mixed' runs the full modifier chain for any other combination.
+# 'delayed' goes last so projectiles whose delay ends join a bucket that has
+# already run this frame.
+BUCKETS = ('plain', 'homing', 'wave', 'split', 'orbit', 'mixed', 'delayed')
 
 class FastProjectile:
     __slots__ = [
@@ -13,7 +38,7 @@ class FastProjectile:
         'hits', 'source_entity', 'hits_dashing_player',
         # --- projectile modifiers ---
         'accel', 'max_speed', 'turn_rate',
-        'homing_strength', 'homing_target_id',
+        'homing_strength', 'homing_target_id', 'homing_visible',
         'wave_amplitude', 'wave_frequency', 'wave_time',
         'trail_interval', 'trail_timer', 'trail_lifetime',
         'delay', 'delay_timer',
@@ -27,7 +52,7 @@ class FastProjectile:
     ]
     def __init__(self):
         self.active = False
-        self.hits = set()
+        self.hits = 0  # bitset of the compact hurtbox indices already hit
         self.effects = []
         self.hits_dashing_player = False
         # defaults for modifiers
@@ -36,6 +61,7 @@ class FastProjectile:
         self.turn_rate = 0.0
         self.homing_strength = 0.0
         self.homing_target_id = None
+        self.homing_visible = True
         self.wave_amplitude = 0.0
         self.wave_frequency = 0.0
         self.wave_time = 0.0
@@ -62,23 +88,114 @@ class FastProjectile:
         self.visual_type = "standard"
         self.color = (255, 255, 255)
 
+class ProjectileTemplate:
+    """Spawn fields shared by every projectile of a pattern, resolved once.
+
+    ``fields`` holds the values of ``FIELDS`` in order: the arguments of
+    ``FastProjectileSystem.spawn`` other than source, position and velocity,
+    with the ``modifiers`` block already merged over the modifier defaults.
+    ``spawn_many`` assigns them in one tuple unpack instead of resetting
+    each field and applying the modifiers key by key. ``plain`` templates
+    (no behaviour modifier) spawn into the projectile store.
+    """
+    __slots__ = ('fields', 'plain', 'sprite')
+    FIELDS = ('speed', 'damage', 'effects', 'bounce', 'penetration', 'lifetime', 'size', 'layer', 'mask', 'image',
+              'pulse_radius', 'pulse_speed', 'pulse_color', 'pulse_time', 'particle_rate', 'particle_timer',
+              'hits', 'hits_dashing_player',
+              'accel', 'max_speed', 'turn_rate',
+              'homing_strength', 'homing_target_id', 'homing_visible',
+              'wave_amplitude', 'wave_frequency', 'wave_time',
+              'trail_interval', 'trail_timer', 'trail_lifetime',
+              'delay', 'delay_timer',
+              'split_on_death', 'split_count', 'split_speed', 'split_angle_spread',
+              'mine_radius', 'mine_delay', 'mine_timer',
+              'orbit_radius', 'orbit_speed', 'orbit_angle', 'orbit_center_x', 'orbit_center_y',
+              'phase', 'phase_timer',
+              'curvature',
+              'visual_type', 'color')
+
+    def __init__(self, speed, damage, effects, bounce, penetration, lifetime, size, layer, mask, image, pulse_radius, pulse_speed, pulse_color, particle_rate, hits_dashing_player=False, modifiers=None):
+        defaults = FastProjectile()
+        values = {name: getattr(defaults, name, None) for name in self.FIELDS}
+        values.update(speed=speed, damage=damage, effects=effects, bounce=bounce, penetration=penetration,
+                      lifetime=lifetime, size=size, layer=layer, mask=mask, image=image,
+                      pulse_radius=pulse_radius, pulse_speed=pulse_speed, pulse_color=pulse_color, pulse_time=0.0,
+                      particle_rate=particle_rate, particle_timer=0.0, hits=0,
+                      hits_dashing_player=hits_dashing_player)
+        if modifiers:
+            values.update((k, v) for k, v in modifiers.items() if k in values)
+        values['color'] = pulse_color  # always sync color from projectile data
+        self.fields = tuple(values[name] for name in self.FIELDS)
+        self.plain = not any(values[name] for name in BEHAVIOR_MODIFIERS)
+        self.sprite = None  # resolved by the first spawn_many
+
 class FastProjectileSystem:
     def __init__(self, event_manager, capacity=4000):
         self.event_manager = event_manager
         self.capacity = capacity
         self.pool = ObjectPool(FastProjectile, capacity=capacity, grow=True, max_capacity=8000)
-        self.active_indices = []
+        self.buckets = {name: [] for name in BUCKETS}  # {bucket: [pool index]}
+        # What each bucket's pass through _update_bucket does besides cull, age, hit and move
+        options = {
+            'plain': {},
+            'homing': {'pre_move': self._steer_homing, 'track_homing': True},
+            'wave': {'post_move': self._post_move_modifiers},
+            'split': {'split_on_expire': True},
+            'orbit': {'split_on_expire': True, 'step': self._step_orbit},
+            'mixed': {'split_on_expire': True, 'step': self._step_modified},
+            'delayed': {'split_on_expire': True, 'step': self._step_delayed},
+        }
+        self._kernels = [(name, options[name]) for name in BUCKETS]
+        self._incoming = []  # pool indices to bucket once this frame's kernels ran
         self._temp_rect = pygame.FRect(0, 0, 0, 0)
         self._pulse_cache = {}
         self._proj_visual_cache = {}
+        # Render interpolation: fraction of the last step to draw, set by the scene
+        self.render_alpha = 1.0
+        self._step_scale = 0.0  # dt * movement_scale of the last step
         
         # Pre-allocated objects to eliminate per-frame garbage collection
         self._shared_hits = []
-        self._shared_seen = set()
-        self._shared_vec = pygame.Vector2(0, 0)
-        self._shared_vel = pygame.Vector2(0, 0)
         self._active_hurtboxes = []
+        self._hurtbox_cells = {}   # {(cx, cy): [hurtbox]} of this frame
+        self._hurtbox_bits = {}  # {entity id: bit of its compact hurtbox index in the hits bitsets}
+        self._free_hurtbox_bits = []  # bits of indices whose entity lost its hurtbox
+        self._homing = []  # homing projectiles of this frame, for the sight check
         self._render_items = []
+
+        # Plain projectiles run as array operations when numpy is available
+        self.store = ProjectileStore() if ProjectileStore.available() else None
+        self._static_grid = None
+        self._static_cells = {}  # {mask: CellOccupancy} of _static_grid's tiles
+        self._no_tiles = TileGrid()  # stands in for a missing level grid
+
+    @property
+    def active_count(self):
+        return sum(map(len, self.buckets.values())) + (len(self.store) if self.store else 0)
+
+    def bodies(self):
+        """``(x, y, vx, vy, size)`` of every active projectile."""
+        pool = self.pool
+        out = [(p.x, p.y, p.vx, p.vy, p.size) for indices in self.buckets.values() for p in map(pool.__getitem__, indices)]
+        store = self.store
+        if store:
+            n = store.count
+            data = store.data
+            out.extend(zip(*(data[c, :n].tolist() for c in (store.X, store.Y, store.VX, store.VY, store.SIZE))))
+        return out
+
+    def clear(self):
+        for indices in self.buckets.values():
+            indices.clear()
+        self._incoming.clear()
+        if self.store:
+            self.store.clear()
+        self.pool.reset()
+        self._pulse_cache.clear()
+        self._shared_hits.clear()
+        self._hurtbox_cells.clear()
+        self._hurtbox_bits.clear()
+        self._free_hurtbox_bits.clear()
         
     def spawn(self, source_entity, x, y, vx, vy, speed, damage, effects, bounce, penetration, lifetime, size, layer, mask, image, pulse_radius, pulse_speed, pulse_color, particle_rate, hits_dashing_player=False, modifiers=None):
         idx = self.pool.acquire()
@@ -108,7 +225,7 @@ class FastProjectileSystem:
         p.pulse_time = 0.0
         p.particle_rate = particle_rate
         p.particle_timer = 0.0
-        p.hits.clear()
+        p.hits = 0
         p.hits_dashing_player = hits_dashing_player
 
         # apply modifiers
@@ -117,6 +234,7 @@ class FastProjectileSystem:
         p.turn_rate = 0.0
         p.homing_strength = 0.0
         p.homing_target_id = None
+        p.homing_visible = True
         p.wave_amplitude = 0.0
         p.wave_frequency = 0.0
         p.wave_time = 0.0
@@ -148,9 +266,84 @@ class FastProjectileSystem:
                     setattr(p, k, v)
         p.color = pulse_color  # always sync color from projectile data
         
-        self.active_indices.append(idx)
+        if self.store is not None and not (modifiers and any(getattr(p, name) for name in BEHAVIOR_MODIFIERS)):
+            self.store.add(idx, p, self._sprite(p))
+        else:
+            self.buckets[self._bucket_of(p)].append(idx)
         return p
 
+    def spawn_many(self, template, xs, ys, vxs, vys, source_entity=-1, speeds=None):
+        """Spawn one ``template`` projectile per ``(xs[i], ys[i], vxs[i], vys[i])``.
+
+        ``speeds`` optionally overrides the template speed per projectile.
+        Returns the spawned projectiles, fewer than asked if the pool is full.
+        """
+        pool = self.pool
+        fields = template.fields
+        spawned, indices = [], []
+        for x, y, vx, vy in zip(xs, ys, vxs, vys):
+            idx = pool.acquire()
+            if idx is None:
+                break
+            p = pool[idx]
+            # Same order as ProjectileTemplate.FIELDS
+            (p.speed, p.damage, p.effects, p.bounce, p.penetration, p.lifetime, p.size, p.layer, p.mask, p.image,
+             p.pulse_radius, p.pulse_speed, p.pulse_color, p.pulse_time, p.particle_rate, p.particle_timer,
+             p.hits, p.hits_dashing_player,
+             p.accel, p.max_speed, p.turn_rate,
+             p.homing_strength, p.homing_target_id, p.homing_visible,
+             p.wave_amplitude, p.wave_frequency, p.wave_time,
+             p.trail_interval, p.trail_timer, p.trail_lifetime,
+             p.delay, p.delay_timer,
+             p.split_on_death, p.split_count, p.split_speed, p.split_angle_spread,
+             p.mine_radius, p.mine_delay, p.mine_timer,
+             p.orbit_radius, p.orbit_speed, p.orbit_angle, p.orbit_center_x, p.orbit_center_y,
+             p.phase, p.phase_timer,
+             p.curvature,
+             p.visual_type, p.color) = fields
+            p.active = True
+            p.source_entity = source_entity
+            p.x = x
+            p.y = y
+            p.vx = vx
+            p.vy = vy
+            spawned.append(p)
+            indices.append(idx)
+        if not spawned:
+            return spawned
+        if speeds is not None:
+            for p, speed in zip(spawned, speeds):
+                p.speed = speed
+
+        if self.store is not None and template.plain:
+            sprite = template.sprite
+            if sprite is None:
+                sprite = template.sprite = self._sprite(spawned[0])
+            self.store.extend(indices, spawned, sprite)
+        else:
+            self.buckets[self._bucket_of(spawned[0])].extend(indices)
+        return spawned
+
+    @staticmethod
+    def _bucket_of(p):
+        # Behaviour bucket of a per-object projectile
+        if p.delay > 0:
+            return 'delayed'
+        if p.orbit_radius > 0:
+            return 'orbit'  # orbiting ignores every other modifier
+        if p.curvature != 0.0 or p.accel != 0.0 or p.trail_interval > 0.0:
+            return 'mixed'
+        homing = p.homing_strength > 0
+        wave = p.wave_amplitude > 0.0
+        split = p.split_on_death and p.split_count > 0
+        if homing + wave + split > 1:
+            return 'mixed'
+        if homing:
+            return 'homing'
+        if wave:
+            return 'wave'
+        return 'split' if split else 'plain'
+
     def _apply_modifiers(self, p, dt, movement_scale, pos_dict):
         # Delay: projectile waits before becoming active
         if p.delay > 0:
@@ -165,18 +358,8 @@ class FastProjectileSystem:
             p.y = p.orbit_center_y + math.sin(p.orbit_angle) * p.orbit_radius
             return 'orbiting'
 
-        # Homing: steer toward target
-        if p.homing_strength > 0 and p.homing_target_id is not None:
-            target_pos = pos_dict.get(p.homing_target_id)
-            if target_pos:
-                dx = target_pos.vec.x - p.x
-                dy = target_pos.vec.y - p.y
-                dist = math.sqrt(dx*dx + dy*dy)
-                if dist > 1.0:
-                    desired_vx = dx / dist * p.speed
-                    desired_vy = dy / dist * p.speed
-                    p.vx += (desired_vx - p.vx) * p.homing_strength
-                    p.vy += (desired_vy - p.vy) * p.homing_strength
+        if p.homing_strength > 0:
+            self._steer_homing(p, pos_dict)
 
         # Curvature: bend trajectory over time
         if p.curvature != 0.0:
@@ -203,6 +386,77 @@ class FastProjectileSystem:
 
         return None
 
+    def _steer_homing(self, p, pos_dict):
+        # Homing: steer toward target while it is in sight
+        if p.homing_target_id is not None and p.homing_visible:
+            target_pos = pos_dict.get(p.homing_target_id)
+            if target_pos:
+                dx = target_pos.vec.x - p.x
+                dy = target_pos.vec.y - p.y
+                dist = math.sqrt(dx*dx + dy*dy)
+                if dist > 1.0:
+                    p.vx += (dx / dist * p.speed - p.vx) * p.homing_strength
+                    p.vy += (dy / dist * p.speed - p.vy) * p.homing_strength
+
+    def _move_and_collide(self, p, idx, dt, movement_scale, tile_grid, dynamic_hash):
+        """Move ``p`` by one frame, stopping at the first wall tile or solid
+        collider along the way (swept AABB). A bounce reflects the rest of
+        the step off the contact normal. Returns True if ``p`` was destroyed.
+        """
+        event_manager = self.event_manager
+        size = p.size
+        pr = size / 2.0
+        dx = p.vx * dt * movement_scale
+        dy = p.vy * dt * movement_scale
+        for _ in range(MAX_CONTACTS_PER_FRAME):
+            x, y = p.x - pr, p.y - pr
+            hit = tile_grid.sweep(x, y, size, size, dx, dy, WALL_TILE) if tile_grid is not None else None
+            on_tile = hit is not None
+            if dynamic_hash:
+                bounds = self._temp_rect
+                bounds.update(min(x, x + dx), min(y, y + dy), size + abs(dx), size + abs(dy))
+                hits_list = self._shared_hits
+                hits_list.clear()
+                dynamic_hash.retrieve(hits_list, bounds, SOLID_COLLIDER)
+                for other_entity, other_rect in hits_list:
+                    if other_entity == p.source_entity: continue
+                    contact = swept_aabb(x, y, size, size, dx, dy, other_rect)
+                    if contact and (hit is None or contact[0] < hit[0]):
+                        hit = contact
+                        on_tile = False
+
+            if hit is None:
+                p.x += dx
+                p.y += dy
+                break
+
+            t, nx, ny = hit
+            p.x += dx * t
+            p.y += dy * t
+            if on_tile:
+                # Snap onto the tile boundary so float error never leaves it inside
+                ts = tile_grid.tile_size
+                if nx: p.x = round((p.x - nx * pr) / ts) * ts + nx * pr
+                else: p.y = round((p.y - ny * pr) / ts) * ts + ny * pr
+            event_manager.queue_typed(event_manager.acquire(ProjectileCollisionEvent).fill(p.x, p.y, p.vx, p.vy, "environment", size))
+            if p.bounce <= 0:
+                self.pool.release(idx)
+                self._handle_split(p, dt)
+                return True
+
+            p.bounce -= 1
+            rest = 1.0 - t
+            if nx:
+                p.vx = -p.vx
+                dx, dy = -dx * rest, dy * rest
+            else:
+                p.vy = -p.vy
+                dx, dy = dx * rest, -dy * rest
+
+        if tile_grid is not None and tile_grid.overlap_flags(p.x - pr, p.y - pr, size, size) & WATER_TILE:
+            event_manager.queue_typed(event_manager.acquire(WaterSplashEvent).fill(p.x, p.y, p.vx, p.vy, size))
+        return False
+
     def _post_move_modifiers(self, p, dt):
         # Wave: perpendicular sine oscillation
         if p.wave_amplitude > 0.0:
@@ -230,19 +484,24 @@ class FastProjectileSystem:
         if p.split_on_death and p.split_count > 0:
             angle_step = 360.0 / p.split_count
             base_angle = math.atan2(p.vy, p.vx)
+            # p is already released and the first child may take its slot,
+            # so read everything the children inherit up front
+            source, x, y, speed = p.source_entity, p.x, p.y, p.split_speed
+            damage, bounce, penetration = int(p.damage * 0.5), max(0, p.bounce - 1), max(0, p.penetration - 1)
+            lifetime, size, layer, mask, image = p.lifetime * 0.5, p.size * 0.5, p.layer, p.mask, p.image
+            color, spread = p.pulse_color, p.split_angle_spread
+            homing_strength, homing_target_id = p.homing_strength * 0.5, p.homing_target_id
             for i in range(p.split_count):
-                angle = base_angle + math.radians(i * angle_step - p.split_angle_spread / 2)
-                split_vx = math.cos(angle) * p.split_speed
-                split_vy = math.sin(angle) * p.split_speed
+                angle = base_angle + math.radians(i * angle_step - spread / 2)
+                split_vx = math.cos(angle) * speed
+                split_vy = math.sin(angle) * speed
                 child = self._spawn_raw(
-                    p.source_entity, p.x, p.y, split_vx, split_vy, p.split_speed,
-                    int(p.damage * 0.5), [], max(0, p.bounce - 1), max(0, p.penetration - 1),
-                    p.lifetime * 0.5, p.size * 0.5, p.layer, p.mask, p.image,
-                    0, 0, p.pulse_color, 0
+                    source, x, y, split_vx, split_vy, speed, damage, [], bounce, penetration,
+                    lifetime, size, layer, mask, image, 0, 0, color, 0
                 )
                 if child is not None:
-                    child.homing_strength = p.homing_strength * 0.5
-                    child.homing_target_id = p.homing_target_id
+                    child.homing_strength = homing_strength
+                    child.homing_target_id = homing_target_id
 
     def _spawn_raw(self, source_entity, x, y, vx, vy, speed, damage, effects, bounce, penetration, lifetime, size, layer, mask, image, pulse_radius, pulse_speed, pulse_color, particle_rate, hits_dashing_player=False):
         """Minimal spawn for internal split/chain use without modifier overhead."""
@@ -270,10 +529,10 @@ class FastProjectileSystem:
         child.pulse_time = 0.0
         child.particle_rate = particle_rate
         child.particle_timer = 0.0
-        child.hits.clear()
+        child.hits = 0
         child.hits_dashing_player = hits_dashing_player
         child.accel = 0.0; child.max_speed = 0.0; child.turn_rate = 0.0
-        child.homing_strength = 0.0; child.homing_target_id = None
+        child.homing_strength = 0.0; child.homing_target_id = None; child.homing_visible = True
         child.wave_amplitude = 0.0; child.wave_frequency = 0.0; child.wave_time = 0.0
         child.trail_interval = 0.0; child.trail_timer = 0.0; child.trail_lifetime = 0.0
         child.delay = 0.0; child.delay_timer = 0.0
@@ -285,224 +544,493 @@ class FastProjectileSystem:
         child.phase = 0; child.phase_timer = 0.0; child.curvature = 0.0
         child.visual_type = "split"
         child.color = pulse_color
-        self.active_indices.append(idx)
+        self._incoming.append(idx)  # bucketed after the kernels, with its final modifiers
         return child
 
-    def update(self, dt, fps, static_quadtree, dynamic_quadtree, hurtbox_dict, pos_dict, col_dict, particle_system=None, is_dashing=False, player_id=None, camera_center=None):
+    def update(self, dt, fps, tile_grid, dynamic_hash, hurtbox_dict, pos_dict, col_dict, particle_system=None, is_dashing=False, player_id=None, camera_center=None):
         movement_scale = fps if (fps and fps > 0) else 60.0
+        self._step_scale = dt * movement_scale
+
+        active_hurtboxes = self._bucket_hurtboxes(hurtbox_dict, pos_dict)
+
+        buckets = self.buckets
+        for name, options in self._kernels:
+            indices = buckets[name]
+            if indices:
+                self._update_bucket(indices, dt, movement_scale, tile_grid, dynamic_hash, pos_dict, particle_system,
+                                    is_dashing, player_id, camera_center, **options)
+
+        homing = self._homing
+        if homing:
+            self._update_homing_sight(homing, tile_grid, pos_dict)
+            homing.clear()
+
+        if self.store:
+            self._update_store(dt, movement_scale, tile_grid, dynamic_hash, active_hurtboxes, particle_system,
+                               is_dashing, player_id, camera_center)
+
+        # Split children and projectiles whose delay ended
+        incoming = self._incoming
+        if incoming:
+            pool = self.pool
+            for idx in incoming:
+                buckets[self._bucket_of(pool[idx])].append(idx)
+            incoming.clear()
+
+    # ---- Bucket kernels ----
+    # Every bucket runs through _update_bucket; BUCKET_OPTIONS names what
+    # differs per bucket. The kernel updates the bucket's index list in
+    # place, keeping the survivors in order.
+
+    def _update_bucket(self, indices, dt, movement_scale, tile_grid, dynamic_hash, pos_dict, particle_system,
+                       is_dashing, player_id, camera_center, split_on_expire=False, step=None,
+                       pre_move=None, post_move=None, track_homing=False):
+        """Cull, age and step every projectile of one bucket.
+
+        ``step(p, idx, ...)`` replaces the hit/particles/move block and
+        returns True if ``p`` leaves the bucket. Otherwise ``pre_move(p,
+        pos_dict)`` runs before the hit test and ``post_move(p, dt)`` after
+        the move.
+        """
+        pool = self.pool
+        hit = self._hit_hurtboxes if self._active_hurtboxes else None
+        move = self._move_and_collide
+        handle_split = self._handle_split if split_on_expire else None
+        homing = self._homing
+        write_ptr = 0
+        for idx in indices:
+            p = pool[idx]
+            if camera_center:
+                dx = p.x - camera_center.x
+                dy = p.y - camera_center.y
+                if dx*dx + dy*dy > CULL_DISTANCE_SQ:
+                    pool.release(idx)
+                    continue
+            p.lifetime -= dt
+            if p.lifetime <= 0:
+                pool.release(idx)
+                if handle_split:
+                    handle_split(p, dt)
+                continue
+            if step:
+                if step(p, idx, dt, movement_scale, tile_grid, dynamic_hash, pos_dict, particle_system,
+                        is_dashing, player_id):
+                    continue
+            else:
+                if pre_move:
+                    pre_move(p, pos_dict)
+                if hit and hit(p, idx, dt, is_dashing, player_id):
+                    continue
+                if particle_system and p.particle_rate > 0:
+                    self._emit_particles(p, dt, particle_system)
+                p.pulse_time += dt
+                if move(p, idx, dt, movement_scale, tile_grid, dynamic_hash):
+                    continue
+                if post_move:
+                    post_move(p, dt)
+                if track_homing:
+                    homing.append(p)
+            indices[write_ptr] = idx
+            write_ptr += 1
+        del indices[write_ptr:]
+
+    def _step_orbit(self, p, idx, dt, *_):
+        # Circle the orbit center; orbiting projectiles neither hit nor collide
+        p.orbit_angle += p.orbit_speed * dt
+        p.x = p.orbit_center_x + math.cos(p.orbit_angle) * p.orbit_radius
+        p.y = p.orbit_center_y + math.sin(p.orbit_angle) * p.orbit_radius
+        return False
+
+    def _step_delayed(self, p, idx, dt, movement_scale, tile_grid, dynamic_hash, pos_dict, particle_system,
+                      is_dashing, player_id):
+        # Waiting out the delay; the frame it ends runs the full chain, then
+        # the projectile moves to the bucket of its other modifiers
+        p.delay -= dt
+        if p.delay > 0:
+            return False
+        if not self._step_modified(p, idx, dt, movement_scale, tile_grid, dynamic_hash, pos_dict,
+                                   particle_system, is_dashing, player_id):
+            self._incoming.append(idx)
+        return True
+
+    def _step_modified(self, p, idx, dt, movement_scale, tile_grid, dynamic_hash, pos_dict, particle_system,
+                       is_dashing, player_id):
+        """One frame of ``p`` through every modifier. Returns True if ``p`` was destroyed."""
+        # ---- MODIFIERS: Pre-movement ----
+        mod_result = self._apply_modifiers(p, dt, movement_scale, pos_dict)
+        if mod_result == 'delayed' or mod_result == 'orbiting':
+            return False
+
+        if self._active_hurtboxes and self._hit_hurtboxes(p, idx, dt, is_dashing, player_id):
+            return True
+
+        if particle_system and p.particle_rate > 0:
+            self._emit_particles(p, dt, particle_system)
+
+        p.pulse_time += dt
+
+        # ---- MODIFIERS: Trail ----
+        self._emit_trail(p, dt, particle_system)
+
+        # One swept traversal per frame: exact contact and bounce, no tunneling
+        if self._move_and_collide(p, idx, dt, movement_scale, tile_grid, dynamic_hash):
+            return True
+
+        # ---- MODIFIERS: Post-movement ----
+        self._post_move_modifiers(p, dt)
+
+        if p.homing_strength > 0:
+            self._homing.append(p)
+        return False
 
+    def _emit_particles(self, p, dt, particle_system):
+        p.particle_timer += dt
+        rate = p.particle_rate * (1.0 if p.size <= 20 else 0.4)
+        emit_count = int(p.particle_timer * rate)
+        if emit_count > 0:
+            p.particle_timer -= emit_count / rate
+            trail_size = p.size * (0.2 if p.size <= 20 else 0.5)
+            for _ in range(emit_count):
+                particle_system.emit_fast_particle(p.x, p.y, 0, 0, 0.5, p.pulse_color[0], p.pulse_color[1], p.pulse_color[2], 255, trail_size, True, True, 1.0)
+
+    def _bucket_hurtboxes(self, hurtbox_dict, pos_dict):
+        """Collect this frame's hurtboxes and bucket them into ``HURTBOX_CELL_SIZE`` cells.
+
+        Each hurtbox entity keeps a compact index (and the bit it names in
+        the projectiles' ``hits`` bitsets) for as long as it has a hurtbox,
+        so the bitsets stay as wide as the number of hurtboxes. Indices of
+        entities that lost theirs are reused; their bits are cleared from
+        every live projectile once, in one pass, before the reuse.
+        """
         active_hurtboxes = self._active_hurtboxes
         active_hurtboxes.clear()
+        cells = self._hurtbox_cells
+        cells.clear()
+        bits = self._hurtbox_bits
+        free = self._free_hurtbox_bits
+        for eid in [eid for eid in bits if eid not in hurtbox_dict]:
+            free.append(bits.pop(eid))
+        forget = 0
+        cs = HURTBOX_CELL_SIZE
         for target_eid, hurtbox in hurtbox_dict.items():
             if hurtbox.disabled: continue
             target_pos_comp = pos_dict.get(target_eid)
             if not target_pos_comp: continue
-            
+
+            bit = bits.get(target_eid)
+            if bit is None:
+                if free:
+                    bit = free.pop()
+                    forget |= bit  # earlier hits on this bit were another entity
+                else:
+                    bit = 1 << len(bits)
+                bits[target_eid] = bit
+
             hx_min = target_pos_comp.vec.x + hurtbox.offset.x
             hy_min = target_pos_comp.vec.y + hurtbox.offset.y
             hx_max = hx_min + hurtbox.size[0]
             hy_max = hy_min + hurtbox.size[1]
-            active_hurtboxes.append((target_eid, hurtbox.layer, hx_min, hy_min, hx_max, hy_max))
+            # The list position keeps the hit order of the unbucketed loop
+            entry = (len(active_hurtboxes), bit, target_eid, hurtbox.layer, hx_min, hy_min, hx_max, hy_max)
+            active_hurtboxes.append(entry)
+            for cx in range(int(hx_min // cs), int(hx_max // cs) + 1):
+                for cy in range(int(hy_min // cs), int(hy_max // cs) + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [entry]
+                    else:
+                        bucket.append(entry)
+        if forget:
+            self._forget_hits(forget)
+        return active_hurtboxes
 
-        hits_list = self._shared_hits
-        seen_set = self._shared_seen
-        emit_pos = self._shared_vec
-        emit_vel = self._shared_vel
+    def _forget_hits(self, bits):
+        # Reused hurtbox indices: earlier hits on them were other entities
+        keep = ~bits
+        pool = self.pool
+        for indices in self.buckets.values():
+            for idx in indices:
+                pool[idx].hits &= keep
+        if self.store:
+            for p in self.store.records:
+                p.hits &= keep
 
-        write_ptr = 0
-        for read_pos in range(len(self.active_indices)):
-            idx = self.active_indices[read_pos]
-            p = self.pool[idx]
-            
-            if camera_center:
-                dx = p.x - camera_center.x
-                dy = p.y - camera_center.y
-                if dx*dx + dy*dy > 2250000:
-                    self.pool.release(idx)
-                    continue
+    def _hit_hurtboxes(self, p, idx, dt, is_dashing, player_id):
+        """Damage every hurtbox ``p`` touches. Returns True if ``p`` was destroyed."""
+        px, py = p.x, p.y
+        pr = p.size / 2.0
+        px_min, px_max = px - pr, px + pr
+        py_min, py_max = py - pr, py + pr
+        # Only the hurtboxes bucketed in the cells p's box covers
+        cs = HURTBOX_CELL_SIZE
+        cx0, cx1 = int(px_min // cs), int(px_max // cs)
+        cy0, cy1 = int(py_min // cs), int(py_max // cs)
+        cells = self._hurtbox_cells
+        if cx0 == cx1 and cy0 == cy1:
+            candidates = cells.get((cx0, cy0))
+            if not candidates:
+                return False
+        else:
+            found = set()
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket:
+                        found.update(bucket)
+            if not found:
+                return False
+            candidates = sorted(found)
 
-            p.lifetime -= dt
-            if p.lifetime <= 0:
-                self.pool.release(idx)
-                self._handle_split(p, dt)
-                continue
+        # Hit events are pooled typed events, filled in place and returned to
+        # the pool by the EventManager after dispatch
+        event_manager = self.event_manager
+        p_mask = p.mask
+        for _, bit, target_eid, h_layer, hx_min, hy_min, hx_max, hy_max in candidates:
+            if p.hits & bit or target_eid == p.source_entity: continue
+            if not (p_mask & h_layer): continue
+            if target_eid == player_id and is_dashing and not p.hits_dashing_player: continue
 
-            # ---- MODIFIERS: Pre-movement ----
-            mod_result = self._apply_modifiers(p, dt, movement_scale, pos_dict)
-            if mod_result == 'delayed':
-                self.active_indices[write_ptr] = idx
-                write_ptr += 1
-                continue
-            if mod_result == 'orbiting':
-                self.active_indices[write_ptr] = idx
-                write_ptr += 1
-                continue
+            if px_max >= hx_min and px_min <= hx_max and py_max >= hy_min and py_min <= hy_max:
+                test_x = px
+                if px < hx_min: test_x = hx_min
+                elif px > hx_max: test_x = hx_max
+                test_y = py
+                if py < hy_min: test_y = hy_min
+                elif py > hy_max: test_y = hy_max
+
+                if (px - test_x)**2 + (py - test_y)**2 <= pr**2:
+                    p.hits |= bit
+                    event_manager.queue_typed(event_manager.acquire(DamageEvent).fill(target_eid, idx, p.damage, p.effects, p.vx, p.vy, px, py))
+                    if p.penetration > 0: p.penetration -= 1
+                    else:
+                        self.pool.release(idx)
+                        self._handle_split(p, dt)
+                        return True
+        return False
+
+    def _cells(self, tile_grid, mask, rects=()):
+        # Occupancy of the mask tiles, plus rects when given (rebuilt then)
+        if rects:
+            return CellOccupancy(tile_grid).build(tile_grid.mask_cells(mask), rects)
+        if tile_grid is not self._static_grid:
+            self._static_grid = tile_grid  # one level at a time
+            self._static_cells.clear()
+        cells = self._static_cells.get(mask)
+        if cells is None:
+            cells = self._static_cells[mask] = CellOccupancy(tile_grid).build(tile_grid.mask_cells(mask))
+        return cells
+
+    def _update_store(self, dt, movement_scale, tile_grid, dynamic_hash, active_hurtboxes, particle_system,
+                      is_dashing, player_id, camera_center):
+        """Vectorized update of the plain projectiles in ``self.store``.
+
+        Lifetime, culling, pulse and particle timers and straight-line moves
+        are array operations. Only projectiles whose box touches a cell
+        holding a hurtbox, or whose swept box touches a wall or solid
+        collider cell, load into their pool object and run the per-object
+        hit and swept-collision code, so results match the object path.
+        """
+        store = self.store
+        n = store.count
+        if not n:
+            return
+        store.sync()
+        if tile_grid is None:
+            tile_grid = self._no_tiles
+        data = store.data
+        x, y, vx, vy = data[store.X, :n], data[store.Y, :n], data[store.VX, :n], data[store.VY, :n]
+        lifetime = data[store.LIFETIME, :n]
+        r = data[store.SIZE, :n] * 0.5
+        records, indices = store.records, store.indices
+        pool = self.pool
 
-            px, py = p.x, p.y
-            pr = p.size / 2.0
-            px_min, px_max = px - pr, px + pr
-            py_min, py_max = py - pr, py + pr
-            p_mask = p.mask
-
-            hit_entity = False
-            for target_eid, h_layer, hx_min, hy_min, hx_max, hy_max in active_hurtboxes:
-                if target_eid in p.hits or target_eid == p.source_entity: continue
-                if not (p_mask & h_layer): continue
-                if target_eid == player_id and is_dashing and not p.hits_dashing_player: continue
-                
-                if px_max >= hx_min and px_min <= hx_max and py_max >= hy_min and py_min <= hy_max:
-                    test_x = px
-                    if px < hx_min: test_x = hx_min
-                    elif px > hx_max: test_x = hx_max
-                    test_y = py
-                    if py < hy_min: test_y = hy_min
-                    elif py > hy_max: test_y = hy_max
-                    
-                    if (px - test_x)**2 + (py - test_y)**2 <= pr**2:
-                        p.hits.add(target_eid)
-                        emit_pos.update(px, py)
-                        emit_vel.update(p.vx, p.vy)
-                        self.event_manager.emit(GameSceneEvents.DAMAGE, entity_id=target_eid, proj_id=idx, damage=p.damage, effects=p.effects, proj_vel=emit_vel, proj_pos=emit_pos)
-                        if p.penetration > 0: p.penetration -= 1
-                        else:
-                            self.pool.release(idx)
-                            hit_entity = True
-                            self._handle_split(p, dt)
-                            break
-            
-            if hit_entity: continue
-
-            if particle_system and p.particle_rate > 0:
-                p.particle_timer += dt
-                rate = p.particle_rate * (1.0 if p.size <= 20 else 0.4)
-                emit_count = int(p.particle_timer * rate)
-                if emit_count > 0:
-                    p.particle_timer -= emit_count / rate
+        lifetime -= dt
+        removed = lifetime <= 0
+        if camera_center:
+            dx = x - camera_center.x
+            dy = y - camera_center.y
+            removed |= dx * dx + dy * dy > CULL_DISTANCE_SQ
+        for col in np.flatnonzero(removed).tolist():
+            pool.release(indices[col])
+
+        if active_hurtboxes:
+            hurt = self._cells(tile_grid, 0, [h[4:] for h in active_hurtboxes])
+            near = hurt.touches(x - r, y - r, x + r, y + r)
+            near &= ~removed
+            for col in np.flatnonzero(near).tolist():
+                p = records[col]
+                store.load(col, p)
+                if self._hit_hurtboxes(p, indices[col], dt, is_dashing, player_id):
+                    removed[col] = True
+
+        if particle_system:
+            rate = data[store.PARTICLE_RATE, :n]
+            timer = data[store.PARTICLE_TIMER, :n]
+            timer += dt
+            emit = np.floor(timer * rate)
+            emit[removed] = 0
+            emitting = np.flatnonzero(emit)
+            if emitting.size:
+                timer[emitting] -= emit[emitting] / rate[emitting]
+                emit_fast_particle = particle_system.emit_fast_particle
+                for col, count, px, py in zip(emitting.tolist(), emit[emitting].tolist(),
+                                              x[emitting].tolist(), y[emitting].tolist()):
+                    p = records[col]
                     trail_size = p.size * (0.2 if p.size <= 20 else 0.5)
-                    for _ in range(emit_count):
-                        particle_system.emit_fast_particle(px, py, 0, 0, 0.5, p.pulse_color[0], p.pulse_color[1], p.pulse_color[2], 255, trail_size, True, True, 1.0)
-
-            p.pulse_time += dt
-
-            # ---- MODIFIERS: Trail ----
-            self._emit_trail(p, dt, particle_system)
-
-            old_x = p.x
-            p.x += p.vx * dt * movement_scale
-            
-            destroyed = False
-            cx_mid = old_x + (p.x - old_x) * 0.5
-            for cx in (cx_mid, p.x):
-                cy = py
-                self._temp_rect.update(cx - pr, cy - pr, p.size, p.size)
-                hits_list.clear()
-                if static_quadtree: static_quadtree.retrieve(hits_list, self._temp_rect)
-                if dynamic_quadtree: dynamic_quadtree.retrieve(hits_list, self._temp_rect)
-                
-                seen_set.clear()
-                for other_entity, other_rect in hits_list:
-                    if other_entity in seen_set or (other_entity is not None and other_entity == p.source_entity): continue
-                    seen_set.add(other_entity)
-                    
-                    layer_id = other_entity[0] if isinstance(other_entity, tuple) else other_entity
-                    is_water = (layer_id == "water")
-                    is_solid = (layer_id == "wall")
-                    if other_entity is not None and not (is_water or is_solid):
-                        comp = col_dict.get(other_entity)
-                        if comp: is_solid = comp.solid
-
-                    if is_water and self._temp_rect.colliderect(other_rect):
-                        emit_pos.update(cx, cy); emit_vel.update(p.vx, p.vy)
-                        self.event_manager.emit(GameSceneEvents.WATER_SPLASH, pos=emit_pos, vel=emit_vel, size=p.size)
-                        continue
-
-                    if is_solid and self._temp_rect.colliderect(other_rect):
-                        emit_pos.update(cx, cy); emit_vel.update(p.vx, p.vy)
-                        self.event_manager.emit(GameSceneEvents.PROJECTILE_COLLISION, pos=emit_pos, vel=emit_vel, target_type="environment", size=p.size)
-                        if p.bounce > 0:
-                            p.bounce -= 1; p.vx *= -1; p.x = cx + p.vx * dt * movement_scale
-                        else:
-                            self.pool.release(idx); self._handle_split(p, dt); destroyed = True; break
-                if destroyed: break
-            
-            if destroyed: continue
-
-            old_y = p.y
-            p.y += p.vy * dt * movement_scale
-            cy_mid = old_y + (p.y - old_y) * 0.5
-            for cy in (cy_mid, p.y):
-                cx = p.x
-                self._temp_rect.update(cx - pr, cy - pr, p.size, p.size)
-                hits_list.clear()
-                if static_quadtree: static_quadtree.retrieve(hits_list, self._temp_rect)
-                if dynamic_quadtree: dynamic_quadtree.retrieve(hits_list, self._temp_rect)
-                
-                seen_set.clear()
-                for other_entity, other_rect in hits_list:
-                    if other_entity in seen_set or (other_entity is not None and other_entity == p.source_entity): continue
-                    seen_set.add(other_entity)
-                    
-                    layer_id = other_entity[0] if isinstance(other_entity, tuple) else other_entity
-                    is_water = (layer_id == "water")
-                    is_solid = (layer_id == "wall")
-                    if other_entity is not None and not (is_water or is_solid):
-                        comp = col_dict.get(other_entity)
-                        if comp: is_solid = comp.solid
-
-                    if is_water and self._temp_rect.colliderect(other_rect):
-                        emit_pos.update(cx, cy); emit_vel.update(p.vx, p.vy)
-                        self.event_manager.emit(GameSceneEvents.WATER_SPLASH, pos=emit_pos, vel=emit_vel, size=p.size)
-                        continue
-
-                    if is_solid and self._temp_rect.colliderect(other_rect):
-                        emit_pos.update(cx, cy); emit_vel.update(p.vx, p.vy)
-                        self.event_manager.emit(GameSceneEvents.PROJECTILE_COLLISION, pos=emit_pos, vel=emit_vel, target_type="environment", size=p.size)
-                        if p.bounce > 0:
-                            p.bounce -= 1; p.vy *= -1; p.y = cy + p.vy * dt * movement_scale
-                        else:
-                            self.pool.release(idx); self._handle_split(p, dt); destroyed = True; break
-                if destroyed: break
-            if destroyed: continue
-
-            # ---- MODIFIERS: Post-movement ----
-            self._post_move_modifiers(p, dt)
-
-            self.active_indices[write_ptr] = idx
-            write_ptr += 1
-        
-        del self.active_indices[write_ptr:]
+                    color = p.pulse_color
+                    for _ in range(int(count)):
+                        emit_fast_particle(px, py, 0, 0, 0.5, color[0], color[1], color[2], 255, trail_size, True, True, 1.0)
+
+        data[store.PULSE_TIME, :n] += dt
+
+        # Straight-line moves for everything whose swept box stays clear of
+        # walls and solid colliders; the rest take the swept path
+        step = dt * movement_scale
+        dx = vx * step
+        dy = vy * step
+        solids = dynamic_hash.items(SOLID_COLLIDER) if dynamic_hash else ()
+        blockers = self._cells(tile_grid, WALL_TILE, [(rect.left, rect.top, rect.right, rect.bottom)
+                                                      for _, rect in solids])
+        contact = blockers.touches(np.minimum(x, x + dx) - r, np.minimum(y, y + dy) - r,
+                                   np.maximum(x, x + dx) + r, np.maximum(y, y + dy) + r)
+        contact &= ~removed
+        free = ~(removed | contact)
+        np.add(x, dx, out=x, where=free)
+        np.add(y, dy, out=y, where=free)
+        for col in np.flatnonzero(contact).tolist():
+            p = records[col]
+            store.load(col, p)
+            if self._move_and_collide(p, indices[col], dt, movement_scale, tile_grid, dynamic_hash):
+                removed[col] = True
+            else:
+                store.save(col, p)
+
+        # Water splashes for the free movers (the swept path queues its own);
+        # the box is half-open like TileGrid.overlap_flags
+        water = self._cells(tile_grid, WATER_TILE)
+        if not water.empty:
+            wet = water.touches(x - r, y - r, np.nextafter(x + r, x), np.nextafter(y + r, y))
+            wet &= free
+            if wet.any():
+                event_manager = self.event_manager
+                for col in np.flatnonzero(wet).tolist():
+                    p = records[col]
+                    event_manager.queue_typed(event_manager.acquire(WaterSplashEvent).fill(
+                        float(x[col]), float(y[col]), float(vx[col]), float(vy[col]), p.size))
+
+        if removed.any():
+            store.compact(~removed)
+
+    def _update_homing_sight(self, homing, tile_grid, pos_dict):
+        # Walls between a homing projectile and its target stop the steering
+        # from the next frame on; one batched raycast for all of them
+        if tile_grid is None:
+            return
+        projectiles, tx, ty = [], [], []
+        for p in homing:
+            target_pos = pos_dict.get(p.homing_target_id)
+            if target_pos:
+                projectiles.append(p)
+                tx.append(target_pos.vec.x)
+                ty.append(target_pos.vec.y)
+        if not projectiles:
+            return
+        visible = tile_grid.visible_many([p.x for p in projectiles], [p.y for p in projectiles], tx, ty, WALL_TILE)
+        for p, sees in zip(projectiles, visible):
+            p.homing_visible = bool(sees)
 
     def collect_render_items(self, camera):
         scroll_int_x, scroll_int_y = camera.scroll_int.x, camera.scroll_int.y
         items = self._render_items
         items.clear()
         screen_rect = camera.rect
-        from ..rendering.projectile_visuals import get_projectile_sprite
-        for idx in self.active_indices:
-            p = self.pool[idx]
-            if not screen_rect.inflate(64, 64).collidepoint(p.x, p.y): continue
-            px, py = p.x - scroll_int_x, p.y - scroll_int_y
+        # Interpolate between simulation steps by stepping back along the velocity
+        lag = (1.0 - self.render_alpha) * self._step_scale
+        add_items = self._add_render_items
+        view = screen_rect.inflate(64, 64)
+        pool = self.pool
+        for p in (pool[idx] for indices in self.buckets.values() for idx in indices):
+            if not view.collidepoint(p.x, p.y): continue
+            px, py = p.x - p.vx * lag - scroll_int_x, p.y - p.vy * lag - scroll_int_y
+            pulse_r = 0
             if p.pulse_radius > 0:
                 pulse_val = (math.sin(p.pulse_time * p.pulse_speed) + 1) / 2
-                dr_int = int(p.pulse_radius * (0.8 + 0.4 * pulse_val))
-                if dr_int > 0:
-                    cache_key = (*p.pulse_color, dr_int)
-                    pulse_surf = self._pulse_cache.get(cache_key)
-                    if pulse_surf is None:
-                        pulse_surf = pygame.Surface((dr_int * 2, dr_int * 2), pygame.SRCALPHA)
-                        pygame.draw.circle(pulse_surf, (*p.pulse_color, 255), (dr_int, dr_int), dr_int)
-                        self._pulse_cache[cache_key] = pulse_surf
-                    items.append((p.y, "sprite", pulse_surf, (px - dr_int, py - dr_int), None, None))
-            # Use visual_type sprite if available, fall back to p.image
-            if p.visual_type != "standard" or p.image is None:
-                vkey = (p.visual_type, int(p.size), tuple(p.color))
-                sprite = self._proj_visual_cache.get(vkey)
-                if sprite is None:
-                    sprite = get_projectile_sprite(p.visual_type, p.size, p.color)
-                    self._proj_visual_cache[vkey] = sprite
-                w, h = sprite.get_size()
-                items.append((p.y, "sprite", sprite, (px - w/2, py - h/2), None, None))
-            elif p.image:
-                w, h = p.image.get_size()
-                items.append((p.y, "sprite", p.image, (px - w/2, py - h/2), None, None))
+                pulse_r = int(p.pulse_radius * (0.8 + 0.4 * pulse_val))
+            add_items(items, p, p.y, px, py, pulse_r)
+
+        if self.store:
+            self._collect_store_items(items, view, lag, scroll_int_x, scroll_int_y)
         return items
+
+    def _collect_store_items(self, items, view, lag, scroll_x, scroll_y):
+        # Render items of the store's projectiles inside view, built column-wise
+        store = self.store
+        n = store.count
+        data = store.data
+        # Truncated like Rect.collidepoint does on the object path
+        x, y = np.trunc(data[store.X, :n]), np.trunc(data[store.Y, :n])
+        shown = np.flatnonzero((x >= view.left) & (x < view.right) & (y >= view.top) & (y < view.bottom))
+        if not shown.size:
+            return
+        data = data[:, shown]
+        ys = data[store.Y]
+        px = data[store.X] - data[store.VX] * lag - scroll_x
+        py = ys - data[store.VY] * lag - scroll_y
+        pulse = (np.sin(data[store.PULSE_TIME] * data[store.PULSE_SPEED]) + 1) / 2
+        pulse_r = (data[store.PULSE_RADIUS] * (0.8 + 0.4 * pulse)).astype(np.intp)
+        y_sort = ys.tolist()
+        sprites = [store.sprites[col] for col in shown.tolist()]
+        # Sprite corners come from the half-size columns
+        sprite_items = zip(y_sort, repeat("sprite"), sprites,
+                           zip((px - data[store.HALF_W]).tolist(), (py - data[store.HALF_H]).tolist()),
+                           repeat(None), repeat(None))
+        pulsing = pulse_r > 0
+        if None not in sprites and not pulsing.any():
+            items.extend(sprite_items)
+            return
+        # One pulse surface lookup per distinct (radius, color) pair
+        colors = store.pulse_colors
+        nc = len(colors)
+        keys, inverse = np.unique(pulse_r * nc + data[store.PULSE_COLOR].astype(np.intp), return_inverse=True)
+        surfaces = [self._pulse_surface(colors[key % nc], key // nc) if key >= nc else None for key in keys.tolist()]
+        pulse_items = zip(y_sort, repeat("sprite"), [surfaces[i] for i in inverse.tolist()],
+                          zip((px - pulse_r).tolist(), (py - pulse_r).tolist()), repeat(None), repeat(None))
+        if None not in sprites and pulsing.all():
+            # Every projectile has a pulse disc drawn just under its sprite
+            items.extend(chain.from_iterable(zip(pulse_items, sprite_items)))
+            return
+        for pulse_item, sprite_item in zip(pulse_items, sprite_items):
+            if pulse_item[2] is not None:
+                items.append(pulse_item)
+            if sprite_item[2] is not None:
+                items.append(sprite_item)
+
+    def _pulse_surface(self, color, radius):
+        cache_key = (*color, radius)
+        pulse_surf = self._pulse_cache.get(cache_key)
+        if pulse_surf is None:
+            pulse_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(pulse_surf, (*color, 255), (radius, radius), radius)
+            self._pulse_cache[cache_key] = pulse_surf
+        return pulse_surf
+
+    def _sprite(self, p):
+        # Use visual_type sprite if available, fall back to p.image
+        if p.visual_type != "standard" or p.image is None:
+            vkey = (p.visual_type, int(p.size), tuple(p.color))
+            sprite = self._proj_visual_cache.get(vkey)
+            if sprite is None:
+                sprite = get_projectile_sprite(p.visual_type, p.size, p.color)
+                self._proj_visual_cache[vkey] = sprite
+            return sprite
+        return p.image or None
+
+    def _add_render_items(self, items, p, y_sort, px, py, pulse_r):
+        # Pulse disc and sprite of p drawn at the screen position (px, py)
+        if pulse_r > 0:
+            pulse_surf = self._pulse_surface(p.pulse_color, pulse_r)
+            items.append((y_sort, "sprite", pulse_surf, (px - pulse_r, py - pulse_r), None, None))
+        sprite = self._sprite(p)
+        if sprite is not None:
+            w, h = sprite.get_size()
+            items.append((y_sort, "sprite", sprite, (px - w/2, py - h/2), None, None))
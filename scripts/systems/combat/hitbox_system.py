@@ -1,23 +1,33 @@
 import pygame
-from ...utils import INITIAL_WINDOW_SIZE, GameSceneEvents, collision_occured
+from ...utils import INITIAL_WINDOW_SIZE, collision_occured
+from ...utils.events import DamageEvent
 from ...components.combat import HurtBoxComponent, HitBoxComponent, HealthComponent
 from ...components.physics import Position, Velocity
 from ...components.projectile import ProjectileComponent
 from ...components.tags import PlayerTagComponent
+from ...utils.spatial_hash import SpatialHash
 
 class HitBoxSystem:
+    def __init__(self):
+        # Hurtboxes persist in the hash and are moved each frame instead of rebuilt
+        self.hurtbox_hash = SpatialHash()
+        self._hurtbox_version = -1
+        self._hits = []
+
     def can_hit(self, hitbox: HitBoxComponent, hurtbox: HurtBoxComponent) -> bool:
         return (hitbox.mask & hurtbox.layer) != 0
 
     def update(self, event_manager, component_manager, scroll, dt=0):
         # Tick generic ECS ProjectileComponent lifetimes (since ProjectileSystem was removed)
         proj_dict = component_manager._components.get(ProjectileComponent, {})
-        for eid, proj in list(proj_dict.items()):
+        for eid, proj in proj_dict.items():
             proj.lifetime -= dt
             if proj.lifetime <= 0:
-                component_manager.remove(eid, ProjectileComponent)
-                if component_manager.get(eid, HitBoxComponent):
-                    component_manager.remove(eid, HitBoxComponent)
+                component_manager.remove_deferred(eid, ProjectileComponent)
+                hitbox = component_manager.get(eid, HitBoxComponent)
+                if hitbox:
+                    hitbox.disabled = True # stop hitting until the removal is applied
+                    component_manager.remove_deferred(eid, HitBoxComponent)
 
         # Alias dicts for speed
         hurtbox_dict = component_manager._components.get(HurtBoxComponent, {})
@@ -26,30 +36,35 @@ class HitBoxSystem:
         player_tag_dict = component_manager._components.get(PlayerTagComponent, {})
         health_dict = component_manager._components.get(HealthComponent, {})
 
-        # Build Pygame-native dictionary for ultra-fast C-level collision detection
-        hurtbox_rects = {}
+        grid = self.hurtbox_hash
+        version = component_manager.get_type_version(HurtBoxComponent)
+        if version != self._hurtbox_version:
+            self._hurtbox_version = version
+            grid.retain(hurtbox_dict)
+
         for entity_id, hurtbox in hurtbox_dict.items():
-            if hurtbox.disabled:
-                continue
             pos_comp = pos_dict.get(entity_id)
-            if not pos_comp:
+            if hurtbox.disabled or not pos_comp:
+                grid.remove(entity_id)
                 continue
 
             # Check invincibility
             is_player = entity_id in player_tag_dict
             health = health_dict.get(entity_id)
             if is_player and health and health.invincibility_timer > 0:
+                grid.remove(entity_id)
                 continue
-        
+
             pos = pos_comp.vec
-            rect = pygame.Rect(pos.x + hurtbox.offset.x, pos.y + hurtbox.offset.y, hurtbox.size[0], hurtbox.size[1])
-            hurtbox_rects[entity_id] = rect
-        
-        if not hurtbox_rects:
+            # The hurtbox layer is the entry's class, so queries filter on hitbox masks in the hash
+            grid.update(entity_id, pos.x + hurtbox.offset.x, pos.y + hurtbox.offset.y, hurtbox.size[0], hurtbox.size[1], int(hurtbox.layer))
+
+        if not len(grid):
             return
+        hits = self._hits
 
         for attacker, hitbox in hitbox_dict.items():
-            if hitbox.disabled:
+            if hitbox.disabled or not hitbox.mask:
                 continue
             pos_comp_a = pos_dict.get(attacker)
             if not pos_comp_a:
@@ -58,15 +73,9 @@ class HitBoxSystem:
             pos_a = pos_comp_a.vec
             hitbox_rect = pygame.Rect(pos_a.x + hitbox.offset.x, pos_a.y + hitbox.offset.y, hitbox.size[0], hitbox.size[1])
 
-            # C-level broadphase collision
-            collisions = hitbox_rect.collidedictall(hurtbox_rects, 1)
-
-            seen = set()
-            for defender, hurtbox_rect in collisions:
-                if defender in seen:
-                    continue
-                seen.add(defender)
-                
+            # Grid broadphase, overlap- and layer-tested, free of duplicates
+            hits.clear()
+            for defender, hurtbox_rect in grid.query(hitbox_rect, hits, int(hitbox.mask)):
                 if attacker == defender:
                     continue
 
@@ -74,9 +83,6 @@ class HitBoxSystem:
                 if not hurtbox:
                     continue
 
-                if not self.can_hit(hitbox, hurtbox):
-                    continue
-
                 pos_b_comp = pos_dict.get(defender)
                 if not pos_b_comp:
                     continue
@@ -90,16 +96,10 @@ class HitBoxSystem:
                     projectile.hits.add(defender)
                     
                     vel_comp = component_manager._components.get(Velocity, {}).get(attacker)
-                    proj_vel = vel_comp.vec.copy() if vel_comp else pygame.Vector2(0, 0)
-                    event_manager.emit(
-                        GameSceneEvents.DAMAGE, 
-                        entity_id=defender, 
-                        proj_id=attacker, 
-                        damage=projectile.damage, 
-                        effects=projectile.effects,
-                        proj_vel=proj_vel,
-                        proj_pos=pos_a.copy()
-                    )
+                    vx, vy = (vel_comp.vec.x, vel_comp.vec.y) if vel_comp else (0.0, 0.0)
+                    event_manager.emit_pooled(event_manager.acquire(DamageEvent).fill(
+                        defender, attacker, projectile.damage, projectile.effects, vx, vy, pos_a.x, pos_a.y
+                    ))
                 else:
                     # Otherwise, emit a generic damage event
                     # print(f'[HIT BOX SYSTEM] Non projectile type has damaged entity {defender} (DEBUG)')
@@ -0,0 +1,187 @@
+from itertools import repeat
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; without it every projectile runs the per-object update
+    np = None
+
+
+class ProjectileStore:
+    """Structure-of-arrays columns for plain projectiles.
+
+    Plain projectiles (no behaviour modifiers) keep their per-frame fields in
+    one ``(columns, capacity)`` float array, one contiguous row per field, so
+    lifetime, culling, movement and render positions are updated as array
+    operations. Column ``i`` belongs to the pool object ``records[i]`` (pool
+    index ``indices[i]``), which keeps everything else: damage, effects,
+    hits, bounce, ... and ``sprites[i]`` is the sprite it is drawn with.
+    When a projectile needs the per-object code (a hurtbox or wall nearby),
+    ``load`` copies its fields to the object and ``save`` writes the moved
+    position back.
+
+    Columns are kept dense; ``compact(keep)`` drops the others in one pass.
+    Requires numpy; ``ProjectileStore.available()`` is False without it and
+    every projectile stays on the per-object path.
+    """
+    (X, Y, VX, VY, LIFETIME, SIZE, PULSE_TIME, PULSE_SPEED, PULSE_RADIUS, PARTICLE_RATE, PARTICLE_TIMER,
+     HALF_W, HALF_H, PULSE_COLOR) = range(14)
+    FIELDS = ('x', 'y', 'vx', 'vy', 'lifetime', 'size', 'pulse_time', 'pulse_speed', 'pulse_radius',
+              'particle_rate', 'particle_timer', 'half_w', 'half_h', 'pulse_color')
+
+    def __init__(self, capacity=1024):
+        if np is None:
+            raise RuntimeError("[PROJECTILE STORE] numpy is required for the projectile store (DEBUG)")
+        self.data = np.zeros((len(self.FIELDS), capacity))
+        self.count = 0
+        self.synced = 0  # columns below this match their records' position and velocity
+        self.records = []  # [FastProjectile] per column
+        self.indices = []  # [pool index] per column
+        self.sprites = []  # [Surface or None] per column
+        self.pulse_colors = []  # pulse colors by the id kept in the PULSE_COLOR column
+        self._color_ids = {}
+
+    @staticmethod
+    def available():
+        return np is not None
+
+    def __len__(self):
+        return self.count
+
+    def add(self, index, p, sprite=None):
+        """Append the pool object ``p`` (pool index ``index``) drawn with ``sprite``; returns its column."""
+        col = self.count
+        self._reserve(col + 1)
+        self.data[:, col] = self._column(p, sprite)
+        self.records.append(p)
+        self.indices.append(index)
+        self.sprites.append(sprite)
+        self.count = col + 1
+        return col
+
+    def extend(self, indices, records, sprite=None):
+        """Append the pool objects ``records`` (pool indices ``indices``), all drawn with ``sprite``.
+
+        The records share every column but position and velocity (one
+        ``ProjectileTemplate``), so the columns are filled as one block.
+        """
+        col = self.count
+        end = col + len(records)
+        self._reserve(end)
+        block = self.data[:, col:end]
+        block[:] = np.array(self._column(records[0], sprite))[:, None]
+        block[:4] = [[p.x for p in records], [p.y for p in records], [p.vx for p in records], [p.vy for p in records]]
+        self.records.extend(records)
+        self.indices.extend(indices)
+        self.sprites.extend(repeat(sprite, len(records)))
+        self.count = end
+
+    def sync(self):
+        """Re-read position and velocity of the columns added since the last sync from their records.
+
+        Spawners may still steer a projectile they just got back (the weapon
+        system adds the shooter's velocity), so the store picks that up
+        before the first update of those columns.
+        """
+        col, n = self.synced, self.count
+        if col < n:
+            records = self.records[col:n]
+            self.data[:4, col:n] = [[p.x for p in records], [p.y for p in records],
+                                    [p.vx for p in records], [p.vy for p in records]]
+        self.synced = n
+
+    def _reserve(self, n):
+        size = self.data.shape[1]
+        if n > size:
+            while size < n:
+                size *= 2
+            grown = np.zeros((self.data.shape[0], size))
+            grown[:, :self.count] = self.data[:, :self.count]
+            self.data = grown
+
+    def _column(self, p, sprite):
+        w, h = sprite.get_size() if sprite is not None else (0, 0)
+        color = tuple(p.pulse_color)
+        color_id = self._color_ids.get(color)
+        if color_id is None:
+            color_id = self._color_ids[color] = len(self.pulse_colors)
+            self.pulse_colors.append(color)
+        # particle_rate is stored already scaled down for big projectiles
+        return (p.x, p.y, p.vx, p.vy, p.lifetime, p.size, p.pulse_time, p.pulse_speed,
+                p.pulse_radius, p.particle_rate * (1.0 if p.size <= 20 else 0.4), p.particle_timer,
+                w / 2, h / 2, color_id)
+
+    def load(self, col, p):
+        """Copy the column fields of ``col`` to its pool object ``p``."""
+        (p.x, p.y, p.vx, p.vy, p.lifetime, _, p.pulse_time, _, _, _,
+         p.particle_timer, _, _, _) = self.data[:, col].tolist()
+
+    def save(self, col, p):
+        """Write the position and velocity of ``p`` back to ``col``."""
+        self.data[:4, col] = (p.x, p.y, p.vx, p.vy)
+
+    def compact(self, keep):
+        """Keep only the columns where the bool array ``keep`` is True."""
+        n = self.count
+        kept = np.flatnonzero(keep)
+        self.count = self.synced = len(kept)
+        self.data[:, :self.count] = self.data[:, :n][:, kept]
+        kept = kept.tolist()
+        records, indices, sprites = self.records, self.indices, self.sprites
+        self.records = [records[i] for i in kept]
+        self.indices = [indices[i] for i in kept]
+        self.sprites = [sprites[i] for i in kept]
+
+    def clear(self):
+        self.count = self.synced = 0
+        self.records.clear()
+        self.indices.clear()
+        self.sprites.clear()
+
+
+class CellOccupancy:
+    """Which cells of a tile grid's lattice are occupied, as a summed-area table.
+
+    ``build`` marks the cells of a ``TileGrid.mask_cells`` array and of any
+    number of rects; ``touches`` then answers, for arrays of rects, whether
+    each overlaps an occupied cell with four lookups per rect, whatever the
+    rect's size. Coordinates outside the grid clip onto its padding border,
+    so answers are conservative there. Rect bounds are inclusive.
+    """
+
+    def __init__(self, tile_grid):
+        self.tile_size = tile_grid.tile_size
+        self.origin_x = tile_grid.origin_x - 1  # lattice cell (0, 0) is the padding corner
+        self.origin_y = tile_grid.origin_y - 1
+        self.width = tile_grid.width + 2
+        self.height = tile_grid.height + 2
+        self.empty = True
+        self.table = None
+
+    def build(self, cells=None, rects=()):
+        w, h = self.width, self.height
+        occupied = np.zeros((h, w), dtype=bool) if cells is None else cells.reshape(h, w).copy()
+        ts, ox, oy = self.tile_size, self.origin_x, self.origin_y
+        for x0, y0, x1, y1 in rects:
+            c0 = min(max(int(x0 // ts) - ox, 0), w - 1)
+            c1 = min(max(int(x1 // ts) - ox, 0), w - 1)
+            r0 = min(max(int(y0 // ts) - oy, 0), h - 1)
+            r1 = min(max(int(y1 // ts) - oy, 0), h - 1)
+            occupied[r0:r1 + 1, c0:c1 + 1] = True
+        table = np.zeros((h + 1, w + 1), dtype=np.int32)
+        np.cumsum(np.cumsum(occupied, axis=0, dtype=np.int32), axis=1, out=table[1:, 1:])
+        self.table = table.ravel()
+        self.empty = not table[-1, -1]
+        return self
+
+    def touches(self, x0, y0, x1, y1):
+        """Bool array: does the rect ``[x0, x1] x [y0, y1]`` overlap an occupied cell."""
+        if self.empty:
+            return np.zeros(np.shape(x0), dtype=bool)
+        ts = self.tile_size
+        w, h = self.width, self.height
+        stride = w + 1
+        c0 = np.clip(np.floor_divide(x0, ts) - self.origin_x, 0, w - 1).astype(np.intp)
+        c1 = np.clip(np.floor_divide(x1, ts) - self.origin_x, 0, w - 1).astype(np.intp) + 1
+        r0 = np.clip(np.floor_divide(y0, ts) - self.origin_y, 0, h - 1).astype(np.intp) * stride
+        r1 = (np.clip(np.floor_divide(y1, ts) - self.origin_y, 0, h - 1).astype(np.intp) + 1) * stride
+        table = self.table
+        return (table[r1 + c1] - table[r0 + c1] - table[r1 + c0] + table[r0 + c0]) > 0
@@ -1,7 +1,502 @@
 import math, pygame
-from ...utils import TILE_SIZE
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; raycast_many falls back to one raycast per ray
+    np = None
+from ...utils import TILE_SIZE, CollisionClass
 from ...components.physics import Position, CollisionComponent
 
+# Occupancy bits per static collision layer (plain ints for the inner loops)
+WALL_TILE = int(CollisionClass.WALL)
+WATER_TILE = int(CollisionClass.WATER)
+TILE_LAYER_FLAGS = {"wall": WALL_TILE, "water": WATER_TILE}
+# Classes of dynamic colliders in the SpatialHash
+SOLID_COLLIDER = int(CollisionClass.SOLID)
+BODY_COLLIDER = int(CollisionClass.BODY)
+# Below this many rays raycast_many casts them one by one (cheaper than the array setup)
+RAYCAST_BATCH_MIN = 32
+
+
+class TileGrid:
+    """Static tile occupancy for the collidable layers of a level.
+
+    One byte per tile cell over the level's bounding box, holding the
+    ``TILE_LAYER_FLAGS`` bits of every layer with a tile there. Point and
+    rect lookups index the bytearray directly, so their cost depends on the
+    size of the rect, not on the number of tiles in the level.
+    """
+
+    def __init__(self, tile_size=TILE_SIZE):
+        self.tile_size = tile_size
+        self.origin_x = 0   # tile coordinates of cell (0, 0)
+        self.origin_y = 0
+        self.width = 0
+        self.height = 0
+        self.cells = bytearray()
+        self.tile_counts = {}  # {layer_id: tiles}
+        self._blocked_masks = {}  # {mask: padded bool array}, see mask_cells
+
+    @classmethod
+    def from_layers(cls, layers, layer_ids, tile_size=TILE_SIZE):
+        grid = cls(tile_size)
+        placed = []
+        for layer_id in layer_ids:
+            flag = TILE_LAYER_FLAGS.get(layer_id)
+            layer_data = layers.get(layer_id, [])
+            tiles = layer_data.get("tiles", []) if isinstance(layer_data, dict) else layer_data
+            if not flag or not tiles:
+                continue
+            for tile in tiles:
+                placed.append((int(tile[0][0] // tile_size), int(tile[0][1] // tile_size), flag))
+            grid.tile_counts[layer_id] = len(tiles)
+
+        if placed:
+            grid.origin_x = min(t[0] for t in placed)
+            grid.origin_y = min(t[1] for t in placed)
+            grid.width = max(t[0] for t in placed) - grid.origin_x + 1
+            grid.height = max(t[1] for t in placed) - grid.origin_y + 1
+            grid.cells = bytearray(grid.width * grid.height)
+            for tx, ty, flag in placed:
+                grid.cells[(ty - grid.origin_y) * grid.width + tx - grid.origin_x] |= flag
+        return grid
+
+    def flags_at(self, x, y):
+        """Layer bits of the tile containing the point ``(x, y)``."""
+        tx = int(x // self.tile_size) - self.origin_x
+        ty = int(y // self.tile_size) - self.origin_y
+        if 0 <= tx < self.width and 0 <= ty < self.height:
+            return self.cells[ty * self.width + tx]
+        return 0
+
+    def _span(self, start, length, origin, size):
+        # Cells overlapped by [start, start + length), clipped to the grid
+        ts = self.tile_size
+        first = int(start // ts) - origin
+        last = math.ceil((start + length) / ts) - 1 - origin
+        return max(first, 0), min(last, size - 1)
+
+    def overlap_flags(self, x, y, w, h):
+        """OR of the layer bits of every tile the rect overlaps."""
+        ts = self.tile_size
+        width = self.width
+        x0 = int(x // ts) - self.origin_x
+        y0 = int(y // ts) - self.origin_y
+        x1 = -int(-(x + w) // ts) - 1 - self.origin_x
+        y1 = -int(-(y + h) // ts) - 1 - self.origin_y
+        if x0 < 0: x0 = 0
+        if y0 < 0: y0 = 0
+        if x1 >= width: x1 = width - 1
+        if y1 >= self.height: y1 = self.height - 1
+        cells = self.cells
+        if x0 == x1 and y0 == y1:
+            return cells[y0 * width + x0]
+        flags = 0
+        for ty in range(y0, y1 + 1):
+            row = ty * width
+            for tx in range(x0, x1 + 1):
+                flags |= cells[row + tx]
+        return flags
+
+    def sweep_x(self, rect, dx, mask):
+        """Resolve ``rect`` after it moved by ``dx`` horizontally.
+
+        Scans the tile columns its leading edge entered, first to last, and
+        snaps it against the first one holding a ``mask`` tile. Returns True
+        on contact.
+        """
+        if not dx:
+            return False
+        ts = self.tile_size
+        y0, y1 = self._span(rect.y, rect.h, self.origin_y, self.height)
+        if y0 > y1:
+            return False
+        if dx > 0:
+            edge = rect.x + rect.w
+            first, last, step = math.ceil((edge - dx) / ts), math.ceil(edge / ts) - 1, 1
+        else:
+            edge = rect.x
+            first, last, step = math.floor((edge - dx) / ts) - 1, math.floor(edge / ts), -1
+        cells, width = self.cells, self.width
+        for col in range(first, last + step, step):
+            tx = col - self.origin_x
+            if not 0 <= tx < width:
+                continue
+            for ty in range(y0, y1 + 1):
+                if cells[ty * width + tx] & mask:
+                    if dx > 0: rect.right = col * ts
+                    else: rect.left = (col + 1) * ts
+                    return True
+        return False
+
+    def sweep_y(self, rect, dy, mask):
+        """Vertical counterpart of ``sweep_x``."""
+        if not dy:
+            return False
+        ts = self.tile_size
+        x0, x1 = self._span(rect.x, rect.w, self.origin_x, self.width)
+        if x0 > x1:
+            return False
+        if dy > 0:
+            edge = rect.y + rect.h
+            first, last, step = math.ceil((edge - dy) / ts), math.ceil(edge / ts) - 1, 1
+        else:
+            edge = rect.y
+            first, last, step = math.floor((edge - dy) / ts) - 1, math.floor(edge / ts), -1
+        cells, width = self.cells, self.width
+        for row in range(first, last + step, step):
+            ty = row - self.origin_y
+            if not 0 <= ty < self.height:
+                continue
+            base = ty * width
+            for tx in range(x0, x1 + 1):
+                if cells[base + tx] & mask:
+                    if dy > 0: rect.bottom = row * ts
+                    else: rect.top = (row + 1) * ts
+                    return True
+        return False
+
+    def _span_after(self, start, length, d, origin, size):
+        # Cells overlapped by [start, start + length) just after an instant
+        # where an edge may sit on a cell boundary while moving by d, so a
+        # cell entered on both axes at once is never skipped
+        ts = self.tile_size
+        if d > 0:
+            first = int(start // ts)
+            last = int((start + length) // ts)
+        elif d < 0:
+            first = math.ceil(start / ts) - 1
+            last = math.ceil((start + length) / ts) - 1
+        else:
+            first = int(start // ts)
+            last = math.ceil((start + length) / ts) - 1
+        return max(first - origin, 0), min(last - origin, size - 1)
+
+    def sweep(self, x, y, w, h, dx, dy, mask):
+        """Swept AABB against the grid: first contact of the rect ``(x, y, w, h)``
+        moving by ``(dx, dy)`` with a ``mask`` tile.
+
+        Walks the columns and rows the leading edges enter in time order
+        (DDA), checking only the newly entered cells. Returns
+        ``(t, nx, ny)`` with the time of impact in [0, 1] and the contact
+        normal, or None. Cells overlapped at the start are not reported.
+        """
+        ts = self.tile_size
+        inf = math.inf
+        if dx > 0:
+            col = math.ceil((x + w) / ts)       # next column the right edge enters
+            tx, tdx, sx = (col * ts - x - w) / dx, ts / dx, 1
+        elif dx < 0:
+            col = math.floor(x / ts) - 1        # next column the left edge enters
+            tx, tdx, sx = ((col + 1) * ts - x) / dx, -ts / dx, -1
+        else:
+            col, tx, tdx, sx = 0, inf, inf, 0
+        if dy > 0:
+            row = math.ceil((y + h) / ts)
+            ty, tdy, sy = (row * ts - y - h) / dy, ts / dy, 1
+        elif dy < 0:
+            row = math.floor(y / ts) - 1
+            ty, tdy, sy = ((row + 1) * ts - y) / dy, -ts / dy, -1
+        else:
+            row, ty, tdy, sy = 0, inf, inf, 0
+
+        cells, width, height = self.cells, self.width, self.height
+        ox, oy = self.origin_x, self.origin_y
+        while True:
+            if tx <= ty:
+                t = tx
+                if t > 1:
+                    return None
+                cx = col - ox
+                if 0 <= cx < width:
+                    y0, y1 = self._span_after(y + dy * t, h, dy, oy, height)
+                    for cy in range(y0, y1 + 1):
+                        if cells[cy * width + cx] & mask:
+                            return t, -sx, 0
+                col += sx
+                tx += tdx
+            else:
+                t = ty
+                if t > 1:
+                    return None
+                cy = row - oy
+                if 0 <= cy < height:
+                    x0, x1 = self._span_after(x + dx * t, w, dx, ox, width)
+                    base = cy * width
+                    for cx in range(x0, x1 + 1):
+                        if cells[base + cx] & mask:
+                            return t, 0, -sy
+                row += sy
+                ty += tdy
+
+    def move(self, rect, dx, dy, mask):
+        """Move ``rect`` by ``(dx, dy)``, stopping at ``mask`` tiles and
+        sliding along them for the rest of the step.
+
+        Returns the contact normals ``(nx, ny)``, 0 on an axis without
+        contact.
+        """
+        ts = self.tile_size
+        nx = ny = 0
+        for _ in range(2):
+            if not (dx or dy):
+                break
+            hit = self.sweep(rect.x, rect.y, rect.w, rect.h, dx, dy, mask)
+            if hit is None:
+                rect.x += dx
+                rect.y += dy
+                break
+            t, hx, hy = hit
+            rect.x += dx * t
+            rect.y += dy * t
+            rest = 1.0 - t
+            if hx:
+                nx = hx
+                # Snap onto the boundary so float error never leaves it inside
+                if hx < 0: rect.right = round(rect.right / ts) * ts
+                else: rect.left = round(rect.left / ts) * ts
+                dx, dy = 0, dy * rest
+            else:
+                ny = hy
+                if hy < 0: rect.bottom = round(rect.bottom / ts) * ts
+                else: rect.top = round(rect.top / ts) * ts
+                dx, dy = dx * rest, 0
+        return nx, ny
+
+    def exit_time(self, x, y, w, h, dx, dy, mask):
+        """First time in [0, 1] at which the rect ``(x, y, w, h)`` moving by
+        ``(dx, dy)`` overlaps no ``mask`` tile, or None if it never does.
+
+        The overlap can only clear when a trailing edge leaves a column or
+        row, so only those instants are tested.
+        """
+        if not self.overlap_flags(x, y, w, h) & mask:
+            return 0.0
+        ts = self.tile_size
+        inf = math.inf
+        if dx > 0:
+            col = int(x // ts) + 1                   # next boundary the left edge crosses
+            tx, tdx, sx, ex = (col * ts - x) / dx, ts / dx, 1, 0
+        elif dx < 0:
+            col = math.ceil((x + w) / ts) - 1        # next boundary the right edge crosses
+            tx, tdx, sx, ex = (col * ts - x - w) / dx, -ts / dx, -1, w
+        else:
+            col, tx, tdx, sx, ex = 0, inf, inf, 0, 0
+        if dy > 0:
+            row = int(y // ts) + 1
+            ty, tdy, sy, ey = (row * ts - y) / dy, ts / dy, 1, 0
+        elif dy < 0:
+            row = math.ceil((y + h) / ts) - 1
+            ty, tdy, sy, ey = (row * ts - y - h) / dy, -ts / dy, -1, h
+        else:
+            row, ty, tdy, sy, ey = 0, inf, inf, 0, 0
+
+        while True:
+            if tx <= ty:
+                t = tx
+                if t > 1:
+                    return None
+                # Place the trailing edge exactly on the boundary
+                px, py = col * ts - ex, y + dy * t
+                col += sx
+                tx += tdx
+            else:
+                t = ty
+                if t > 1:
+                    return None
+                px, py = x + dx * t, row * ts - ey
+                row += sy
+                ty += tdy
+            if not self.overlap_flags(px, py, w, h) & mask:
+                return t
+
+    def raycast(self, x0, y0, x1, y1, mask):
+        """First ``mask`` tile on the segment from ``(x0, y0)`` to ``(x1, y1)``.
+
+        Visits the cells the segment crosses in order (DDA). Returns
+        ``(t, nx, ny)`` with the hit point at ``t`` in [0, 1] along the
+        segment and the normal of the cell side it entered through, or None.
+        A segment starting inside a ``mask`` tile hits at ``(0.0, 0, 0)``.
+        """
+        if self.flags_at(x0, y0) & mask:
+            return 0.0, 0, 0
+        ts = self.tile_size
+        inf = math.inf
+        dx = x1 - x0
+        dy = y1 - y0
+        col = int(x0 // ts)
+        row = int(y0 // ts)
+        if dx > 0:
+            tx, tdx, sx = ((col + 1) * ts - x0) / dx, ts / dx, 1
+        elif dx < 0:
+            tx, tdx, sx = (col * ts - x0) / dx, -ts / dx, -1
+        else:
+            tx, tdx, sx = inf, inf, 0
+        if dy > 0:
+            ty, tdy, sy = ((row + 1) * ts - y0) / dy, ts / dy, 1
+        elif dy < 0:
+            ty, tdy, sy = (row * ts - y0) / dy, -ts / dy, -1
+        else:
+            ty, tdy, sy = inf, inf, 0
+
+        cells, width, height = self.cells, self.width, self.height
+        col -= self.origin_x
+        row -= self.origin_y
+        while True:
+            if tx <= ty:
+                t = tx
+                if t > 1:
+                    return None
+                col += sx
+                tx += tdx
+                if 0 <= col < width and 0 <= row < height and cells[row * width + col] & mask:
+                    return t, -sx, 0
+            else:
+                t = ty
+                if t > 1:
+                    return None
+                row += sy
+                ty += tdy
+                if 0 <= col < width and 0 <= row < height and cells[row * width + col] & mask:
+                    return t, 0, -sy
+
+    def line_of_sight(self, x0, y0, x1, y1, mask=WALL_TILE):
+        """True if no ``mask`` tile lies between the two points."""
+        return self.raycast(x0, y0, x1, y1, mask) is None
+
+    def mask_cells(self, mask):
+        """Flat bool array, True for cells holding a ``mask`` tile, over the
+        grid padded with one empty cell on every side (``width + 2`` per row).
+
+        Array queries clip coordinates onto the border instead of
+        bound-checking. Needs numpy; cached per mask.
+        """
+        blocked = self._blocked_masks.get(mask)
+        if blocked is None:
+            cells = np.frombuffer(bytes(self.cells), dtype=np.uint8).reshape(self.height, self.width)
+            blocked = np.zeros((self.height + 2, self.width + 2), dtype=bool)
+            blocked[1:-1, 1:-1] = (cells & mask) != 0
+            blocked = self._blocked_masks[mask] = blocked.ravel()
+        return blocked
+
+    def raycast_many(self, x0, y0, x1, y1, mask):
+        """Batched ``raycast`` over sequences of segment endpoints.
+
+        Returns ``(t, nx, ny)`` sequences, one entry per ray; ``t`` is
+        ``math.inf`` where nothing was hit. With numpy there is no per-cell
+        loop: the cell entered at every column and row crossing of every ray
+        is computed in closed form, all of them are looked up at once and the
+        earliest blocked crossing per ray wins. Without numpy, or for fewer
+        than ``RAYCAST_BATCH_MIN`` rays, each ray is cast on its own.
+        """
+        if np is None or not self.cells or len(x0) < RAYCAST_BATCH_MIN:
+            ts, ns, ms = [], [], []
+            for ray in zip(x0, y0, x1, y1):
+                hit = self.raycast(*ray, mask)
+                if hit is None:
+                    ts.append(math.inf); ns.append(0); ms.append(0)
+                else:
+                    ts.append(hit[0]); ns.append(hit[1]); ms.append(hit[2])
+            return ts, ns, ms
+
+        x0 = np.asarray(x0, dtype=np.float64)
+        y0 = np.asarray(y0, dtype=np.float64)
+        n = x0.shape[0]
+        out_t = np.full(n, math.inf)
+        out_nx = np.zeros(n, dtype=np.int8)
+        out_ny = np.zeros(n, dtype=np.int8)
+        if not n:
+            return out_t, out_nx, out_ny
+        ts = self.tile_size
+        blocked = self.mask_cells(mask)
+        stride = self.width + 2
+        max_col, max_row = self.width + 1, self.height + 1
+        # Cell coordinates in the padded grid, clipped onto its empty border
+        col0 = np.floor_divide(x0, ts) - (self.origin_x - 1)
+        row0 = np.floor_divide(y0, ts) - (self.origin_y - 1)
+
+        def lookup(cols, rows):
+            np.clip(cols, 0, max_col, out=cols)
+            np.clip(rows, 0, max_row, out=rows)
+            return blocked[(rows * stride + cols).astype(np.intp)]
+
+        # Per axis: step sign, time of the first boundary crossing, time per cell
+        # and number of crossings within the segment
+        axes = []
+        for origin, end in ((x0, x1), (y0, y1)):
+            d = np.asarray(end, dtype=np.float64) - origin
+            s = np.sign(d)
+            # An axis the ray does not move along gets a first crossing past
+            # the end of the segment, which also makes it count as never taken
+            with np.errstate(divide='ignore', invalid='ignore'):
+                first = np.where(s == 0, 2.0, ((np.floor_divide(origin, ts) + (s > 0)) * ts - origin) / d)
+                step = np.where(s == 0, 1.0, ts / np.abs(d))
+            count = np.where(first <= 1.0, np.floor((1.0 - first) / step) + 1, 0).astype(np.intp)
+            axes.append((s, first, step, count))
+
+        # Time of the first blocked crossing on each axis. Every per crossing
+        # value is linear in the crossing number k, so it is a repeated per ray
+        # base plus k times a repeated per ray slope (np.repeat is faster than
+        # gathers). Crossings are ordered by ray then time, so a ray's first
+        # hit is its first entry; times are only computed for those
+        first_hit = []
+        for axis in (0, 1):
+            s, first, step, count = axes[axis]
+            o_s, o_first, o_step, _ = axes[1 - axis]
+            hit_t = np.full(n, math.inf)
+            total = int(count.sum())
+            if total:
+                k = np.arange(total, dtype=np.float64)
+                k -= np.repeat(np.cumsum(count) - count, count)
+                # Crossings of the other axis already taken; on a tie the
+                # column step comes first, as in raycast
+                taken = np.repeat((first - o_first) / o_step, count)
+                taken += k * np.repeat(step / o_step, count)
+                if axis == 0:
+                    np.ceil(taken, out=taken)
+                else:
+                    np.floor(taken, out=taken)
+                    taken += 1
+                np.maximum(taken, 0, out=taken)
+                along = np.repeat((col0 if axis == 0 else row0) + s, count) + k * np.repeat(s, count)
+                across = np.repeat(row0 if axis == 0 else col0, count) + taken * np.repeat(o_s, count)
+                hit = np.flatnonzero(lookup(along, across) if axis == 0 else lookup(across, along))
+                if hit.size:
+                    rays = np.repeat(np.arange(n), count)[hit]
+                    lead = np.ones(hit.size, dtype=bool)
+                    np.not_equal(rays[1:], rays[:-1], out=lead[1:])
+                    rays = rays[lead]
+                    hit_t[rays] = first[rays] + k[hit[lead]] * step[rays]
+            first_hit.append(hit_t)
+
+        hit_x, hit_y = first_hit
+        x_first = hit_x <= hit_y
+        np.minimum(hit_x, hit_y, out=out_t)
+        found = out_t != math.inf
+        sx, sy = axes[0][0], axes[1][0]
+        out_nx[found & x_first] = -sx[found & x_first]
+        out_ny[found & ~x_first] = -sy[found & ~x_first]
+        # Rays starting inside a blocked cell
+        inside = lookup(col0.copy(), row0.copy())
+        out_t[inside] = 0.0
+        out_nx[inside] = 0
+        out_ny[inside] = 0
+        return out_t, out_nx, out_ny
+
+    def visible_many(self, x0, y0, x1, y1, mask=WALL_TILE):
+        """Batched ``line_of_sight``: one bool per segment."""
+        hit_t = self.raycast_many(x0, y0, x1, y1, mask)[0]
+        if np is not None and isinstance(hit_t, np.ndarray):
+            return hit_t == math.inf
+        return [t == math.inf for t in hit_t]
+
+    def stats(self):
+        return {
+            'size': (self.width, self.height),
+            'bytes': len(self.cells),
+            'tiles': dict(self.tile_counts),
+        }
+
+
 class CollisionGrid:
     def __init__(self, walls, tile_size=None):
         self.grid = []
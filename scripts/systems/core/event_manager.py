@@ -1,6 +1,8 @@
+import time
 from collections import defaultdict
 from ...utils import GameSceneEvents
-from ...utils.events import TYPED_EVENT_MAP, GameEvent
+from ..debug.event_stats import EventStats
+from ...utils.events import TYPED_EVENT_MAP, GameEvent, PooledEvent, EventPool
 
 class EventManager:
     def __init__(self):
@@ -8,10 +10,37 @@ class EventManager:
         # if an event_type is not found in the dictionary, it will return an empty list instead of raising a KeyError
         self.subscribers = defaultdict(list)
         self._typed_subscribers = defaultdict(list)
+
+        # Entity-targeted subscribers: {event_type: {entity_id: [(callback, source)]}}.
+        # emit() looks up the event's entity_id directly instead of calling
+        # every listener and letting each one filter.
+        self._targeted = defaultdict(dict)
+
+        # {source: {(is_typed, event_type)}} so unsubscribe_all_for only touches
+        # the subscriber lists that source actually appears in
+        self._source_index = defaultdict(set)
+        self._targeted_index = defaultdict(set) # {source: {(event_type, entity_id)}}
+
+        # Queued emits, dispatched together by dispatch_queued()
+        self._batch_subscribers = defaultdict(list) # {event_type: [(callback, source)]}
+        self._queue = []                    # [(event_type, kwargs, typed event or None)]
+        self._coalesce_rules = {}           # {event_type or event class: (key_name, merge)}
+        self._coalesced = {}                # {(event_type, key): kwargs / event already in the queue}
+
+        # Reused PooledEvent instances for hot typed events
+        self.pool = EventPool()
+
+        # Legacy <-> typed compatibility bridge, see bridge_legacy()
+        self._bridge_to_typed = {}          # {GameSceneEvents: event class}
+        self._bridge_to_legacy = {}         # {event class: GameSceneEvents}
+
+        # EventStats while instrumentation is enabled, otherwise None (no overhead)
+        self.instrumentation = None
     
     def subscribe(self, event_type, *callbacks, source=None):
         for callback in callbacks:
             self.subscribers[event_type].append((callback, source))
+        self._source_index[source].add((False, event_type))
     
     def subscribe_typed(self, event_class, callback, source=None):
         """Subscribe to a typed event class (e.g. DamageEvent).
@@ -20,7 +49,55 @@ class EventManager:
         They are NOT mixed with legacy kwargs-based subscribers.
         """
         self._typed_subscribers[event_class].append((callback, source))
+        self._source_index[source].add((True, event_class))
     
+    def subscribe_batch(self, event_type, callback, source=None):
+        """Subscribe with a handler that takes a list of kwargs dicts.
+
+        Queued events of ``event_type`` are delivered once per dispatch as
+        one list; a direct ``emit`` delivers a list of one. Subscribing with
+        an event class instead delivers lists of typed events.
+        """
+        self._batch_subscribers[event_type].append((callback, source))
+        self._source_index[source].add((None, event_type))
+
+    def subscribe_for(self, entity_id, event_type, *callbacks, source=None):
+        """Subscribe to ``event_type`` only when it concerns ``entity_id``.
+
+        Dispatched by the event's ``entity_id`` (kwarg for legacy events,
+        attribute for typed ones), so only listeners of that entity are
+        called. ``source`` defaults to ``entity_id`` so the subscription is
+        dropped with ``unsubscribe_all_for(entity_id)``.
+        """
+        if source is None:
+            source = entity_id
+        by_entity = self._targeted[event_type]
+        listeners = by_entity.get(entity_id, [])
+        by_entity[entity_id] = listeners + [(callback, source) for callback in callbacks]
+        self._targeted_index[source].add((event_type, entity_id))
+
+    def unsubscribe_for(self, entity_id, event_type, callback, source=None):
+        if source is None:
+            source = entity_id
+        by_entity = self._targeted.get(event_type)
+        listeners = by_entity.get(entity_id) if by_entity else None
+        if not listeners or (callback, source) not in listeners:
+            print(f"[EVENT MANAGER] Callback '{callback}' was not found for event '{event_type}' on entity {entity_id}. (DEBUG)")
+            return
+        remaining = [entry for entry in listeners if entry != (callback, source)]
+        if remaining:
+            by_entity[entity_id] = remaining
+        else:
+            del by_entity[entity_id]
+
+        if not any(src == source for _, src in remaining):
+            # That was the source's last listener here; forget the key
+            keys = self._targeted_index.get(source)
+            if keys is not None:
+                keys.discard((event_type, entity_id))
+                if not keys:
+                    del self._targeted_index[source]
+
     def unsubscribe_typed(self, event_class, callback, source=None):
         """Remove a typed subscriber."""
         if event_class in self._typed_subscribers:
@@ -39,32 +116,270 @@ class EventManager:
             print(f"[EVENT MANAGER] No subscribers for event '{event_type}'. (DEBUG)")
 
     def unsubscribe_all_for(self, source):
-        for event_type in list(self.subscribers):
-            original = self.subscribers[event_type]
-            self.subscribers[event_type] = [
-                (cb, src) for cb, src in original if src != source
-            ]
-        for event_class in list(self._typed_subscribers):
-            original = self._typed_subscribers[event_class]
-            self._typed_subscribers[event_class] = [
-                (cb, src) for cb, src in original if src != source
-            ]
+        # Lists are rebuilt rather than edited in place so an emit() that is
+        # currently iterating one keeps a consistent snapshot.
+        targeted_keys = self._targeted_index.pop(source, None)
+        if targeted_keys:
+            for event_type, entity_id in targeted_keys:
+                by_entity = self._targeted.get(event_type)
+                listeners = by_entity.get(entity_id) if by_entity else None
+                if not listeners:
+                    continue
+                remaining = [(cb, src) for cb, src in listeners if src != source]
+                if remaining:
+                    by_entity[entity_id] = remaining
+                else:
+                    del by_entity[entity_id]
+
+        keys = self._source_index.pop(source, None)
+        if not keys:
+            return
+        for is_typed, event_type in keys:
+            if is_typed is None:
+                table = self._batch_subscribers
+            else:
+                table = self._typed_subscribers if is_typed else self.subscribers
+            original = table.get(event_type)
+            if original:
+                table[event_type] = [
+                    (cb, src) for cb, src in original if src != source
+                ]
 
     def emit(self, event_type, **kwargs):
+        self._deliver_kwargs(event_type, kwargs)
+        if event_type in self._batch_subscribers:
+            self._dispatch_batch(event_type, [kwargs])
+
+    def _deliver_kwargs(self, event_type, kwargs):
+        self._dispatch(event_type, kwargs)
+        event_class = self._bridge_to_typed.get(event_type)
+        if event_class is not None and (self._typed_subscribers.get(event_class) or self._targeted.get(event_class)):
+            event = self.pool.acquire(event_class).assign(kwargs)
+            self._dispatch_typed(event)
+            self.pool.release(event)
+
+    def _deliver_event(self, event):
+        self._dispatch_typed(event)
+        event_type = self._bridge_to_legacy.get(type(event))
+        if event_type is not None and (self.subscribers.get(event_type) or self._targeted.get(event_type)):
+            self._dispatch(event_type, event.to_kwargs())
+
+    def _dispatch(self, event_type, kwargs):
+        if self.instrumentation is not None:
+            self._dispatch_instrumented(event_type, kwargs)
+            return
+
         for callback, _ in self.subscribers[event_type]:
             if kwargs: callback(**kwargs)
             else: callback()
 
-    def emit_typed(self, event):
-        """Emit a typed event object. Only typed subscribers receive it.
-        Legacy kwargs-based subscribers are NOT notified to avoid signature
-        mismatches. Systems should migrate from emit()/subscribe() to
-        emit_typed()/subscribe_typed() gradually."""
-        for callback, _ in self._typed_subscribers[type(event)]:
+        by_entity = self._targeted.get(event_type)
+        if by_entity:
+            listeners = by_entity.get(kwargs.get('entity_id'))
+            if listeners:
+                for callback, _ in listeners:
+                    callback(**kwargs)
+
+    def _dispatch_batch(self, event_type, batch):
+        stats = self.instrumentation
+        for callback, _ in self._batch_subscribers[event_type]:
+            if stats is None:
+                callback(batch)
+            else:
+                start = time.perf_counter()
+                callback(batch)
+                stats.record_call(callback, (time.perf_counter() - start) * 1000.0)
+
+    def _dispatch_instrumented(self, event_type, kwargs):
+        stats = self.instrumentation
+        handlers = list(self.subscribers[event_type])
+        by_entity = self._targeted.get(event_type)
+        if by_entity:
+            handlers.extend(by_entity.get(kwargs.get('entity_id'), ()))
+        stats.record_emit(event_type, len(handlers))
+
+        for callback, _ in handlers:
+            start = time.perf_counter()
+            if kwargs: callback(**kwargs)
+            else: callback()
+            stats.record_call(callback, (time.perf_counter() - start) * 1000.0)
+
+    def _dispatch_typed(self, event):
+        if self.instrumentation is not None:
+            self._dispatch_typed_instrumented(event)
+            return
+
+        event_class = type(event)
+        for callback, _ in self._typed_subscribers[event_class]:
+            callback(event)
+
+        by_entity = self._targeted.get(event_class)
+        if by_entity:
+            listeners = by_entity.get(getattr(event, 'entity_id', None))
+            if listeners:
+                for callback, _ in listeners:
+                    callback(event)
+
+    def _dispatch_typed_instrumented(self, event):
+        stats = self.instrumentation
+        event_class = type(event)
+        handlers = list(self._typed_subscribers[event_class])
+        by_entity = self._targeted.get(event_class)
+        if by_entity:
+            handlers.extend(by_entity.get(getattr(event, 'entity_id', None), ()))
+        stats.record_emit(event_class, len(handlers))
+
+        for callback, _ in handlers:
+            start = time.perf_counter()
             callback(event)
+            stats.record_call(callback, (time.perf_counter() - start) * 1000.0)
+
+    # -- Queued emits -------------------------------------------------------
+
+    def set_coalesce(self, event_type, key='entity_id', merge=None):
+        """Collapse queued ``event_type`` emits that share ``kwargs[key]``.
+
+        ``merge(queued_kwargs, new_kwargs)`` folds a new emit into the one
+        already queued; by default the newer values overwrite the older ones.
+        With an event class, coalescing applies to ``queue_typed`` and
+        ``merge`` receives the two event objects.
+        """
+        self._coalesce_rules[event_type] = (key, merge)
+
+    def queue(self, event_type, **kwargs):
+        """Record an emit to be dispatched at the next ``dispatch_queued()``.
+
+        Use from hot loops so handlers don't run in the middle of collision
+        resolution. Values that the caller reuses (scratch vectors) must be
+        copied before queueing.
+        """
+        rule = self._coalesce_rules.get(event_type)
+        if rule is not None:
+            key = (event_type, kwargs.get(rule[0]))
+            queued = self._coalesced.get(key)
+            if queued is not None:
+                if rule[1] is not None: rule[1](queued, kwargs)
+                else: queued.update(kwargs)
+                return
+            self._coalesced[key] = kwargs
+        self._queue.append((event_type, kwargs, None))
+
+    def queue_typed(self, event):
+        """Queue a typed event for the next ``dispatch_queued()``.
+
+        A ``PooledEvent`` is handed back to the pool once it has been
+        dispatched (or merged into an already queued one), so the caller must
+        not touch it after queueing.
+        """
+        event_class = type(event)
+        rule = self._coalesce_rules.get(event_class)
+        if rule is not None:
+            key = (event_class, getattr(event, rule[0], None))
+            queued = self._coalesced.get(key)
+            if queued is not None:
+                if rule[1] is not None: rule[1](queued, event)
+                else: queued.assign(event.to_kwargs())
+                if isinstance(event, PooledEvent):
+                    self.pool.release(event)
+                return
+            self._coalesced[key] = event
+        self._queue.append((event_class, None, event))
+
+    def dispatch_queued(self, max_rounds=8):
+        """Deliver every queued emit in order, then each batch handler once per type.
+
+        Emits queued by handlers are dispatched in a following round (up to
+        ``max_rounds``). Returns the number of events dispatched.
+        """
+        dispatched = 0
+        for _ in range(max_rounds):
+            if not self._queue:
+                break
+            queue, self._queue = self._queue, []
+            self._coalesced.clear()
+
+            batches = {}
+            for event_type, kwargs, event in queue:
+                if event is None:
+                    self._deliver_kwargs(event_type, kwargs)
+                else:
+                    self._deliver_event(event)
+                if event_type in self._batch_subscribers:
+                    batches.setdefault(event_type, []).append(kwargs if event is None else event)
+            for event_type, batch in batches.items():
+                self._dispatch_batch(event_type, batch)
+
+            release = self.pool.release
+            for _, _, event in queue:
+                if isinstance(event, PooledEvent):
+                    release(event)
+            dispatched += len(queue)
+        return dispatched
+
+    def clear_queued(self):
+        for _, _, event in self._queue:
+            if isinstance(event, PooledEvent):
+                self.pool.release(event)
+        self._queue.clear()
+        self._coalesced.clear()
+
+    @property
+    def queued_count(self) -> int:
+        return len(self._queue)
+
+    def emit_typed(self, event):
+        """Emit a typed event object to its typed and entity-targeted subscribers.
+
+        Legacy kwargs subscribers only receive it when the class was bridged
+        with ``bridge_legacy``; otherwise they are not notified, to avoid
+        signature mismatches."""
+        self._deliver_event(event)
+        if type(event) in self._batch_subscribers:
+            self._dispatch_batch(type(event), [event])
+
+    # -- Pooled typed events ------------------------------------------------
+
+    def acquire(self, event_class):
+        """Take a reusable ``event_class`` instance from the pool.
+
+        Fill it (e.g. ``acquire(DamageEvent).fill(...)``) and pass it to
+        ``emit_pooled`` or ``queue_typed``, which return it to the pool.
+        Handlers must not keep a pooled event or its vectors after returning.
+        """
+        return self.pool.acquire(event_class)
+
+    def emit_pooled(self, event):
+        """``emit_typed`` an acquired event and hand it back to the pool."""
+        self.emit_typed(event)
+        self.pool.release(event)
+
+    def bridge_legacy(self, *event_classes):
+        """Route legacy and typed emits of ``event_classes`` to both kinds of subscribers.
+
+        A typed emit reaches ``subscribe()`` listeners of the matching
+        ``GameSceneEvents`` member as ``event.to_kwargs()``, and a legacy
+        ``emit()`` reaches typed listeners through a pooled event filled from
+        the kwargs. The conversion only happens when the other side has
+        listeners. Batch subscriptions are not bridged.
+        """
+        for event_class in event_classes:
+            event_type = TYPED_EVENT_MAP.get(event_class)
+            if event_type is None or not issubclass(event_class, PooledEvent):
+                print(f"[EVENT MANAGER] Cannot bridge '{event_class.__name__}' to a legacy event. (DEBUG)")
+                continue
+            self._bridge_to_typed[event_type] = event_class
+            self._bridge_to_legacy[event_class] = event_type
 
     # -- Statistics / Debug -------------------------------------------------
 
+    def enable_instrumentation(self, enabled=True):
+        """Start (or stop) recording emit counts, fan-out and handler timings."""
+        if not enabled:
+            self.instrumentation = None
+        elif self.instrumentation is None:
+            self.instrumentation = EventStats()
+        return self.instrumentation
+
     @property
     def subscriber_count(self) -> int:
         return sum(len(cbs) for cbs in self.subscribers.values())
@@ -73,10 +388,18 @@ class EventManager:
     def typed_subscriber_count(self) -> int:
         return sum(len(cbs) for cbs in self._typed_subscribers.values())
 
+    @property
+    def targeted_subscriber_count(self) -> int:
+        return sum(len(cbs) for by_entity in self._targeted.values() for cbs in by_entity.values())
+
     def stats(self) -> dict:
         return {
             'legacy_event_types': len(self.subscribers),
             'legacy_subscribers': self.subscriber_count,
             'typed_event_types': len(self._typed_subscribers),
             'typed_subscribers': self.typed_subscriber_count,
+            'targeted_subscribers': self.targeted_subscriber_count,
+            'batch_subscribers': sum(len(cbs) for cbs in self._batch_subscribers.values()),
+            'queued': len(self._queue),
+            'pooled_events': self.pool.created,
         }
\ No newline at end of file
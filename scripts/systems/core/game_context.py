@@ -13,6 +13,12 @@ class GameContext:
         self.event_manager = None
         self.animation_handler = None
         self.audio_manager = None
+        # Frame info published by Game each render
+        self.fps = 0
+        self.dt = 0
+        self.alpha = 1.0      # interpolation between the last two simulation steps
+        self.sim_steps = 0    # simulation steps run this frame
+        self.sim_hz = 0
 
     def init(self):
         self.resource_manager = ResourceManager()
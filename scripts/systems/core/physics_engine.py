@@ -1,12 +1,17 @@
 import pygame
 
-from scripts.components.tags import EnemyTagComponent
+from scripts.components.tags import EnemyTagComponent, SuspendedTagComponent
 from scripts.ecs.component_manager import ComponentManager
 from ...components.physics import KnockbackComponent, Position, Velocity
 from ...components.physics import CollisionComponent
 from ...components.projectile import ProjectileComponent
 from ...components.render_effect import RenderEffectComponent
-from ...utils import Quadtree, INITIAL_WINDOW_SIZE, VIRTUAL_WINDOW_SIZE, GameSceneEvents, get_unit_direction_towards
+from ...utils import Quadtree, INITIAL_WINDOW_SIZE, VIRTUAL_WINDOW_SIZE, TILE_SIZE, get_unit_direction_towards
+from ...utils.events import CollisionEvent, DamageEvent, WalkEvent
+from .collision_grid import WALL_TILE, WATER_TILE, SOLID_COLLIDER, BODY_COLLIDER
+
+# Per-step displacement above which a collider is swept instead of moved per axis
+FAST_MOVER_STEP = TILE_SIZE / 2
 
 class PhysicsEngine:
     def __init__(self, component_manager: ComponentManager, event_manager):
@@ -14,13 +19,18 @@ class PhysicsEngine:
         self.event_manager = event_manager
         self.player_dashing = False
         self.player_id = None
+        self.awake_bodies = 0
+        self.sleeping_bodies = 0
 
-        self.event_manager.subscribe(GameSceneEvents.DAMAGE, self._knockback)
+        self.event_manager.subscribe_typed(DamageEvent, self._knockback)
         self._rect = pygame.FRect(0, 0, 0, 0)
+        self._probe = pygame.FRect(0, 0, 0, 0)
     
-    def _knockback(self, entity_id, proj_id, **kwargs):
+    def _knockback(self, event):
+        entity_id, proj_id = event.entity_id, event.proj_id
         if self.component_manager.get(entity_id, EnemyTagComponent):
-            proj_vel = kwargs.get('proj_vel')
+            # Pooled event vectors: a zero vector means "not provided"
+            proj_vel = event.proj_vel
             if proj_vel and proj_vel.length_squared() > 0:
                 proj_vel = proj_vel.normalize()
             else:
@@ -28,7 +38,7 @@ class PhysicsEngine:
                 if proj_vel_comp:
                     proj_vel = get_unit_direction_towards(pygame.Vector2(0, 0), proj_vel_comp.vec)
                 else:
-                    proj_pos_vec = kwargs.get('proj_pos')
+                    proj_pos_vec = event.proj_pos
                     if not proj_pos_vec:
                         proj_pos = self.component_manager.get(proj_id, Position) if isinstance(proj_id, int) and proj_id in self.component_manager._components.get(Position, {}) else None
                         proj_pos_vec = proj_pos.vec if proj_pos else None
@@ -38,146 +48,163 @@ class PhysicsEngine:
                     else:
                         proj_vel = pygame.Vector2(0, 0)
 
-            self.component_manager.add(entity_id, KnockbackComponent(proj_vel, 5, duration=0.2))
+            self.component_manager.add_deferred(entity_id, KnockbackComponent(proj_vel, 5, duration=0.2))
 
-    def update(self, scroll, fps, dt, is_dashing=False, player_id=None, static_quadtree=None, dynamic_quadtree=None):
+    def update(self, scroll, fps, dt, is_dashing=False, player_id=None, tile_grid=None, dynamic_hash=None):
         self.player_dashing = is_dashing
         self.player_id = player_id
         scale = fps if (fps and fps > 0) else 60.0
 
-        pos_dict = self.component_manager._components.get(Position, {})
-        vel_dict = self.component_manager._components.get(Velocity, {})
-        col_dict = self.component_manager._components.get(CollisionComponent, {})
-        proj_dict = self.component_manager._components.get(ProjectileComponent, {})
-        kbc_dict = self.component_manager._components.get(KnockbackComponent, {})
-        rec_dict = self.component_manager._components.get(RenderEffectComponent, {})
-
-        for entity in self.component_manager.get_entities_with(Position, Velocity):
-            position = pos_dict.get(entity)
-            velocity = vel_dict.get(entity)
-            collision_component = col_dict.get(entity)
-            if not collision_component:
-                position += velocity.vec * dt * scale
-                velocity.realistic_vel.update(velocity.vec)
+        cm = self.component_manager
+
+        # Free movers (no collider): one vectorized step through the transform store
+        # when numpy is available, otherwise one Python iteration per entity.
+        transforms = cm.transforms
+        if transforms is not None:
+            transforms.sync(cm)
+            transforms.integrate(dt * scale)
+        else:
+            for arch in cm.get_archetypes_with(Position, Velocity):
+                if CollisionComponent in arch.types:
+                    continue
+                for position, velocity in zip(arch.columns[Position], arch.columns[Velocity]):
+                    position += velocity.vec * dt * scale
+                    velocity.realistic_vel.update(velocity.vec)
 
         colliding_entities = []
-        for non_solid_component_entity in self.component_manager.get_entities_with(CollisionComponent):
-            non_solid_component = col_dict.get(non_solid_component_entity)
-            if non_solid_component.solid:
-                continue
-            if proj_dict.get(non_solid_component_entity):
+        awake = sleeping = 0
+        for arch in cm.get_archetypes_with(CollisionComponent, Position, Velocity):
+            if ProjectileComponent in arch.types or SuspendedTagComponent in arch.types:
                 continue
-
-            pos = pos_dict.get(non_solid_component_entity)
-            vel = vel_dict.get(non_solid_component_entity)
-            if not pos or not vel: continue
-
-            rect = self._rect
-            rect.x = pos.x + non_solid_component.offset.x
-            rect.y = pos.y + non_solid_component.offset.y
-            rect.w = non_solid_component.size.x
-            rect.h = non_solid_component.size.y
-
-            kvx, kvy = 0, 0
-            kbc = kbc_dict.get(non_solid_component_entity)
-            if kbc:
-                kvx, kvy = kbc.update(dt, self.component_manager, non_solid_component_entity)
-
-            vel.realistic_vel.update(vel.vec)
-
-            total_dx = (vel.x + kvx) * dt * scale
+            kbc_column = arch.columns.get(KnockbackComponent)
+            rec_column = arch.columns.get(RenderEffectComponent)
+            rows = zip(arch.entities, arch.columns[CollisionComponent], arch.columns[Position], arch.columns[Velocity])
+            for row, (non_solid_component_entity, non_solid_component, pos, vel) in enumerate(rows):
+                if non_solid_component.solid:
+                    continue
+                kbc = kbc_column[row] if kbc_column else None
+                if kbc is None and not (vel.x or vel.y):
+                    settled = vel.realistic_vel
+                    if not (settled.x or settled.y):
+                        # Sleeping: at rest since last step, nothing to move or resolve.
+                        # Velocity or a knockback impulse wakes it up
+                        sleeping += 1
+                        continue
+                awake += 1
+                rec = rec_column[row] if rec_column else None
+                self._move_collider(non_solid_component_entity, non_solid_component, pos, vel, kbc, rec,
+                                    colliding_entities, dt, scale, tile_grid, dynamic_hash)
+        self.awake_bodies = awake
+        self.sleeping_bodies = sleeping
+
+    def _move_collider(self, non_solid_component_entity, non_solid_component, pos, vel, kbc, rec,
+                       colliding_entities, dt, scale, tile_grid, dynamic_hash):
+        rect = self._rect
+        rect.x = pos.x + non_solid_component.offset.x
+        rect.y = pos.y + non_solid_component.offset.y
+        rect.w = non_solid_component.size.x
+        rect.h = non_solid_component.size.y
+
+        kvx, kvy = 0, 0
+        if kbc:
+            kvx, kvy = kbc.update(dt, self.component_manager, non_solid_component_entity)
+
+        vel.realistic_vel.update(vel.vec)
+
+        total_dx = (vel.x + kvx) * dt * scale
+        total_dy = (vel.y + kvy) * dt * scale
+
+        in_air = rec and rec.z_offset > 5.0
+        dashing = self.player_dashing and non_solid_component_entity == self.player_id
+        # Water blocks like a wall, except for the player while dashing
+        tile_mask = WALL_TILE if dashing else WALL_TILE | WATER_TILE
+
+        # Dashes and other fast movers resolve the whole step against the tiles
+        # with one swept traversal (exact contact, corners included); slower
+        # movers keep the per-axis sweeps below
+        swept = (tile_grid is not None and not in_air and
+                 (dashing or abs(total_dx) > FAST_MOVER_STEP or abs(total_dy) > FAST_MOVER_STEP))
+        hit_x = hit_y = 0
+        probe = self._probe
+        if swept:
+            probe.update(rect)
+            hit_x, hit_y = tile_grid.move(probe, total_dx, total_dy, tile_mask)
+            total_dx, total_dy = probe.x - rect.x, probe.y - rect.y
+            rect.x = probe.x
+        else:
             rect.x += total_dx
 
-            rec = rec_dict.get(non_solid_component_entity)
-            in_air = rec and rec.z_offset > 5.0
-
-            collisions = None
-            if not in_air:
-                colliding_entities.clear()
-                if static_quadtree: static_quadtree.retrieve(colliding_entities, rect)
-                if dynamic_quadtree: dynamic_quadtree.retrieve(colliding_entities, rect)
-                
-                seen_h = set()
-                for entity, colliding_rect in colliding_entities:
-                    if entity in seen_h or entity == non_solid_component_entity: continue
-                    seen_h.add(entity)
-                    
-                    layer_id = entity[0] if isinstance(entity, tuple) else entity
-                    is_water = (layer_id == "water")
-                    is_solid = (layer_id == "wall")
-                    if entity is not None and not (is_water or is_solid):
-                        comp = col_dict.get(entity)
-                        if comp: is_solid = comp.solid
-
-                    # Water logic: solid unless dashing
-                    if is_water:
-                        if self.player_dashing and non_solid_component_entity == self.player_id:
-                            is_solid = False
-                        else:
-                            is_solid = True
-
-                    if is_solid and rect.colliderect(colliding_rect):
-                        if collisions is None: collisions = {"top": False, "right": False, "bottom": False, "left": False}
-                        if total_dx > 0:
-                            rect.right = colliding_rect.left
-                            collisions["right"] = True
-                            if kbc: kbc.vx = 0
-                        elif total_dx < 0:
-                            rect.left = colliding_rect.right
-                            collisions["left"] = True
-                            if kbc: kbc.vx = 0
-                        vel.realistic_vel.x = 0
-
-            # 2. Vertical Movement & Collision
-            total_dy = (vel.y + kvy) * dt * scale
-            rect.y += total_dy
-
-            if not in_air:
-                colliding_entities.clear()
-                if static_quadtree: static_quadtree.retrieve(colliding_entities, rect)
-                if dynamic_quadtree: dynamic_quadtree.retrieve(colliding_entities, rect)
-                
-                seen_v = set()
-                for entity, colliding_rect in colliding_entities:
-                    if entity in seen_v or entity == non_solid_component_entity: continue
-                    seen_v.add(entity)
-                    
-                    layer_id = entity[0] if isinstance(entity, tuple) else entity
-                    is_water = (layer_id == "water")
-                    is_solid = (layer_id == "wall")
-                    if entity is not None and not (is_water or is_solid):
-                        comp = col_dict.get(entity)
-                        if comp: is_solid = comp.solid
-                    
-                    if is_water:
-                        if self.player_dashing and non_solid_component_entity == self.player_id:
-                            is_solid = False
-                        else:
-                            is_solid = True
-
-                    if is_solid and rect.colliderect(colliding_rect):
-                        if collisions is None: collisions = {"top": False, "right": False, "bottom": False, "left": False}
-                        if total_dy > 0:
-                            rect.bottom = colliding_rect.top
-                            collisions["bottom"] = True
-                            if kbc: kbc.vy = 0
-                        elif total_dy < 0:
-                            rect.top = colliding_rect.bottom
-                            collisions["top"] = True
-                            if kbc: kbc.vy = 0
-                        vel.realistic_vel.y = 0
-
-            if collisions is not None:
-                self.event_manager.emit(GameSceneEvents.COLLISION, entity_id=non_solid_component_entity, collisions=collisions)
-
-            # Particles WALK event
-            if vel.vec.length_squared() > 0.1:
-                if not hasattr(self, '_walk_timers'): self._walk_timers = {}
-                self._walk_timers[non_solid_component_entity] = self._walk_timers.get(non_solid_component_entity, 0) + dt
-                if self._walk_timers[non_solid_component_entity] > 0.15:
-                    self._walk_timers[non_solid_component_entity] = 0
-                    self.event_manager.emit(GameSceneEvents.WALK, pos=pos.vec, vel=vel.vec, entity_id=non_solid_component_entity)
-
-            off = non_solid_component.offset
-            pos.vec.x = rect.x - off.x
-            pos.vec.y = rect.y - off.y
+        collisions = None
+        if not in_air:
+            if not swept and tile_grid is not None and tile_grid.sweep_x(rect, total_dx, tile_mask):
+                hit_x = -1 if total_dx > 0 else 1
+            if hit_x:
+                collisions = self.event_manager.acquire(CollisionEvent).fill(non_solid_component_entity)
+                if hit_x < 0: collisions.right = True
+                else: collisions.left = True
+                if kbc: kbc.vx = 0
+                vel.realistic_vel.x = 0
+
+            colliding_entities.clear()
+            # Only solid colliders come back from the hash; this body itself is a BODY_COLLIDER
+            if dynamic_hash: dynamic_hash.retrieve(colliding_entities, rect, SOLID_COLLIDER)
+            for entity, colliding_rect in colliding_entities:
+                if rect.colliderect(colliding_rect):
+                    if collisions is None: collisions = self.event_manager.acquire(CollisionEvent).fill(non_solid_component_entity)
+                    if total_dx > 0:
+                        rect.right = colliding_rect.left
+                        collisions.right = True
+                        if kbc: kbc.vx = 0
+                    elif total_dx < 0:
+                        rect.left = colliding_rect.right
+                        collisions.left = True
+                        if kbc: kbc.vx = 0
+                    vel.realistic_vel.x = 0
+
+        # 2. Vertical Movement & Collision
+        if swept: rect.y = probe.y
+        else: rect.y += total_dy
+
+        if not in_air:
+            if not swept and tile_grid is not None and tile_grid.sweep_y(rect, total_dy, tile_mask):
+                hit_y = -1 if total_dy > 0 else 1
+            if hit_y:
+                if collisions is None: collisions = self.event_manager.acquire(CollisionEvent).fill(non_solid_component_entity)
+                if hit_y < 0: collisions.bottom = True
+                else: collisions.top = True
+                if kbc: kbc.vy = 0
+                vel.realistic_vel.y = 0
+
+            colliding_entities.clear()
+            if dynamic_hash: dynamic_hash.retrieve(colliding_entities, rect, SOLID_COLLIDER)
+            for entity, colliding_rect in colliding_entities:
+                if rect.colliderect(colliding_rect):
+                    if collisions is None: collisions = self.event_manager.acquire(CollisionEvent).fill(non_solid_component_entity)
+                    if total_dy > 0:
+                        rect.bottom = colliding_rect.top
+                        collisions.bottom = True
+                        if kbc: kbc.vy = 0
+                    elif total_dy < 0:
+                        rect.top = colliding_rect.bottom
+                        collisions.top = True
+                        if kbc: kbc.vy = 0
+                    vel.realistic_vel.y = 0
+
+        if collisions is not None:
+            self.event_manager.queue_typed(collisions)
+
+        # Particles WALK event
+        if vel.vec.length_squared() > 0.1:
+            if not hasattr(self, '_walk_timers'): self._walk_timers = {}
+            self._walk_timers[non_solid_component_entity] = self._walk_timers.get(non_solid_component_entity, 0) + dt
+            if self._walk_timers[non_solid_component_entity] > 0.15:
+                self._walk_timers[non_solid_component_entity] = 0
+                walk_pos, walk_vel = pos.vec, vel.vec
+                self.event_manager.queue_typed(self.event_manager.acquire(WalkEvent).fill(non_solid_component_entity, walk_pos.x, walk_pos.y, walk_vel.x, walk_vel.y))
+
+        off = non_solid_component.offset
+        pos.x = rect.x - off.x
+        pos.y = rect.y - off.y
+        if dynamic_hash is not None:
+            # Keep the broadphase current for the colliders moved after this one
+            dynamic_hash.update(non_solid_component_entity, rect.x, rect.y, rect.w, rect.h, BODY_COLLIDER)
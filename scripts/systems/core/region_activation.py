@@ -0,0 +1,78 @@
+from ...components.physics import Position, Velocity
+from ...components.projectile import ProjectileComponent
+from ...components.tags import SuspendedTagComponent
+from ...utils import TILE_SIZE, CHUNK_SIZE
+
+# Side of one activation region in pixels (one tilemap chunk)
+REGION_SIZE = TILE_SIZE * CHUNK_SIZE
+
+
+class RegionActivation:
+    """Suspends entities in map regions far from the camera.
+
+    The map is split into square regions ``region_size`` pixels wide; the
+    regions the camera rect touches, plus ``margin`` regions around them, are
+    active. An entity positioned outside them gets a ``SuspendedTagComponent``,
+    which moves it to its own archetype; physics, AI, animation and attack
+    patterns skip those archetypes without visiting the rows. The tag is
+    removed once the entity's region is active again.
+
+    Every positioned entity is only scanned when the active range changes
+    (the camera crossed a region border). In between, only awake movers
+    (``Position`` + ``Velocity``) are checked, so they are suspended as they
+    walk out. Changes go through the command buffer and apply at the next
+    sync point.
+    """
+
+    def __init__(self, region_size=REGION_SIZE, margin=1):
+        self.region_size = region_size
+        self.margin = margin
+        self.bounds = None  # active (rx0, ry0, rx1, ry1) in region coordinates
+        self.full_scans = 0
+        self._tag = SuspendedTagComponent()  # stateless, shared by every suspended entity
+
+    def reset(self):
+        self.bounds = None
+
+    def update(self, component_manager, camera_rect, always_active=()):
+        rs = self.region_size
+        margin = self.margin
+        bounds = (int(camera_rect.left // rs) - margin, int(camera_rect.top // rs) - margin,
+                  int(camera_rect.right // rs) + margin, int(camera_rect.bottom // rs) + margin)
+        if bounds != self.bounds:
+            self.bounds = bounds
+            self.full_scans += 1
+            self._scan(component_manager, component_manager.get_archetypes_with(Position), always_active, True)
+        else:
+            self._scan(component_manager, component_manager.get_archetypes_with(Position, Velocity), always_active, False)
+
+    def _scan(self, cm, archetypes, always_active, resume):
+        rs = self.region_size
+        rx0, ry0, rx1, ry1 = self.bounds
+        tag = self._tag
+        for arch in archetypes:
+            types = arch.types
+            if ProjectileComponent in types:
+                continue
+            suspended = SuspendedTagComponent in types
+            if suspended and not resume:
+                continue
+            for eid, pos in zip(arch.entities, arch.columns[Position]):
+                active = (rx0 <= pos.x // rs <= rx1 and ry0 <= pos.y // rs <= ry1) or eid in always_active
+                if active != suspended:
+                    continue
+                if suspended:
+                    cm.remove_deferred(eid, SuspendedTagComponent)
+                else:
+                    cm.add_deferred(eid, tag)
+
+    def suspended_count(self, component_manager):
+        return sum(len(arch) for arch in component_manager.get_archetypes_with(SuspendedTagComponent))
+
+    def stats(self, component_manager):
+        return {
+            'region_size': self.region_size,
+            'active_regions': self.bounds,
+            'suspended': self.suspended_count(component_manager),
+            'full_scans': self.full_scans,
+        }
@@ -0,0 +1,109 @@
+import time
+
+from ...ecs.sparse_set import ENTITY_INDEX_MASK
+
+
+class ScheduledSystem:
+    __slots__ = ('name', 'update', 'rate', 'period', 'shards', 'budget_ms', 'timers', 'elapsed', 'frame_ms', 'runs')
+
+    def __init__(self, name, update, rate=None, shards=1, budget_ms=None):
+        self.name = name
+        self.update = update
+        self.rate = rate
+        self.period = 1.0 / rate if rate else 0.0
+        self.shards = max(1, int(shards))
+        self.budget_ms = budget_ms
+
+        # One accumulator per shard, staggered so shards fall due on different frames
+        self.timers = [self.period * i / self.shards for i in range(self.shards)]
+        self.elapsed = [0.0] * self.shards  # dt accumulated since each shard last ticked
+        self.frame_ms = 0.0
+        self.runs = 0
+
+    def reset(self):
+        self.timers = [self.period * i / self.shards for i in range(self.shards)]
+        self.elapsed = [0.0] * self.shards
+        self.frame_ms = 0.0
+
+
+class SystemScheduler:
+    """Runs systems at their own tick rate instead of every frame.
+
+    A system registered with ``rate=10`` ticks ten times per second and
+    receives the dt accumulated since its last tick. With ``shards=n`` its
+    entities are split into ``n`` groups that each tick at ``rate`` on
+    staggered frames; the update is then called as
+    ``update(dt, shard=k, shard_count=n)`` and must only process entities of
+    shard ``k`` (see ``shard_of``).
+
+    Per-frame time spent in each system is reported to the Profiler under the
+    system's name, together with its budget.
+    """
+
+    def __init__(self, profiler=None):
+        self.profiler = profiler
+        self.systems = {}
+
+    def add(self, name, update, rate=None, shards=1, budget_ms=None):
+        system = ScheduledSystem(name, update, rate, shards, budget_ms)
+        self.systems[name] = system
+        if self.profiler:
+            self.profiler.register(name, budget_ms)
+        return system
+
+    def begin_frame(self):
+        for system in self.systems.values():
+            system.frame_ms = 0.0
+
+    def run(self, name, dt, **kwargs):
+        """Advance ``name`` by ``dt`` and run every shard that is due. Returns True if anything ran."""
+        system = self.systems[name]
+        start = time.perf_counter()
+        ran = False
+
+        if not system.period:
+            if system.shards == 1:
+                system.update(dt, **kwargs)
+            else:
+                for shard in range(system.shards):
+                    system.update(dt, shard=shard, shard_count=system.shards, **kwargs)
+            ran = True
+        else:
+            timers = system.timers
+            elapsed = system.elapsed
+            period = system.period
+            for shard in range(system.shards):
+                timers[shard] += dt
+                elapsed[shard] += dt
+                if timers[shard] < period:
+                    continue
+                # Keep the shard on its phase but never carry more than one
+                # period of debt into the next tick (no catch-up bursts)
+                timers[shard] = min(timers[shard] - period, period)
+                tick_dt = elapsed[shard]
+                elapsed[shard] = 0.0
+                if system.shards == 1:
+                    system.update(tick_dt, **kwargs)
+                else:
+                    system.update(tick_dt, shard=shard, shard_count=system.shards, **kwargs)
+                ran = True
+
+        if ran:
+            system.runs += 1
+            system.frame_ms += (time.perf_counter() - start) * 1000.0
+        return ran
+
+    def end_frame(self):
+        if not self.profiler:
+            return
+        for system in self.systems.values():
+            self.profiler.record(system.name, system.frame_ms)
+
+    def reset(self):
+        for system in self.systems.values():
+            system.reset()
+
+    @staticmethod
+    def shard_of(entity_id, shard_count):
+        # Shard on the recycled slot index so shards stay balanced across generations
+        return (entity_id & ENTITY_INDEX_MASK) % shard_count
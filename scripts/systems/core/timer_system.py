@@ -5,9 +5,8 @@ class TimerSystem:
         self.cm = component_manager
     
     def update(self, dt):
-        for eid in self.cm.get_entities_with(TimerComponent):
-            timer_comp = self.cm.get(eid, TimerComponent)
+        for eid, timer_comp in self.cm.query(TimerComponent):
             timer_comp.update(dt)
 
             if timer_comp.destroy and timer_comp.duration <= 0:
-                self.cm.remove(eid, TimerComponent)
\ No newline at end of file
+                self.cm.remove_deferred(eid, TimerComponent)
\ No newline at end of file
@@ -1,2 +1,3 @@
 from .profiler import Profiler
 from .debug_overlay import DebugOverlay
+from .event_stats import EventStats
@@ -17,6 +17,8 @@ class DebugOverlay:
         self._text_color = (200, 200, 200)
         self._header_color = (100, 255, 100)
         self._value_color = (255, 255, 255)
+        self._memory_report = None
+        self._memory_age = 0
 
     def toggle(self):
         self._visible = not self._visible
@@ -49,6 +51,7 @@ class DebugOverlay:
         tween_count = game_scene.tween_system.count if hasattr(game_scene, 'tween_system') else 0
         lines.append(('FPS', f'{fps}'))
         lines.append(('Frame time', f'{dt*1000:.1f} ms'))
+        lines.append(('Sim steps', f"{getattr(ctx, 'sim_steps', 0)} @ {getattr(ctx, 'sim_hz', 0)} Hz (a={getattr(ctx, 'alpha', 1.0):.2f})"))
 
         time_scale = 1.0
         if hasattr(game_scene, 'gamefeel') and game_scene.gamefeel:
@@ -63,12 +66,18 @@ class DebugOverlay:
         entity_count = len(em.entities) if hasattr(em, 'entities') else 0
         lines.append(('Entities', f'{entity_count}'))
         cm = game_scene.component_manager
+        if hasattr(cm, 'query_stats'):
+            q = cm.query_stats()
+            lines.append(('Archetypes', f'{q["archetypes"]}'))
+            lines.append(('Query cache', f'{q["hits"]} hit  {q["misses"]} miss  {q["rebuilds"]} rebuild'))
+        if hasattr(cm, 'memory_report'):
+            self._collect_memory(cm, entity_count, lines)
 
         proj_count = 0
         if hasattr(game_scene, 'combat_system') and game_scene.combat_system:
             fps = getattr(game_scene.combat_system, 'projectile_system', None)
-            if fps and hasattr(fps, 'active_indices'):
-                proj_count = len(fps.active_indices)
+            if fps and hasattr(fps, 'active_count'):
+                proj_count = fps.active_count
 
         particle_count = 0
         if hasattr(game_scene, 'render_system') and game_scene.render_system:
@@ -76,13 +85,20 @@ class DebugOverlay:
             if ps and hasattr(ps, 'active_indices'):
                 particle_count = len(ps.active_indices)
 
+        activation = getattr(game_scene, 'region_activation', None)
+        if activation:
+            lines.append(('Suspended', f'{activation.suspended_count(cm)}'))
+        physics = getattr(game_scene, 'physics_engine', None)
+        if physics:
+            lines.append(('Bodies', f'{physics.awake_bodies} awake  {physics.sleeping_bodies} sleeping'))
+
         lines.append(('Projectiles', f'{proj_count}'))
         lines.append(('Particles', f'{particle_count}'))
 
-        # Collision grid size
-        cg = getattr(game_scene, 'level', None)
-        if cg and hasattr(cg, 'collision_grid'):
-            lines.append(('Collision cells', f'{len(cg.collision_grid)}'))
+        # Static collision grid size
+        grid = getattr(getattr(game_scene, 'level', None), 'tile_grid', None)
+        if grid:
+            lines.append(('Collision cells', f'{grid.width}x{grid.height} ({len(grid.cells) // 1024} KB)'))
 
     def _collect_pools(self, game_scene, lines):
         lines.append(('', ''))
@@ -119,6 +135,19 @@ class DebugOverlay:
             lines.append(('', ''))
             lines.append(('Legacy subs', f'{s.get("legacy_subscribers", 0)}'))
             lines.append(('Typed subs', f'{s.get("typed_subscribers", 0)}'))
+            lines.append(('Entity subs', f'{s.get("targeted_subscribers", 0)}'))
+            lines.append(('Pooled events', f'{s.get("pooled_events", 0)}'))
+
+            stats = getattr(em, 'instrumentation', None)
+            if stats is not None:
+                emits = sum(stats.last_frame_emits.values())
+                lines.append(('Emits/frame', f'{emits}'))
+                for entry in stats.top_fan_out(2):
+                    lines.append((f'  {entry["event"]}', f'{entry["avg_handlers"]:.1f} avg  {entry["max_handlers"]} max handlers'))
+                for entry in stats.top_handlers(3):
+                    parts = entry['handler'].split('.')
+                    name = f'{parts[0]}.{parts[-1]}' if len(parts) > 1 else parts[0]
+                    lines.append((f'  {name}', f'{entry["calls"]} x {entry["avg_ms"]:.3f} ms'))
 
     def _collect_camera(self, game_scene, lines):
         camera = getattr(game_scene, 'camera', None)
@@ -131,6 +160,20 @@ class DebugOverlay:
             if shake and (shake.x != 0 or shake.y != 0):
                 lines.append(('Shake', f'({shake.x:.1f}, {shake.y:.1f})'))
 
+    def _collect_memory(self, cm, entity_count, lines):
+        # Sampling every component type is too slow for every frame
+        if self._memory_report is None or self._memory_age >= 60:
+            self._memory_report = cm.memory_report()
+            self._memory_age = 0
+        self._memory_age += 1
+
+        report = self._memory_report
+        total = sum(r['bytes'] + r['storage_bytes'] for r in report.values())
+        per_entity = total // entity_count if entity_count else 0
+        lines.append(('ECS memory', f'{total / 1024:.0f} KB  {per_entity} B/entity'))
+        for name, r in list(report.items())[:3]:
+            lines.append((f'  {name}', f'{r["count"]} x {r["bytes_per_instance"]} B'))
+
     def _collect_profiler(self, game_scene, lines):
         profiler = getattr(game_scene, 'profiler', None)
         if not profiler:
@@ -141,7 +184,10 @@ class DebugOverlay:
             avg = data.get('avg_ms', 0)
             last = data.get('last_ms', 0)
             if avg > 0:
-                lines.append((tag, f'{avg:.2f} avg  {last:.2f} ms'))
+                if 'budget_pct' in data:
+                    lines.append((tag, f'{avg:.2f} avg  {last:.2f} ms  {data["budget_pct"]:.0f}%'))
+                else:
+                    lines.append((tag, f'{avg:.2f} avg  {last:.2f} ms'))
 
     def _draw_panel(self, screen, lines):
         if not self._font:
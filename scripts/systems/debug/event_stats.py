@@ -0,0 +1,107 @@
+from __future__ import annotations
+import json
+from collections import defaultdict
+
+
+def _event_name(event_type) -> str:
+    return getattr(event_type, 'name', None) or getattr(event_type, '__name__', None) or str(event_type)
+
+
+def _handler_name(callback) -> str:
+    func = getattr(callback, '__func__', callback)
+    name = getattr(func, '__qualname__', None) or repr(callback)
+    code = getattr(func, '__code__', None)
+    if code is not None and '<lambda>' in name:
+        # Lambdas all share one qualname; the line tells them apart
+        name = f'{name}:{code.co_firstlineno}'
+    return name
+
+
+class EventStats:
+    """Optional EventManager instrumentation.
+
+    Enabled with ``event_manager.enable_instrumentation()``. Records emits
+    per event type per frame, how many handlers each emit reached (fan-out)
+    and call count / cumulative time per handler. ``end_frame()`` rolls the
+    per-frame counters; ``report()`` summarizes and ``export(path)`` writes
+    the full report as JSON.
+    """
+
+    def __init__(self):
+        self.frames = 0
+        self._frame_emits = defaultdict(int)      # {event_type: emits this frame}
+        self.last_frame_emits: dict = {}
+        self.total_emits = defaultdict(int)       # {event_type: emits}
+        self.peak_frame_emits = defaultdict(int)  # {event_type: most emits in one frame}
+        self.fan_out = defaultdict(lambda: [0, 0])  # {event_type: [max handlers, total handler calls]}
+        self.handlers = {}                        # {callback: [calls, total_ms, max_ms]}
+
+    def record_emit(self, event_type, fan_out: int):
+        self._frame_emits[event_type] += 1
+        self.total_emits[event_type] += 1
+        entry = self.fan_out[event_type]
+        if fan_out > entry[0]:
+            entry[0] = fan_out
+        entry[1] += fan_out
+
+    def record_call(self, callback, elapsed_ms: float):
+        entry = self.handlers.get(callback)
+        if entry is None:
+            self.handlers[callback] = [1, elapsed_ms, elapsed_ms]
+            return
+        entry[0] += 1
+        entry[1] += elapsed_ms
+        if elapsed_ms > entry[2]:
+            entry[2] = elapsed_ms
+
+    def end_frame(self):
+        frame = self._frame_emits
+        for event_type, count in frame.items():
+            if count > self.peak_frame_emits[event_type]:
+                self.peak_frame_emits[event_type] = count
+        self.last_frame_emits = dict(frame)
+        frame.clear()
+        self.frames += 1
+
+    def reset(self):
+        self.__init__()
+
+    def top_handlers(self, count: int | None = 5) -> list[dict]:
+        ranked = sorted(self.handlers.items(), key=lambda item: item[1][1], reverse=True)
+        if count is not None:
+            ranked = ranked[:count]
+        return [{
+            'handler': _handler_name(callback),
+            'calls': calls,
+            'total_ms': total_ms,
+            'avg_ms': total_ms / calls,
+            'max_ms': max_ms,
+        } for callback, (calls, total_ms, max_ms) in ranked]
+
+    def top_fan_out(self, count: int | None = 5) -> list[dict]:
+        ranked = sorted(self.fan_out.items(), key=lambda item: (item[1][0], item[1][1]), reverse=True)
+        if count is not None:
+            ranked = ranked[:count]
+        return [{
+            'event': _event_name(event_type),
+            'max_handlers': max_handlers,
+            'handler_calls': handler_calls,
+            'avg_handlers': handler_calls / max(1, self.total_emits[event_type]),
+        } for event_type, (max_handlers, handler_calls) in ranked]
+
+    def report(self, top: int | None = 5) -> dict:
+        frames = max(1, self.frames)
+        return {
+            'frames': self.frames,
+            'emits_last_frame': {_event_name(t): n for t, n in self.last_frame_emits.items()},
+            'emits_per_frame': {_event_name(t): n / frames for t, n in self.total_emits.items()},
+            'peak_emits_per_frame': {_event_name(t): n for t, n in self.peak_frame_emits.items()},
+            'fan_out': self.top_fan_out(top),
+            'handlers': self.top_handlers(top),
+        }
+
+    def export(self, path: str = 'event_stats.json'):
+        with open(path, 'w') as f:
+            json.dump(self.report(top=None), f, indent=2)
+        print(f"[EVENT STATS] Exported {len(self.handlers)} handlers over {self.frames} frames to '{path}' (DEBUG)")
+        return path
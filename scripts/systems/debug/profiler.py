@@ -9,6 +9,9 @@ class Profiler:
         profiler.begin('physics')
         self.physics_engine.update(...)
         profiler.end('physics')
+
+    Systems run by the SystemScheduler are registered with an optional
+    per-frame budget and report their time through ``record``.
     """
 
     TAGS = [
@@ -20,6 +23,7 @@ class Profiler:
         self.history = history
         self._frame_records: dict[str, list[float]] = {}
         self._current: dict[str, float] = {}
+        self._budgets: dict[str, float] = {}
         for tag in self.TAGS:
             self._frame_records[tag] = []
         self._paused = False
@@ -37,9 +41,19 @@ class Profiler:
         if self._paused or tag not in self._current:
             return
         elapsed = (time.perf_counter() - self._current.pop(tag)) * 1000.0
+        self.record(tag, elapsed)
+
+    def register(self, tag: str, budget_ms: float | None = None):
+        self._frame_records.setdefault(tag, [])
+        if budget_ms is not None:
+            self._budgets[tag] = budget_ms
+
+    def record(self, tag: str, elapsed_ms: float):
+        if self._paused:
+            return
         records = self._frame_records.get(tag)
         if records is not None:
-            records.append(elapsed)
+            records.append(elapsed_ms)
             if len(records) > self.history:
                 records.pop(0)
 
@@ -56,11 +70,16 @@ class Profiler:
             if not records:
                 result[tag] = {'avg_ms': 0.0, 'last_ms': 0.0, 'max_ms': 0.0}
                 continue
+            avg = sum(records) / len(records)
             result[tag] = {
-                'avg_ms': sum(records) / len(records),
+                'avg_ms': avg,
                 'last_ms': records[-1],
                 'max_ms': max(records),
             }
+            budget = self._budgets.get(tag)
+            if budget:
+                result[tag]['budget_ms'] = budget
+                result[tag]['budget_pct'] = avg / budget * 100.0
         return result
 
     @property
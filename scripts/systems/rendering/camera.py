@@ -14,6 +14,9 @@ class Camera:
         self._cached_scroll_int = pygame.Vector2(0, 0)
         self._cached_center = pygame.Vector2(0, 0)
         self._cached_rect = pygame.Rect(0, 0, *VIRTUAL_WINDOW_SIZE)
+        # Scroll after the last two simulation steps, for interpolated rendering
+        self._sim_scroll = pygame.Vector2(0, 0)
+        self._prev_scroll = pygame.Vector2(0, 0)
 
         self.zoom = 1
 
@@ -60,13 +63,29 @@ class Camera:
             self.shake_offset.update(0, 0)
             self.shake_intensity = 0.0
 
-        self._cached_scroll.update(self._scroll)
-        self._cached_scroll += self.shake_offset
-        self._cached_scroll_int.update(int(self._cached_scroll.x), int(self._cached_scroll.y))
-        self._cached_center.update(self._cached_scroll)
+        self._sim_scroll.update(self._scroll)
+        self._sim_scroll += self.shake_offset
+        self._set_scroll(self._sim_scroll)
+
+    def _set_scroll(self, scroll):
+        self._cached_scroll.update(scroll)
+        self._cached_scroll_int.update(int(scroll.x), int(scroll.y))
+        self._cached_center.update(scroll)
         self._cached_center += CENTER
         self._cached_rect.topleft = self._cached_scroll_int
 
+    def store_previous(self):
+        """Call before a simulation step: the current scroll becomes the one to interpolate from."""
+        self._prev_scroll.update(self._sim_scroll)
+
+    def set_render_alpha(self, alpha, snap_distance=None):
+        """Point ``scroll`` / ``rect`` between the last two steps for drawing; 1.0 restores the simulated view."""
+        if alpha >= 1.0 or (snap_distance is not None and
+                            self._prev_scroll.distance_squared_to(self._sim_scroll) > snap_distance * snap_distance):
+            self._set_scroll(self._sim_scroll)
+        else:
+            self._set_scroll(self._prev_scroll.lerp(self._sim_scroll, alpha))
+
     def set_target(self, entity_id):
         self.target_entity_id = entity_id
 
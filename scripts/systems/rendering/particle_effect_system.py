@@ -23,6 +23,7 @@ class FastParticle:
 class ParticleEffectSystem:
     def __init__(self, component_manager, entity_manager, capacity=4000):
         self.cm = component_manager
+        self.entity_manager = entity_manager
         self.capacity = capacity
         self.pool = ObjectPool(FastParticle, capacity=capacity, grow=True, max_capacity=8000)
         self.active_indices = []
@@ -87,7 +88,7 @@ class ParticleEffectSystem:
                     emitter.elapsed = 0
                 else:
                     emitter.active = False
-                    self.cm.remove_all(eid)
+                    self.entity_manager.delete_entity(eid)
                     continue
 
             particles_to_emit = int(emitter.time_since_emit * emitter.rate)
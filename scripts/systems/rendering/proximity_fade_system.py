@@ -1,23 +1,21 @@
 from ...components.render_effect import ProximityFadeComponent
 from ...components.physics import Position
 from ...components.render_effect import RenderEffectComponent
+from ...ecs.sparse_set import ENTITY_INDEX_MASK
 
 class ProximityFadeSystem:
     def __init__(self, component_manager):
         self.cm = component_manager
 
-    def update(self):
-        for entity in self.cm.get_entities_with(ProximityFadeComponent, Position, RenderEffectComponent):
-            fade = self.cm.get(entity, ProximityFadeComponent)
-            pos = self.cm.get(entity, Position)
-            rec = self.cm.get(entity, RenderEffectComponent)
+    def update(self, dt=0, shard=0, shard_count=1):
+        for entity, fade, pos, rec in self.cm.query(ProximityFadeComponent, Position, RenderEffectComponent):
+            if shard_count > 1 and (entity & ENTITY_INDEX_MASK) % shard_count != shard:
+                continue
 
             # Find nearest target
             closest = float("inf")
             for target_tag in fade.targets:
-                ids = self.cm.get_entities_with(target_tag, Position)
-                for target_id in ids:
-                    target_pos = self.cm.get(target_id, Position)
+                for _, _, target_pos in self.cm.query(target_tag, Position):
                     dist = (target_pos.vec - pos.vec).length_squared()
                     closest = min(closest, dist)
 
@@ -2,6 +2,7 @@ from scripts.components.physics import Velocity
 from ...components.render_effect import RenderEffectComponent, ProximityFadeComponent
 from ...components.combat import WeaponComponent, HealthComponent
 from ...utils import GameSceneEvents
+from ...utils.events import DamageEvent
 from ...utils.tween import Tween, ease_out_quad
 
 import pygame
@@ -12,17 +13,7 @@ class RenderEffectSystem:
         self.tween_system = None  # Set externally by GameScene
 
         event_manager.subscribe(GameSceneEvents.SHOOT, lambda entity_id: self._tweened_squash(entity_id, (0.9, 1.05)))
-        event_manager.subscribe(
-            GameSceneEvents.DAMAGE,
-            self.trigger_flash,
-            lambda entity_id, **args: self._tweened_squash(entity_id, target_scale=(1, 0.8)),
-            lambda entity_id, proj_id, **args: self.trigger_rotate(
-                entity_id, 
-                angle=15 * (-1 if args.get('proj_vel', pygame.Vector2(0,0)).x > 0 else 1), 
-                lerp=True, 
-                duration=0.2
-            ) if not args.get('death') else None,
-        )
+        event_manager.subscribe_typed(DamageEvent, self._on_damage)
         event_manager.subscribe(GameSceneEvents.DEATH, self.trigger_death_effect)
         event_manager.subscribe(GameSceneEvents.DASH_START, lambda entity_id, duration: self.trigger_dash_blink(entity_id, duration))
 
@@ -54,6 +45,13 @@ class RenderEffectSystem:
         if render_effect_comp:
             render_effect_comp.disabled = True
  
+    def _on_damage(self, event: DamageEvent):
+        entity_id = event.entity_id
+        self.trigger_flash(entity_id)
+        self._tweened_squash(entity_id, target_scale=(1, 0.8))
+        if not event.death:
+            self.trigger_rotate(entity_id, angle=15 * (-1 if event.proj_vel.x > 0 else 1), lerp=True, duration=0.2)
+
     def trigger_flash(self, entity_id, **args):
         self.add_effect(entity_id, "flash", {
             "color": (255, 255, 255),
@@ -217,4 +215,4 @@ class RenderEffectSystem:
                     del render_effect_comp.effect_timers["fade"]
 
             if len(render_effect_comp.effect_data) == 0:
-                self.component_manager.remove(entity_id, RenderEffectComponent)
+                self.component_manager.remove_deferred(entity_id, RenderEffectComponent)
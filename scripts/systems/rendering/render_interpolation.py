@@ -0,0 +1,112 @@
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; without it there is no transform store to snapshot
+    np = None
+
+from ...components.physics import Position, Velocity, CollisionComponent
+from ...utils import TILE_SIZE
+
+
+class RenderInterpolation:
+    """Draws moving entities between the last two fixed simulation steps.
+
+    ``capture`` runs before every step and records where each entity with
+    ``Position`` + ``Velocity`` was. For the draw, ``apply(alpha)`` moves
+    them to ``previous + (current - previous) * alpha`` and ``restore`` puts
+    the simulated positions back. Jumps longer than ``snap_distance``
+    (respawns, teleports) are drawn where they landed.
+
+    Entities bound to the component manager's ``TransformStore`` are
+    snapshotted and interpolated as one array; only the others (those with a
+    ``CollisionComponent``) go through the per-object loop. A free mover
+    created since the last physics step is not bound yet and is drawn where
+    it is for that frame.
+    """
+
+    def __init__(self, snap_distance=TILE_SIZE * 4):
+        self.snap_distance = snap_distance
+        self.snap_distance_sq = snap_distance * snap_distance
+        self.previous = []  # [(Position, x, y)] before the last step
+        self._applied = []  # [(Position, x, y)] simulated values to restore
+
+        # Transform store snapshot: rows 0..n of its x / y columns before the last step
+        self._store = None
+        self._store_previous = None
+        self._store_positions = []  # [Position] per snapshot row
+        self._store_releases = 0
+        self._applied_rows = None   # store rows moved by apply, and their simulated x / y
+        self._applied_values = None
+
+    def capture(self, component_manager):
+        previous = self.previous
+        previous.clear()
+        store = component_manager.transforms
+        for arch in component_manager.get_archetypes_with(Position, Velocity):
+            if store is not None and CollisionComponent not in arch.types:
+                continue  # free movers live in the transform store
+            for pos in arch.columns[Position]:
+                previous.append((pos, pos.x, pos.y))
+
+        self._store = store
+        self._store_previous = None
+        if store is not None and store.count:
+            n = store.count
+            self._store_previous = store.data[:n, 0:2].copy()
+            self._store_positions = store.positions[:n]
+            self._store_releases = store.releases
+
+    def apply(self, alpha):
+        if alpha >= 1.0:
+            return
+        applied = self._applied
+        snap = self.snap_distance_sq
+        for pos, px, py in self.previous:
+            x, y = pos.x, pos.y
+            dx, dy = x - px, y - py
+            if (not dx and not dy) or dx * dx + dy * dy > snap:
+                continue
+            applied.append((pos, x, y))
+            pos.x = px + dx * alpha
+            pos.y = py + dy * alpha
+
+        prev = self._store_previous
+        if prev is None:
+            return
+        store = self._store
+        if store.releases != self._store_releases:
+            # A release moved rows since the snapshot; match them by component instead
+            for pos, (px, py) in zip(self._store_positions, prev.tolist()):
+                x, y = pos.x, pos.y
+                dx, dy = x - px, y - py
+                if (not dx and not dy) or dx * dx + dy * dy > snap:
+                    continue
+                applied.append((pos, x, y))
+                pos.x = px + dx * alpha
+                pos.y = py + dy * alpha
+            return
+        # Rows are only appended without a release, so snapshot row i is still row i
+        current = store.data[:len(prev), 0:2]
+        delta = current - prev
+        dist_sq = (delta * delta).sum(axis=1)
+        rows = np.flatnonzero((dist_sq > 0) & (dist_sq <= snap))
+        if rows.size:
+            self._applied_rows = rows
+            self._applied_values = current[rows]
+            current[rows] = prev[rows] + delta[rows] * alpha
+
+    def restore(self):
+        for pos, x, y in self._applied:
+            pos.x = x
+            pos.y = y
+        self._applied.clear()
+        rows = self._applied_rows
+        if rows is not None:
+            self._store.data[rows, 0:2] = self._applied_values
+            self._applied_rows = self._applied_values = None
+
+    def clear(self):
+        self.previous.clear()
+        self._applied.clear()
+        self._store_previous = None
+        self._store_positions = []
+        self._applied_rows = self._applied_values = None
@@ -5,6 +5,7 @@ from ...components.physics import Position, Velocity, CollisionComponent
 from ...components.animation import RenderComponent, AnimationComponent
 from ...components.render_effect import RenderEffectComponent, YSortRender, ShadowComponent, WindAffectedComponent, PulseComponent
 from ...components.destructible import DestructibleComponent
+from ...components.tags import SuspendedTagComponent
 
 from .wind_system import WindSystem
 from ..animation.animation_state_machine import AnimationStateMachine
@@ -33,8 +34,18 @@ class RenderSystem:
     def update(self, dt, tilemap=None, camera=None, quadtree=None, mouse_pos=None):
         self.render_effect_system.update(dt)
         self.particle_effect_system.update(dt, quadtree=None, camera_rect=camera.rect if camera else None) 
-        self.proximity_fade_system.update()
         self.wind_system.update(dt)
+
+        for eid in self.component_manager.get_entities_with(PulseComponent):
+            pulse = self.component_manager.get(eid, PulseComponent)
+            pulse.time += dt
+
+    def update_grass(self, dt, camera=None):
+        """Bend grass around nearby entities and projectiles.
+
+        Split out of ``update`` so the scheduler can run it below frame rate;
+        ``dt`` is the time since the previous grass tick.
+        """
         # Collect grass interactors
         if not hasattr(self, '_interactors'):
             self._interactors = []
@@ -59,13 +70,12 @@ class RenderSystem:
         # 2. Projectiles (scaled by their physical size)
         if hasattr(self, 'combat_system') and self.combat_system:
             p_sys = self.combat_system.projectile_system
-            if hasattr(p_sys, 'active_indices'):
+            if hasattr(p_sys, 'bodies'):
                 # FastProjectileSystem logic
-                for idx in p_sys.active_indices:
-                    p = p_sys.pool[idx]
-                    p_radius = (p.size / 2) + 6
+                for x, y, _, _, size in p_sys.bodies():
+                    p_radius = (size / 2) + 6
                     prsq = p_radius * p_radius
-                    interactors.append((p.x, p.y, prsq, 1.0 / prsq, 1.5))
+                    interactors.append((x, y, prsq, 1.0 / prsq, 1.5))
             elif hasattr(p_sys, 'component_manager'):
                 for pid in p_sys.component_manager.get_entities_with(ProjectileComponent):
                     p_pos = p_sys.component_manager.get(pid, Position)
@@ -74,10 +84,6 @@ class RenderSystem:
                         interactors.append((p_pos.x, p_pos.y, prsq, 1.0 / prsq, 1.5))
 
         self.grass_system.update(dt, interactors, self.wind_system.magnitude_x, self.wind_system.time, camera.rect if camera else None)
-        
-        for eid in self.component_manager.get_entities_with(PulseComponent):
-            pulse = self.component_manager.get(eid, PulseComponent)
-            pulse.time += dt
     
     def render(self, surface, tilemap, camera):
         # Draw directly to virtual surface to avoid buffer issues
@@ -101,48 +107,22 @@ class RenderSystem:
 
         # Entities
         cm = self.component_manager
-        for eid in cm.get_entities_with(Position):
-            pos = cm.get(eid, Position)
-            sx, sy = int(pos.x - scroll.x), int(pos.y - scroll.y)
-
-            if not screen_rect.inflate(256, 256).collidepoint(sx, sy):
-                continue
-
-            dc, render, anim, rec, ysort, shadow, pulse = cm.get_many(
-                eid, DestructibleComponent, RenderComponent, AnimationComponent,
-                RenderEffectComponent, YSortRender, ShadowComponent, PulseComponent
+        cull_rect = screen_rect.inflate(256, 256)
+        for arch in cm.get_archetypes_with(Position):
+            columns = arch.columns
+            dc_col, render_col, anim_col, rec_col, ysort_col, shadow_col, pulse_col = (
+                columns.get(DestructibleComponent), columns.get(RenderComponent), columns.get(AnimationComponent),
+                columns.get(RenderEffectComponent), columns.get(YSortRender), columns.get(ShadowComponent), columns.get(PulseComponent)
             )
-            if dc and dc.shattered:
-                continue
-
-            # Effects
-            if rec and not rec.disabled:
-                scale, tint, alpha, rotation, z_off = rec.scale, rec.tint, rec.alpha, rec.rotation, rec.z_offset
-            else:
-                scale, tint, alpha, rotation, z_off = None, None, None, 0.0, 0.0
-
-            sort_y = int(pos.y) + (ysort.offset[1] if ysort else 0)
-
-            # Pulse
-            if pulse:
-                p_val = (math.sin(pulse.time * pulse.speed) + 1) / 2
-                dr = int(pulse.radius * (0.8 + 0.4 * p_val))
-                if dr > 0:
-                    surface.blit(self._get_pulse_surf(pulse, dr), (sx - dr, sy - dr))
-
-            # Shadow
-            if shadow:
-                s_pos = (sx + int(shadow.offset[0]), sy + int(shadow.offset[1]))
-                ysort_queue.append((sort_y, "shadow", shadow.surface, s_pos, shadow.alpha))
+            if not (render_col or anim_col or shadow_col or pulse_col):
+                continue # nothing drawable in this table
 
-            if render:
-                cached = self._get_transformed_sprite(render.surface, scale, tint, alpha, rotation)
-                d_pos = (sx + int(render.offset.x), sy + int(render.offset.y - z_off))
-                ysort_queue.append((sort_y, "sprite", cached, d_pos))
-
-            if anim:
-                a_pos = (sx + int(anim.offset.x), sy + int(anim.offset.y - z_off))
-                ysort_queue.append((sort_y, "animation", anim, a_pos, scale, tint, alpha, rotation))
+            for row, pos in enumerate(columns[Position]):
+                self._collect_entity(surface, ysort_queue, cull_rect, scroll, pos,
+                    dc_col[row] if dc_col else None, render_col[row] if render_col else None,
+                    anim_col[row] if anim_col else None, rec_col[row] if rec_col else None,
+                    ysort_col[row] if ysort_col else None, shadow_col[row] if shadow_col else None,
+                    pulse_col[row] if pulse_col else None)
 
         # Destructible shattered shards
         if hasattr(self, 'destructible_system') and self.destructible_system:
@@ -166,7 +146,43 @@ class RenderSystem:
                 item[2].animation.render(surface, item[3], scale=item[4], tint=item[5], alpha=item[6], angle=item[7], offset=ZERO_VEC)
         flush()
 
+    def _collect_entity(self, surface, ysort_queue, cull_rect, scroll, pos, dc, render, anim, rec, ysort, shadow, pulse):
+        sx, sy = int(pos.x - scroll.x), int(pos.y - scroll.y)
+
+        if not cull_rect.collidepoint(sx, sy):
+            return
+
+        if dc and dc.shattered:
+            return
+
+        # Effects
+        if rec and not rec.disabled:
+            scale, tint, alpha, rotation, z_off = rec.scale, rec.tint, rec.alpha, rec.rotation, rec.z_offset
+        else:
+            scale, tint, alpha, rotation, z_off = None, None, None, 0.0, 0.0
 
+        sort_y = int(pos.y) + (ysort.offset[1] if ysort else 0)
+
+        # Pulse
+        if pulse:
+            p_val = (math.sin(pulse.time * pulse.speed) + 1) / 2
+            dr = int(pulse.radius * (0.8 + 0.4 * p_val))
+            if dr > 0:
+                surface.blit(self._get_pulse_surf(pulse, dr), (sx - dr, sy - dr))
+
+        # Shadow
+        if shadow:
+            s_pos = (sx + int(shadow.offset[0]), sy + int(shadow.offset[1]))
+            ysort_queue.append((sort_y, "shadow", shadow.surface, s_pos, shadow.alpha))
+
+        if render:
+            cached = self._get_transformed_sprite(render.surface, scale, tint, alpha, rotation)
+            d_pos = (sx + int(render.offset.x), sy + int(render.offset.y - z_off))
+            ysort_queue.append((sort_y, "sprite", cached, d_pos))
+
+        if anim:
+            a_pos = (sx + int(anim.offset.x), sy + int(anim.offset.y - z_off))
+            ysort_queue.append((sort_y, "animation", anim, a_pos, scale, tint, alpha, rotation))
 
     def _get_pulse_surf(self, pulse, dr):
         ck = (pulse.color[0], pulse.color[1], pulse.color[2], pulse.alpha, dr)
@@ -199,17 +215,21 @@ class AnimationSystem:
         self.component_manager = component_manager
     
     def update(self, fps, dt, camera_rect=None):
-        for eid in self.component_manager.get_entities_with(AnimationStateMachine):
-            asm = self.component_manager.get(eid, AnimationStateMachine)
-            if asm.animation_component.entity_type == "chess_piece":
-                vel_comp = self.component_manager._components.get(Velocity, {}).get(eid)
-                if vel_comp:
-                    suggested = "moving" if vel_comp.vec.length_squared() > 0 else "idle"
+        # Suspended archetypes (far from the camera) are skipped without visiting their rows
+        cm = self.component_manager
+        for arch in cm.get_archetypes_with(AnimationStateMachine, Velocity):
+            if SuspendedTagComponent in arch.types:
+                continue
+            for asm, vel_comp in zip(arch.columns[AnimationStateMachine], arch.columns[Velocity]):
+                if asm.animation_component.entity_type == "chess_piece":
+                    suggested = "moving" if vel_comp.x or vel_comp.y else "idle"
                     asm.set_animation(suggested)
         
-        for eid in self.component_manager.get_entities_with(AnimationComponent, Position):
-            if camera_rect:
-                pos = self.component_manager.get(eid, Position)
-                if not camera_rect.inflate(200, 200).collidepoint(pos.x, pos.y):
+        cull_rect = camera_rect.inflate(200, 200) if camera_rect else None
+        for arch in cm.get_archetypes_with(AnimationComponent, Position):
+            if SuspendedTagComponent in arch.types:
+                continue
+            for anim, pos in zip(arch.columns[AnimationComponent], arch.columns[Position]):
+                if cull_rect and not cull_rect.collidepoint(pos.x, pos.y):
                     continue
-            self.component_manager.get(eid, AnimationComponent).update(fps, dt)
+                anim.update(fps, dt)
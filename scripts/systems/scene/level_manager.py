@@ -6,13 +6,13 @@ from ...utils.json_schemas import LEVEL_SCHEMA
 from ...components.ai import AIComponent
 from ...components.animation import RenderComponent
 from ...components.render_effect import YSortRender
-from ..core.collision_grid import CollisionGrid
+from ..core.collision_grid import TileGrid
 
 class Level:
     def __init__(self, ctx):
         self.ctx = ctx
         self.tilemap = None
-        self.collision_grid = None
+        self.tile_grid = None
 
         self.collidables = ["wall", "water"]
     
@@ -28,30 +28,9 @@ class Level:
         if hasattr(render_system, 'grass_system'):
             render_system.grass_system.generate_grass(self.tilemap.layers)
 
-        # Build Static Quadtree for walls and water
-        from ...utils import Quadtree
-        min_x, min_y, max_x, max_y = self.tilemap.world_bounds
-        # Root rect covers the entire level with a bit of padding
-        root_rect = (min_x - 100, min_y - 100, (max_x - min_x) + 200, (max_y - min_y) + 200)
-        self.static_quadtree = Quadtree(0, root_rect)
-
-        # Create collision boxes per collidable layer
-        self.collision_grid = []
-        for layer_id in self.collidables:
-            layer_data = layers.get(layer_id, [])
-            tiles = layer_data.get("tiles", []) if isinstance(layer_data, dict) else layer_data
-            
-            cg = CollisionGrid(tiles)
-            # We no longer create ECS entities for every single static tile.
-            # Instead, the static_quadtree handles their collisions.
-            self.collision_grid.append((layer_id, cg))
-            
-            from ...utils import TILE_SIZE
-            for tile in tiles:
-                tpos = tuple(tile[0])
-                rect = pygame.Rect(tpos[0], tpos[1], TILE_SIZE, TILE_SIZE)
-                # Unique ID per tile: (layer, position)
-                self.static_quadtree.insert((layer_id, tpos), rect)
+        # Walls and water go into one occupancy grid (a flag byte per tile)
+        # instead of ECS entities or per-tile broadphase entries
+        self.tile_grid = TileGrid.from_layers(layers, self.collidables)
 
         # Auto-generate water animation frames (tileable Worley overlay) and build chunk-based water animations
         try:
@@ -142,16 +121,15 @@ class Level:
             destructibles_data = layer_data
 
         if destructibles_data:
-            for tile_pos, _, _, _, _ in destructibles_data:
-                entity_factory.create_destructible(
-                    pos=tile_pos,
-                    component_manager=component_manager,
-                    entity_manager=entity_manager,
-                    event_manager=self.ctx.event_manager,
-                    animation_handler=self.ctx.animation_handler,
-                    input_system=self.ctx.input_system,
-                    resource_manager=self.ctx.resource_manager
-                )
+            prefab = entity_factory.destructible_prefab(
+                component_manager=component_manager,
+                entity_manager=entity_manager,
+                event_manager=self.ctx.event_manager,
+                animation_handler=self.ctx.animation_handler,
+                input_system=self.ctx.input_system,
+                resource_manager=self.ctx.resource_manager
+            )
+            prefab.instantiate_many([tile_pos for tile_pos, _, _, _, _ in destructibles_data])
 
         # foliage loading
         layer_data = layers.get("foliage", [])
@@ -11,6 +11,12 @@ ANIMATION_FOLDER = "data/graphics/animations"
 TILE_SIZE = 32
 CHUNK_SIZE = 16
 
+# Fixed-step simulation. Velocities are in pixels per 1/60 s regardless of SIM_HZ.
+SIM_HZ = 60           # simulation steps per second
+MAX_SIM_STEPS = 5     # steps per rendered frame before the backlog is dropped
+MAX_FRAME_TIME = 0.25 # seconds of real time one frame may feed the simulation
+MAX_FPS = 0           # render frame cap, 0 = uncapped
+
 LEVEL = 5
 
 # Define keybinds for player inputs
@@ -53,6 +59,16 @@ class CollisionLayer(IntFlag):
             mask |= layer
         return mask
 
+# Precomputed class of every indexed collision object. Spatial queries take a
+# mask of these bits and filter inside the index, so consumers never look the
+# object up to find out what it is.
+class CollisionClass(IntFlag):
+    WALL = 1    # static wall tile
+    WATER = 2   # static water tile
+    SOLID = 4   # solid dynamic collider
+    BODY = 8    # non-solid dynamic collider (moving bodies)
+    ANY = WALL | WATER | SOLID | BODY
+
 class GameSceneEvents(Enum):
     DAMAGE = "damage"
     DEATH = "death"
@@ -206,6 +222,29 @@ def collision_occured(hitbox, hitbox_rect, hurtbox, hurtbox_rect):
     else:
         return circle_circle_collision(hitbox, hitbox_rect, hurtbox, hurtbox_rect)
 
+# Swept AABB: time of impact of box (x, y, w, h) moving by (dx, dy) against a static rect.
+# Returns (t, nx, ny) with t in [0, 1] and the contact normal, or None. Boxes already
+# overlapping at the start hit at t = 0, facing the dominant direction of motion.
+def swept_aabb(x, y, w, h, dx, dy, rect):
+    inf = float('inf')
+    if dx > 0: x_entry, x_exit = (rect.left - x - w) / dx, (rect.right - x) / dx
+    elif dx < 0: x_entry, x_exit = (rect.right - x) / dx, (rect.left - x - w) / dx
+    elif x + w <= rect.left or x >= rect.right: return None
+    else: x_entry, x_exit = -inf, inf
+    if dy > 0: y_entry, y_exit = (rect.top - y - h) / dy, (rect.bottom - y) / dy
+    elif dy < 0: y_entry, y_exit = (rect.bottom - y) / dy, (rect.top - y - h) / dy
+    elif y + h <= rect.top or y >= rect.bottom: return None
+    else: y_entry, y_exit = -inf, inf
+
+    entry = max(x_entry, y_entry)
+    if entry >= min(x_exit, y_exit) or entry > 1 or min(x_exit, y_exit) <= 0:
+        return None
+    if entry < 0:
+        if abs(dx) >= abs(dy): return 0.0, (-1 if dx > 0 else 1), 0
+        return 0.0, 0, (-1 if dy > 0 else 1)
+    if x_entry > y_entry: return entry, (-1 if dx > 0 else 1), 0
+    return entry, 0, (-1 if dy > 0 else 1)
+
 # loads an image from a file and applies a colorkey for transparency
 def load_image(path, colorkey=DEFAULT_COLORKEY, scale=1):
     """
@@ -9,9 +9,13 @@ Design:
 - The EventManager maps typed events to their GameSceneEvents enum value
   so existing subscribers still work
 - New code should emit_typed() and can subscribe via subscribe_typed()
+- Hot events (damage, collision, walk, projectile collision, water splash)
+  are slotted PooledEvents: emitters take an instance from the
+  EventManager's pool, fill it and hand it back after dispatch
 """
 
-from dataclasses import dataclass, field
+from collections import defaultdict
+from dataclasses import dataclass, field, fields, MISSING
 from typing import Any, Optional
 import pygame
 
@@ -20,6 +24,7 @@ from scripts.utils import GameSceneEvents
 
 class GameEvent:
     """Base class for all typed game events."""
+    __slots__ = ()
     _event_type: Any = None
 
     @classmethod
@@ -27,13 +32,93 @@ class GameEvent:
         return cls._event_type
 
 
+class PooledEvent(GameEvent):
+    """Typed event that is reused through an ``EventPool`` instead of being
+    allocated per emit.
+
+    Vector fields are owned by the instance and updated in place, so a
+    typed handler must copy anything it wants to keep after it returns.
+    ``to_kwargs`` / ``assign`` convert to and from the legacy kwargs form
+    for the EventManager's compatibility bridge.
+    """
+    __slots__ = ()
+    LEGACY_FIELDS: tuple = ()   # kwargs names seen by legacy subscribers
+    VECTOR_FIELDS: tuple = ()   # fields holding an owned pygame.Vector2
+    _defaults = None
+
+    @classmethod
+    def blank(cls):
+        event = cls()
+        for name in cls.VECTOR_FIELDS:
+            setattr(event, name, pygame.Vector2())
+        return event
+
+    @classmethod
+    def _field_defaults(cls):
+        if cls._defaults is None:
+            defaults = {}
+            for f in fields(cls):
+                if f.default is not MISSING:
+                    defaults[f.name] = f.default
+                elif f.default_factory is not MISSING:
+                    defaults[f.name] = f.default_factory()
+                else:
+                    defaults[f.name] = None
+            cls._defaults = defaults
+        return cls._defaults
+
+    def to_kwargs(self) -> dict:
+        # Legacy subscribers may keep what they receive, so vectors are copied
+        kwargs = {name: getattr(self, name) for name in self.LEGACY_FIELDS}
+        for name in self.VECTOR_FIELDS:
+            kwargs[name] = kwargs[name].copy()
+        return kwargs
+
+    def assign(self, kwargs):
+        """Fill from legacy kwargs. Vectors are copied into the owned ones."""
+        defaults = self._field_defaults()
+        for name in self.LEGACY_FIELDS:
+            value = kwargs.get(name, defaults.get(name))
+            if name in self.VECTOR_FIELDS:
+                vec = getattr(self, name)
+                if value is None: vec.update(0, 0)
+                else: vec.update(value)
+            else:
+                setattr(self, name, value)
+        return self
+
+
+class EventPool:
+    """Free lists of ``PooledEvent`` instances, one per event class."""
+
+    def __init__(self):
+        self._free = defaultdict(list)
+        self.created = 0
+
+    def acquire(self, event_class):
+        free = self._free[event_class]
+        if free:
+            return free.pop()
+        self.created += 1
+        return event_class.blank()
+
+    def release(self, event):
+        self._free[type(event)].append(event)
+
+    def stats(self) -> dict:
+        return {
+            'created': self.created,
+            'free': sum(len(free) for free in self._free.values()),
+        }
+
+
 # ---------------------------------------------------------------------------
 # Typed event definitions
 # ---------------------------------------------------------------------------
 
-@dataclass
-class DamageEvent(GameEvent):
-    entity_id: int
+@dataclass(slots=True)
+class DamageEvent(PooledEvent):
+    entity_id: int = -1
     proj_id: int = -1
     damage: float = 0.0
     effects: list = field(default_factory=list)
@@ -41,6 +126,19 @@ class DamageEvent(GameEvent):
     proj_pos: Optional[pygame.Vector2] = None
     death: bool = False
 
+    LEGACY_FIELDS = ('entity_id', 'proj_id', 'damage', 'effects', 'proj_vel', 'proj_pos', 'death')
+    VECTOR_FIELDS = ('proj_vel', 'proj_pos')
+
+    def fill(self, entity_id, proj_id, damage, effects, vx, vy, x, y):
+        self.entity_id = entity_id
+        self.proj_id = proj_id
+        self.damage = damage
+        self.effects = effects
+        self.proj_vel.update(vx, vy)
+        self.proj_pos.update(x, y)
+        self.death = False
+        return self
+
 
 @dataclass
 class DeathEvent(GameEvent):
@@ -55,27 +153,55 @@ class ShootEvent(GameEvent):
     entity_id: int
 
 
-@dataclass
-class ProjectileCollisionEvent(GameEvent):
-    pos: Any
-    vel: Any
+@dataclass(slots=True)
+class ProjectileCollisionEvent(PooledEvent):
+    pos: Any = None
+    vel: Any = None
     target_type: str = "environment"
     size: float = 10.0
 
+    LEGACY_FIELDS = ('pos', 'vel', 'target_type', 'size')
+    VECTOR_FIELDS = ('pos', 'vel')
 
-@dataclass
-class WalkEvent(GameEvent):
-    pos: Any
-    vel: Any
-    entity_id: int
+    def fill(self, x, y, vx, vy, target_type, size):
+        self.pos.update(x, y)
+        self.vel.update(vx, vy)
+        self.target_type = target_type
+        self.size = size
+        return self
 
 
-@dataclass
-class WaterSplashEvent(GameEvent):
-    pos: Any
-    vel: Any
+@dataclass(slots=True)
+class WalkEvent(PooledEvent):
+    pos: Any = None
+    vel: Any = None
+    entity_id: int = -1
+
+    LEGACY_FIELDS = ('pos', 'vel', 'entity_id')
+    VECTOR_FIELDS = ('pos', 'vel')
+
+    def fill(self, entity_id, x, y, vx, vy):
+        self.entity_id = entity_id
+        self.pos.update(x, y)
+        self.vel.update(vx, vy)
+        return self
+
+
+@dataclass(slots=True)
+class WaterSplashEvent(PooledEvent):
+    pos: Any = None
+    vel: Any = None
     size: float = 10.0
 
+    LEGACY_FIELDS = ('pos', 'vel', 'size')
+    VECTOR_FIELDS = ('pos', 'vel')
+
+    def fill(self, x, y, vx, vy, size):
+        self.pos.update(x, y)
+        self.vel.update(vx, vy)
+        self.size = size
+        return self
+
 
 @dataclass
 class ScreenShakeEvent(GameEvent):
@@ -95,10 +221,34 @@ class AnimationFinishedEvent(GameEvent):
     animation_id: str
 
 
-@dataclass
-class CollisionEvent(GameEvent):
-    entity_id: int
-    collisions: dict
+@dataclass(slots=True)
+class CollisionEvent(PooledEvent):
+    """Sides of the collider that hit something solid this step."""
+    entity_id: int = -1
+    top: bool = False
+    right: bool = False
+    bottom: bool = False
+    left: bool = False
+
+    LEGACY_FIELDS = ('entity_id', 'collisions')
+
+    def fill(self, entity_id):
+        self.entity_id = entity_id
+        self.top = self.right = self.bottom = self.left = False
+        return self
+
+    @property
+    def collisions(self) -> dict:
+        return {"top": self.top, "right": self.right, "bottom": self.bottom, "left": self.left}
+
+    def assign(self, kwargs):
+        collisions = kwargs.get('collisions') or {}
+        self.fill(kwargs.get('entity_id', -1))
+        self.top = collisions.get("top", False)
+        self.right = collisions.get("right", False)
+        self.bottom = collisions.get("bottom", False)
+        self.left = collisions.get("left", False)
+        return self
 
 
 @dataclass
@@ -0,0 +1,190 @@
+"""
+Uniform Spatial Hash
+
+Persistent broadphase for colliders that move every frame. Space is split
+into square cells ``cell_size`` pixels wide (a multiple of ``TILE_SIZE``)
+and each entry is stored in every cell its rect overlaps.
+
+Unlike the ``Quadtree`` it is not rebuilt per frame: ``update`` moves an
+entry in place and only touches the cell table when the rect crosses into
+other cells. Queries never return the same entry twice.
+
+Each entry carries an integer ``flags`` (its ``CollisionClass`` bits, or
+any other bitmask such as a hurtbox layer). Entries are kept in one cell
+table per ``flags`` value, so a query given a ``mask`` only walks the
+tables sharing a bit with it and never sees the other entries.
+
+Usage:
+    grid = SpatialHash()
+    grid.update(entity_id, x, y, w, h, flags)   # insert or move
+    grid.retrieve(candidates, rect)             # Quadtree-compatible broadphase
+    grid.query(rect, hits, SOLID)               # only SOLID entries overlapping rect
+    grid.remove(entity_id)
+"""
+
+import pygame
+
+from . import TILE_SIZE
+
+
+class _Entry:
+    __slots__ = ('key', 'rect', 'item', 'flags', 'x0', 'y0', 'x1', 'y1', 'stamp')
+
+    def __init__(self, key):
+        self.key = key
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.item = (key, self.rect)  # what retrieve() hands out, built once
+        self.flags = 0
+        self.x0 = self.y0 = 0
+        self.x1 = self.y1 = -1        # empty cell range until placed
+        self.stamp = 0
+
+
+class SpatialHash:
+    """Uniform grid broadphase with incremental updates.
+
+    ``retrieve(out, rect)`` appends ``(key, rect)`` for every entry in the
+    cells ``rect`` touches, like ``Quadtree.retrieve``, so it can be passed
+    wherever a dynamic quadtree was. The stored rects are owned by the hash
+    and change on ``update``.
+    """
+
+    def __init__(self, cell_size=TILE_SIZE * 2):
+        self.cell_size = cell_size
+        self.layers = {}   # {flags: {(cx, cy): {key: _Entry}}}
+        self.entries = {}  # {key: _Entry}
+        self._stamp = 0    # query counter, marks entries already returned
+        self._tables = {}  # {mask: [cell tables matching mask]}, dropped when a table is added
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def update(self, key, x, y, w, h, flags=0):
+        """Insert ``key`` or move it to the rect ``(x, y, w, h)`` with class bits ``flags``."""
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = _Entry(key)
+        entry.rect.update(x, y, w, h)
+
+        cs = self.cell_size
+        x0 = int(x // cs)
+        y0 = int(y // cs)
+        x1 = int((x + w) // cs)
+        y1 = int((y + h) // cs)
+        if (x0 == entry.x0 and y0 == entry.y0 and x1 == entry.x1 and y1 == entry.y1
+                and flags == entry.flags):
+            return  # still in the same cells of the same table
+
+        self._unlink(entry)
+        cells = self.layers.get(flags)
+        if cells is None:
+            cells = self.layers[flags] = {}
+            self._tables.clear()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cell = cells[(cx, cy)] = {}
+                cell[key] = entry
+        entry.flags = flags
+        entry.x0, entry.y0, entry.x1, entry.y1 = x0, y0, x1, y1
+
+    def remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self._unlink(entry)
+
+    def retain(self, keys):
+        """Remove every entry whose key is not in ``keys``."""
+        for key in [key for key in self.entries if key not in keys]:
+            self.remove(key)
+
+    def clear(self):
+        self.layers.clear()
+        self.entries.clear()
+        self._tables.clear()
+
+    def _unlink(self, entry):
+        cells = self.layers.get(entry.flags)
+        if cells is None:
+            return
+        key = entry.key
+        for cx in range(entry.x0, entry.x1 + 1):
+            for cy in range(entry.y0, entry.y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    continue
+                cell.pop(key, None)
+                if not cell:
+                    del cells[(cx, cy)]
+
+    def _tables_for(self, mask):
+        tables = self._tables.get(mask)
+        if tables is None:
+            tables = self._tables[mask] = [cells for flags, cells in self.layers.items()
+                                           if not mask or flags & mask]
+        return tables
+
+    def retrieve(self, out: list, rect, mask=0) -> list:
+        """Append ``(key, rect)`` candidates from the cells ``rect`` touches.
+
+        With a ``mask`` only entries whose ``flags`` share a bit with it are returned.
+        """
+        cs = self.cell_size
+        x0 = int(rect.x // cs)
+        y0 = int(rect.y // cs)
+        x1 = int((rect.x + rect.w) // cs)
+        y1 = int((rect.y + rect.h) // cs)
+
+        if x0 == x1 and y0 == y1:
+            # One cell cannot hold an entry twice, and an entry lives in one table
+            for cells in self._tables_for(mask):
+                cell = cells.get((x0, y0))
+                if cell:
+                    for entry in cell.values():
+                        out.append(entry.item)
+            return out
+
+        self._stamp += 1
+        stamp = self._stamp
+        for cells in self._tables_for(mask):
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    cell = cells.get((cx, cy))
+                    if not cell:
+                        continue
+                    for entry in cell.values():
+                        if entry.stamp != stamp:
+                            entry.stamp = stamp
+                            out.append(entry.item)
+        return out
+
+    def query(self, rect, out: list = None, mask=0) -> list:
+        """Return the ``(key, rect)`` entries overlapping ``rect`` (and ``mask``, if given)."""
+        if out is None:
+            out = []
+        start = len(out)
+        self.retrieve(out, rect, mask)
+        write = start
+        for i in range(start, len(out)):
+            item = out[i]
+            if rect.colliderect(item[1]):
+                out[write] = item
+                write += 1
+        del out[write:]
+        return out
+
+    def items(self, mask=0) -> list:
+        """``(key, rect)`` of every entry (with a ``mask``, only those sharing a bit with it)."""
+        return [entry.item for entry in self.entries.values() if not mask or entry.flags & mask]
+
+    def stats(self) -> dict:
+        return {
+            'cell_size': self.cell_size,
+            'entries': len(self.entries),
+            'cells': sum(len(cells) for cells in self.layers.values()),
+            'layers': len(self.layers),
+        }
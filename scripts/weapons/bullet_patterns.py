@@ -7,6 +7,7 @@ from ..components.combat import HitBoxComponent
 from ..components.timer import TimerComponent
 from ..components.particle import ParticleConfig, ParticleEmitter
 from ..components.render_effect import YSortRender, ShadowComponent, PulseComponent
+from ..systems.combat.fast_projectile_system import ProjectileTemplate
 
 def spawn_bomb(eid, cm, em, anim_handler, event_manager, data):
     bomb_id = em.create_entity()
@@ -96,13 +97,27 @@ def spawn_bomb(eid, cm, em, anim_handler, event_manager, data):
 
     return bomb_id
 
-def spawn_projectile(eid, cm, em, rm, direction, data, projectile_system=None, position_offset=pygame.Vector2(0,0), modifiers=None):
-    if not projectile_system:
-        return None
+# Unit vector tables of ring and spread patterns, {(kind, number, angle): [(dx, dy)]}
+_direction_tables = {}
 
-    pos = data.get("start_pos", pygame.Vector2(0, 0))
-    spawn_pos = pos + position_offset
+def _direction_table(key, angles):
+    table = _direction_tables.get(key)
+    if table is None:
+        table = _direction_tables[key] = [tuple(rotate_vector((1, 0), angle)) for angle in angles]
+    return table
+
+def ring_directions(number, offset=0):
+    """``number`` unit vectors evenly spaced around the circle, the first ``offset`` degrees from +x."""
+    step = 360 / number
+    return _direction_table(("ring", number, offset), (step * i + offset for i in range(number)))
+
+def spread_directions(number, max_angle):
+    """``number`` unit vectors evenly spaced from ``-max_angle`` to ``max_angle`` degrees around +x."""
+    step = (max_angle * 2) / (number - 1) if number > 1 else 0
+    return _direction_table(("spread", number, max_angle), (-max_angle + step * i for i in range(number)))
 
+def compile_projectile_template(rm, data):
+    """Resolve the image, layer, mask, pulse settings and modifiers of ``data`` into a ProjectileTemplate."""
     raw_layer = data.get("layer", CollisionLayer.PROJECTILE)
     layer = raw_layer if isinstance(raw_layer, CollisionLayer) else CollisionLayer(raw_layer)
 
@@ -112,26 +127,13 @@ def spawn_projectile(eid, cm, em, rm, direction, data, projectile_system=None, p
     projectile_scale = 15
     size_px = data["size"] * projectile_scale * SCALE
 
-    speed = data["speed"]
-    vx = direction.x * speed
-    vy = direction.y * speed
-    
     image = rm.get_image(data["image_file"], scale=data["size"], color_swap=data.get("projectile_color"))
-    
+
     # Optional effects
     pulse_color = data.get("projectile_color") or [0, 153, 219]
-    pulse_radius = size_px * 0.7
-    pulse_speed = data.get("pulse_speed", 10.0)
-
-    # Spawn fast projectile
-    modifiers = data.get("modifiers")
-    proj = projectile_system.spawn(
-        source_entity=eid,
-        x=spawn_pos.x,
-        y=spawn_pos.y,
-        vx=vx,
-        vy=vy,
-        speed=speed,
+
+    return ProjectileTemplate(
+        speed=data["speed"],
         damage=data["damage"],
         effects=data.get("effects", []),
         bounce=data.get("bounce", 0),
@@ -141,45 +143,63 @@ def spawn_projectile(eid, cm, em, rm, direction, data, projectile_system=None, p
         layer=layer,
         mask=mask,
         image=image,
-        pulse_radius=pulse_radius,
-        pulse_speed=pulse_speed,
+        pulse_radius=size_px * 0.7,
+        pulse_speed=data.get("pulse_speed", 10.0),
         pulse_color=pulse_color,
         particle_rate=30,
         hits_dashing_player=data.get("hits_dashing_player", False),
-        modifiers=modifiers
+        modifiers=data.get("modifiers")
     )
 
-    return proj
+def _spawn_many(eid, rm, data, projectile_system, xs, ys, vxs, vys, speeds=None):
+    if not projectile_system:
+        return [None] * len(xs)
+    # Attack patterns compile their template once; other shooters once per shot
+    template = data.get("template") or compile_projectile_template(rm, data)
+    projs = projectile_system.spawn_many(template, xs, ys, vxs, vys, source_entity=eid, speeds=speeds)
+    projs.extend([None] * (len(xs) - len(projs)))
+    return projs
+
+def _shoot_directions(eid, rm, data, projectile_system, directions, base=None):
+    # One projectile from start_pos per unit vector, rotated by the unit vector base
+    speed = data["speed"]
+    if base is not None:
+        bx, by = base
+        directions = [(dx * bx - dy * by, dx * by + dy * bx) for dx, dy in directions]
+    x, y = data["start_pos"]
+    n = len(directions)
+    return _spawn_many(eid, rm, data, projectile_system, [x] * n, [y] * n,
+                       [dx * speed for dx, _ in directions], [dy * speed for _, dy in directions])
+
+def _shoot_from(eid, rm, data, projectile_system, positions, direction):
+    # One projectile per start position, all along direction
+    speed = data["speed"]
+    n = len(positions)
+    return _spawn_many(eid, rm, data, projectile_system, [pos.x for pos in positions], [pos.y for pos in positions],
+                       [direction.x * speed] * n, [direction.y * speed] * n)
+
+def spawn_projectile(eid, cm, em, rm, direction, data, projectile_system=None, position_offset=pygame.Vector2(0,0), modifiers=None):
+    if not projectile_system:
+        return None
+
+    spawn_pos = data.get("start_pos", pygame.Vector2(0, 0)) + position_offset
+    return _shoot_from(eid, rm, data, projectile_system, [spawn_pos], direction)[0]
 
 def shoot_single(eid, cm, em, rm, data, projectile_system=None):
     dir = get_unit_direction_towards(data["start_pos"], data["target_pos"])
-    return [spawn_projectile(eid, cm, em, rm, dir, data, projectile_system)]
+    return _shoot_from(eid, rm, data, projectile_system, [data["start_pos"]], dir)
 
 def shoot_spread(eid, cm, em, rm, data, projectile_system=None):
     dir = get_unit_direction_towards(data["start_pos"], data["target_pos"])
     max_angle = data.get("angle", 15)
-    dirs = [rotate_vector(dir, angle) for angle in [-max_angle, 0, max_angle]]
-    
-    projs = []
-    for d in dirs:
-        projs.append(spawn_projectile(eid, cm, em, rm, d, data, projectile_system))
-    
-    return projs
+    return _shoot_directions(eid, rm, data, projectile_system, spread_directions(3, max_angle), dir)
 
 def shoot_radial(eid, cm, em, rm, data, projectile_system=None):
-    dir = pygame.Vector2(1, 0)
+    dir = None
     if data.get("on_player", False): dir = get_unit_direction_towards(data["start_pos"], data["target_pos"])
     
     number = data.get("number", 10)
-
-    projs = []
-    for i in range(number):
-        angle = (360 / number) * i
-        d = rotate_vector(dir, angle)
-
-        projs.append(spawn_projectile(eid, cm, em, rm, d, data, projectile_system))
-    
-    return projs
+    return _shoot_directions(eid, rm, data, projectile_system, ring_directions(number), dir)
 
 class SpiralShooter:
     def __init__(self, bullets_per_shot=10, angle_increment=1):
@@ -192,12 +212,7 @@ class SpiralShooter:
         dir = rotate_vector(dir, self.current_angle)
         if data.get("on_player", False): dir = get_unit_direction_towards(data["start_pos"], data["target_pos"])
         
-        projs = []
-        for i in range(self.bullets_per_shot):
-            angle = (360 / self.bullets_per_shot) * i
-            d = rotate_vector(dir, angle)
-
-            projs.append(spawn_projectile(eid, cm, em, rm, d, data, projectile_system))
+        projs = _shoot_directions(eid, rm, data, projectile_system, ring_directions(self.bullets_per_shot), dir)
         
         self.current_angle += self.angle_increment
         
@@ -207,61 +222,33 @@ def shoot_aimed_fan(eid, cm, em, rm, data, projectile_system=None):
     dir = get_unit_direction_towards(data["start_pos"], data["target_pos"])
     number = data.get("number", 7)
     max_angle = data.get("angle", 30)
-    step = (max_angle * 2) / (number - 1) if number > 1 else 0
-
-    projs = []
-    for i in range(number):
-        angle = -max_angle + step * i
-        d = rotate_vector(dir, angle)
-        projs.append(spawn_projectile(eid, cm, em, rm, d, data, projectile_system))
-
-    return projs
+    return _shoot_directions(eid, rm, data, projectile_system, spread_directions(number, max_angle), dir)
 
 def shoot_cross(eid, cm, em, rm, data, projectile_system=None):
     import random
     if random.random() < 0.5:
-        angles = [0, 90, 180, 270]
+        directions = ring_directions(4)  # 0, 90, 180, 270
     else:
-        angles = [45, 135, 225, 315]
-
-    projs = []
-    for a in angles:
-        d = rotate_vector(pygame.Vector2(1, 0), a)
-        projs.append(spawn_projectile(eid, cm, em, rm, d, data, projectile_system))
+        directions = ring_directions(4, 45)  # 45, 135, 225, 315
 
-    return projs
+    return _shoot_directions(eid, rm, data, projectile_system, directions)
 
 def shoot_double_ring(eid, cm, em, rm, data, projectile_system=None):
     number = data.get("number", 8)
-    dir = get_unit_direction_towards(data["start_pos"], data["target_pos"]) if data.get("on_player", False) else pygame.Vector2(1, 0)
+    dir = get_unit_direction_towards(data["start_pos"], data["target_pos"]) if data.get("on_player", False) else None
     offset = data.get("ring_offset", 11.25)
 
-    projs = []
-    for i in range(number):
-        angle = (360 / number) * i
-        d = rotate_vector(dir, angle)
-        projs.append(spawn_projectile(eid, cm, em, rm, d, data, projectile_system))
-
-    for i in range(number):
-        angle = (360 / number) * i + offset
-        d = rotate_vector(dir, angle)
-        projs.append(spawn_projectile(eid, cm, em, rm, d, data, projectile_system))
-
-    return projs
+    directions = ring_directions(number) + ring_directions(number, offset)
+    return _shoot_directions(eid, rm, data, projectile_system, directions, dir)
 
 def shoot_aimed_burst(eid, cm, em, rm, data, projectile_system=None):
     dir = get_unit_direction_towards(data["start_pos"], data["target_pos"])
     number = data.get("number", 5)
     spread = data.get("spread", 5)
 
-    projs = []
-    for i in range(number):
-        import random
-        angle = random.uniform(-spread, spread)
-        d = rotate_vector(dir, angle)
-        projs.append(spawn_projectile(eid, cm, em, rm, d, data, projectile_system))
-
-    return projs
+    import random
+    directions = [tuple(rotate_vector(dir, random.uniform(-spread, spread))) for _ in range(number)]
+    return _shoot_directions(eid, rm, data, projectile_system, directions)
 
 def shoot_wall(eid, cm, em, rm, data, projectile_system=None):
     dir = get_unit_direction_towards(data["start_pos"], data["target_pos"])
@@ -269,14 +256,9 @@ def shoot_wall(eid, cm, em, rm, data, projectile_system=None):
     number = data.get("number", 7)
     spacing = data.get("spacing", 12)
 
-    projs = []
     offset_start = -(number - 1) * spacing / 2.0
-    for i in range(number):
-        start_pos = data["start_pos"] + perp * (offset_start + i * spacing)
-        pd = {**data, "start_pos": start_pos}
-        projs.append(spawn_projectile(eid, cm, em, rm, dir, pd, projectile_system))
-
-    return projs
+    positions = [data["start_pos"] + perp * (offset_start + i * spacing) for i in range(number)]
+    return _shoot_from(eid, rm, data, projectile_system, positions, dir)
 
 def shoot_spinning_ring(eid, cm, em, rm, data, projectile_system=None):
     dir_to_player = get_unit_direction_towards(data["start_pos"], data["target_pos"])
@@ -285,19 +267,20 @@ def shoot_spinning_ring(eid, cm, em, rm, data, projectile_system=None):
     spin_speed = data.get("spin_speed", 2.0)
     ring_radius = data.get("ring_radius", 40)
 
-    projs = []
-    for i in range(number):
-        angle = (360 / number) * i
-        ring_offset = rotate_vector(pygame.Vector2(ring_radius, 0), angle)
-        spawn_pos = data["start_pos"] + ring_offset
-        tangent = rotate_vector(pygame.Vector2(spin_speed, 0), angle + 90)
-        drift = dir_to_player * speed * 0.3
-        combined = tangent + drift
+    x, y = data["start_pos"]
+    drift = dir_to_player * speed * 0.3
+    xs, ys, vxs, vys, speeds = [], [], [], [], []
+    for (ox, oy), (tx, ty) in zip(ring_directions(number), ring_directions(number, 90)):
+        xs.append(x + ox * ring_radius)
+        ys.append(y + oy * ring_radius)
+        combined = pygame.Vector2(tx * spin_speed, ty * spin_speed) + drift
         d = combined.normalize() if combined.length_squared() > 0 else pygame.Vector2(1, 0)
-        pd = {**data, "start_pos": spawn_pos, "speed": combined.length()}
-        projs.append(spawn_projectile(eid, cm, em, rm, d, pd, projectile_system))
+        bullet_speed = combined.length()
+        vxs.append(d.x * bullet_speed)
+        vys.append(d.y * bullet_speed)
+        speeds.append(bullet_speed)
 
-    return projs
+    return _spawn_many(eid, rm, data, projectile_system, xs, ys, vxs, vys, speeds)
 
 def shoot_knight_l(eid, cm, em, rm, data, projectile_system=None):
     dir_to_player = get_unit_direction_towards(data["start_pos"], data["target_pos"])
@@ -312,12 +295,7 @@ def shoot_knight_l(eid, cm, em, rm, data, projectile_system=None):
         dir_to_player * spacing + perp * flip * spacing,
     ]
 
-    projs = []
-    for off in offsets:
-        pd = {**data, "start_pos": data["start_pos"] + off}
-        projs.append(spawn_projectile(eid, cm, em, rm, dir_to_player, pd, projectile_system))
-
-    return projs
+    return _shoot_from(eid, rm, data, projectile_system, [data["start_pos"] + off for off in offsets], dir_to_player)
 
 SHOOT_FUNCTIONS = {
     "shoot_single": shoot_single,
@@ -0,0 +1,53 @@
+from scripts.components.combat import HealthComponent, merge_damage
+from scripts.ecs.component_manager import ComponentManager
+from scripts.systems.core.event_manager import EventManager
+from scripts.utils.events import DamageEvent
+
+
+def make_target(health=100):
+    em, cm = EventManager(), ComponentManager()
+    em.set_coalesce(DamageEvent, key='entity_id', merge=lambda queued, new: merge_damage(cm, queued, new))
+    target = HealthComponent(1, health, em, cm)
+    cm.add(1, target)
+    return em, cm, target
+
+
+def hit(em, entity_id, damage, proj_id=0):
+    return em.acquire(DamageEvent).fill(entity_id, proj_id, damage, [], 1.0, 0.0, 0.0, 0.0)
+
+
+def test_queued_hits_respect_iframes():
+    em, _, target = make_target()
+    for i in range(5):
+        em.queue_typed(hit(em, 1, 10, proj_id=i))
+    assert em.dispatch_queued() == 1
+    assert target.health == 90
+
+
+def test_queued_hits_match_synchronous_emits():
+    em, _, target = make_target()
+    for i in range(5):
+        em.emit_pooled(hit(em, 1, 10, proj_id=i))
+    assert target.health == 90
+
+
+def test_hits_without_health_are_summed():
+    em, _, _ = make_target()
+    seen = []
+    em.subscribe_typed(DamageEvent, lambda event: seen.append((event.entity_id, event.damage)))
+    for _ in range(3):
+        em.queue_typed(hit(em, 2, 10))
+    em.dispatch_queued()
+    assert seen == [(2, 30)]
+
+
+def test_death_flag_is_not_cleared_by_a_later_hit():
+    em, _, _ = make_target()
+    seen = []
+    em.subscribe_typed(DamageEvent, lambda event: seen.append(event.death))
+    first = hit(em, 1, 10)
+    first.death = True
+    em.queue_typed(first)
+    em.queue_typed(hit(em, 1, 10))
+    em.dispatch_queued()
+    assert seen == [True]